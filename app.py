@@ -1,3 +1,9 @@
+import time
+
+# Titik awal pengukuran cold start (sebelum import berat)
+_STARTED_AT = time.perf_counter()
+
+import argparse
 import dash
 from dash import Dash
 import warnings
@@ -6,15 +12,39 @@ import warnings
 warnings.filterwarnings("ignore", category=FutureWarning, module="_plotly_utils")
 
 # Import konfigurasi
-from config import APP_TITLE, DATA_PATH
+from config import (
+    APP_TITLE,
+    COMPRESSION_LEVEL,
+    COMPRESSION_MIN_BYTES,
+    DATA_PATH,
+    HTTP_COMPRESSION,
+    METRICS_ENABLED,
+    METRICS_PATH,
+    REFRESH_INTERVAL,
+)
 
 # Import komponen
 from components.data_processor import load_data, get_filter_options
 from components.layout import create_layout
 from components.callbacks import register_callbacks
+from components.geo import register_topojson_cache
+from components.metrics import register_metrics
+from components.responses import register_http_caching
+from components.tailwind import (
+    TAILWIND_CDN,
+    compiled_stylesheet,
+    register_stylesheet_cache,
+)
+from components.refresh import LiveDataset
+from components.registry import attach, lookup
+from components.startup import StartupTimer
 
-# Inisialisasi app tanpa Bootstrap
-external_scripts = [{"src": "https://cdn.tailwindcss.com"}]
+startup_timer = StartupTimer(start=_STARTED_AT)
+startup_timer.mark("imports")
+
+# Inisialisasi app tanpa Bootstrap; Tailwind dari stylesheet hasil build
+# (python -m components.tailwind), compiler CDN hanya jika belum dibuild
+external_scripts = [] if compiled_stylesheet() else [{"src": TAILWIND_CDN}]
 
 app = Dash(
     __name__,
@@ -25,21 +55,65 @@ app = Dash(
 # Konfigurasi aplikasi
 app.title = APP_TITLE
 server = app.server
+# Didaftarkan pertama agar berjalan terakhir (setelah header cache ditetapkan)
+register_http_caching(
+    server,
+    compression=HTTP_COMPRESSION,
+    level=COMPRESSION_LEVEL,
+    min_bytes=COMPRESSION_MIN_BYTES,
+)
+register_topojson_cache(server)
+register_stylesheet_cache(server)
+if METRICS_ENABLED:
+    register_metrics(server, METRICS_PATH)
+startup_timer.mark("create_app")
 
 # Load data
-df = load_data()
+with startup_timer.phase("load_data"):
+    df = load_data()
+
+# Data aktif; baris baru di file CSV digabung tanpa restart
+dataset = LiveDataset(df, DATA_PATH, interval=REFRESH_INTERVAL)
+
+
+def serve_layout():
+    """Layout untuk frame aktif (dibangun sekali per versi data)"""
+    current = dataset.df
+    layout = lookup(current, "layout")
+    if layout is None:
+        layout = attach(
+            current, "layout", create_layout(current, *dataset.filter_options())
+        )
+    return layout
+
 
 # Dapatkan opsi filter
-available_years, available_industries, available_countries = get_filter_options(df)
+with startup_timer.phase("get_filter_options"):
+    dataset.filter_options()
 
 # Setup layout
-app.layout = create_layout(
-    df, available_years, available_industries, available_countries
-)
+with startup_timer.phase("create_layout"):
+    serve_layout()
+    app.layout = serve_layout
 
 # Daftarkan callbacks
-register_callbacks(app, df)
+with startup_timer.phase("register_callbacks"):
+    register_callbacks(app, dataset)
+
+# Polling refresh hanya di proses yang melayani request (bukan master gunicorn)
+server.before_request(dataset.ensure_polling)
 
 # Run server
 if __name__ == "__main__":
-    app.run_server(debug=True)
+    parser = argparse.ArgumentParser(description=APP_TITLE)
+    parser.add_argument(
+        "--startup-report",
+        action="store_true",
+        help="Cetak waktu cold start per fase lalu keluar tanpa menjalankan server",
+    )
+    args = parser.parse_args()
+
+    if args.startup_report:
+        print(startup_timer.report())
+    else:
+        app.run_server(debug=True)
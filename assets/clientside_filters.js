@@ -0,0 +1,188 @@
+/*
+ * Filtering di browser untuk mode CLIENTSIDE_FILTERING.
+ *
+ * Cube agregat (bulan x industri x negara) dikirim sekali lewat dcc.Store
+ * "cube-store". Setiap klik "Apply Filters" memotong dan me-rollup cube di
+ * browser lalu mengganti array data figure tren dan peta tanpa round trip ke
+ * server. Logika filter mengikuti AggregateCube di components/cube.py.
+ */
+(function () {
+    var NON_US = "Non-US";
+    var US_COUNTRY = "United States";
+
+    function codeLookup(names) {
+        var lookup = {};
+        for (var i = 0; i < names.length; i++) {
+            lookup[names[i]] = i;
+        }
+        return lookup;
+    }
+
+    function selectCells(cube, filter) {
+        var n = cube.cell_period.length;
+        var mask = new Uint8Array(n).fill(1);
+        var i;
+
+        var years = filter && filter.years;
+        if (years && years.length) {
+            var minYear = Math.min.apply(null, years);
+            var maxYear = Math.max.apply(null, years);
+            for (i = 0; i < n; i++) {
+                var period = cube.cell_period[i];
+                var year = Math.floor(period / 12);
+                if (period < 0 || year < minYear || year > maxYear) {
+                    mask[i] = 0;
+                }
+            }
+        }
+
+        var industries = filter && filter.industries;
+        if (industries && industries.length) {
+            var industryCodes = codeLookup(cube.industries);
+            var allowedIndustries = {};
+            industries.forEach(function (name) {
+                if (name in industryCodes) {
+                    allowedIndustries[industryCodes[name]] = true;
+                }
+            });
+            for (i = 0; i < n; i++) {
+                if (!allowedIndustries[cube.cell_industry[i]]) {
+                    mask[i] = 0;
+                }
+            }
+        }
+
+        var countries = filter && filter.countries;
+        if (countries && countries.length) {
+            var hasNonUS = countries.indexOf(NON_US) >= 0;
+            var hasUS = countries.indexOf(US_COUNTRY) >= 0;
+            if (hasNonUS && !hasUS) {
+                for (i = 0; i < n; i++) {
+                    if (cube.cell_country[i] === cube.us_code) {
+                        mask[i] = 0;
+                    }
+                }
+            } else if (!hasNonUS) {
+                var countryCodes = codeLookup(cube.countries);
+                var allowedCountries = {};
+                countries.forEach(function (name) {
+                    if (name in countryCodes) {
+                        allowedCountries[countryCodes[name]] = true;
+                    }
+                });
+                for (i = 0; i < n; i++) {
+                    if (!allowedCountries[cube.cell_country[i]]) {
+                        mask[i] = 0;
+                    }
+                }
+            }
+        }
+
+        return mask;
+    }
+
+    function periodToDate(period) {
+        var year = Math.floor(period / 12);
+        var month = (period % 12) + 1;
+        return year + "-" + (month < 10 ? "0" : "") + month;
+    }
+
+    function replaceData(figure, traces) {
+        var data = figure.data.map(function (trace, i) {
+            return Object.assign({}, trace, traces[i] || {});
+        });
+        return Object.assign({}, figure, {data: data});
+    }
+
+    window.dash_clientside = Object.assign({}, window.dash_clientside, {
+        layoffs: {
+            storeFilters: function (nClicks, yearRange, industries, countries) {
+                if (!nClicks) {
+                    return window.dash_clientside.no_update;
+                }
+                var years = [];
+                for (var year = yearRange[0]; year <= yearRange[1]; year++) {
+                    years.push(year);
+                }
+                return {years: years, industries: industries, countries: countries};
+            },
+
+            updateTrend: function (filter, cube, figure) {
+                if (!filter || !cube || !figure) {
+                    return window.dash_clientside.no_update;
+                }
+                var mask = selectCells(cube, filter);
+                var totals = {};
+                var companies = {};
+                for (var i = 0; i < mask.length; i++) {
+                    var period = cube.cell_period[i];
+                    if (!mask[i] || period < 0) {
+                        continue;
+                    }
+                    totals[period] = (totals[period] || 0) + cube.total_sum[i];
+                    companies[period] = (companies[period] || 0) + cube.company_rows[i];
+                }
+                var periods = Object.keys(totals).map(Number).sort(function (a, b) {
+                    return a - b;
+                });
+                var x = periods.map(periodToDate);
+                return replaceData(figure, [
+                    {x: x, y: periods.map(function (p) { return totals[p]; })},
+                    {x: x, y: periods.map(function (p) { return companies[p]; })},
+                ]);
+            },
+
+            updateMap: function (filter, cube, figure) {
+                if (!filter || !cube || !figure) {
+                    return window.dash_clientside.no_update;
+                }
+                var mask = selectCells(cube, filter);
+                var groups = {};
+                var i;
+                for (i = 0; i < mask.length; i++) {
+                    var country = cube.cell_country[i];
+                    if (!mask[i] || country < 0) {
+                        continue;
+                    }
+                    var group = groups[country] || (groups[country] = {
+                        total: 0, percentageSum: 0, percentageCount: 0, companies: {}, size: 0,
+                    });
+                    group.total += cube.total_sum[i];
+                    group.percentageSum += cube.percentage_sum[i];
+                    group.percentageCount += cube.percentage_count[i];
+                }
+
+                // Perusahaan unik per negara dari pasangan (sel, perusahaan)
+                for (i = 0; i < cube.pair_cell.length; i++) {
+                    var cell = cube.pair_cell[i];
+                    if (!mask[cell] || cube.cell_country[cell] < 0) {
+                        continue;
+                    }
+                    var target = groups[cube.cell_country[cell]];
+                    if (!target.companies[cube.pair_company[i]]) {
+                        target.companies[cube.pair_company[i]] = true;
+                        target.size += 1;
+                    }
+                }
+
+                var codes = Object.keys(groups).map(Number).sort(function (a, b) {
+                    return a - b;
+                });
+                var names = codes.map(function (code) { return cube.countries[code]; });
+                var locations = codes.map(function (code) { return cube.country_iso3[code]; });
+                var z = codes.map(function (code) {
+                    var g = groups[code];
+                    return g.percentageCount > 0 ? g.percentageSum / g.percentageCount : null;
+                });
+                return replaceData(figure, [{
+                    locations: locations,
+                    hovertext: names,
+                    z: z,
+                    customdata: codes.map(function (code, j) {
+                        return [z[j], groups[code].total, groups[code].size];
+                    }),
+                }]);
+            },
+        },
+    });
+})();
@@ -1,5 +1,27 @@
+const fs = require("fs");
+const path = require("path");
+
+// Nilai Colors di components/colors.py, agar f-string seperti
+// f"bg-[{Colors.BG_CARD}]" terbaca sebagai bg-[#1F1F43] saat pemindaian
+const colors = Object.fromEntries(
+    Array.from(
+        fs
+            .readFileSync(path.join(__dirname, "../components/colors.py"), "utf8")
+            .matchAll(/^\s+([A-Z0-9_]+) = "([^"]+)"/gm),
+        (match) => [match[1], match[2]]
+    )
+);
+
 module.exports = {
-    content: ["./assets/**/*.{html,js}", "./components/**/*.py", "./**/*.py"],
+    content: {
+        files: ["./app.py", "./components/*.py"],
+        transform: {
+            py: (content) =>
+                content.replace(/\{Colors\.([A-Z0-9_]+)\}/g, (match, name) =>
+                    name in colors ? colors[name] : match
+                ),
+        },
+    },
     theme: {
         extend: {
             colors: {
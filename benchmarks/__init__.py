@@ -0,0 +1,3 @@
+"""
+Benchmark pipeline data dan figure dashboard layoffs
+"""
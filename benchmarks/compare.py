@@ -0,0 +1,93 @@
+"""
+Membandingkan dua hasil benchmark JSON (misalnya dua commit)
+
+Contoh:
+    python -m benchmarks.compare base.json head.json --threshold 1.2
+
+Keluar dengan kode 1 jika ada tahap yang median waktunya naik melebihi threshold.
+"""
+
+import argparse
+import json
+import sys
+
+
+def _key(result):
+    return result["scale"], result["stage"], result["filter"]
+
+
+def compare(base, head, threshold=1.2):
+    """
+    Membandingkan median waktu dan puncak memori per (skala, tahap, filter)
+
+    Args:
+        base (dict): Hasil benchmark pembanding
+        head (dict): Hasil benchmark baru
+        threshold (float): Rasio waktu head/base yang dianggap regresi
+
+    Returns:
+        list: Baris (key, base_ms, head_ms, rasio waktu, rasio memori, regresi)
+    """
+    base_results = {_key(result): result for result in base["results"]}
+    rows = []
+    for result in head["results"]:
+        previous = base_results.get(_key(result))
+        if previous is None:
+            continue
+        base_ms = previous["time_ms"]["median"]
+        head_ms = result["time_ms"]["median"]
+        time_ratio = head_ms / base_ms if base_ms else float("inf")
+        memory_ratio = (
+            result["peak_bytes"] / previous["peak_bytes"]
+            if previous["peak_bytes"]
+            else float("inf")
+        )
+        rows.append(
+            (
+                _key(result),
+                base_ms,
+                head_ms,
+                time_ratio,
+                memory_ratio,
+                time_ratio > threshold,
+            )
+        )
+    return rows
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Bandingkan dua hasil benchmark")
+    parser.add_argument("base", help="JSON hasil benchmark pembanding")
+    parser.add_argument("head", help="JSON hasil benchmark baru")
+    parser.add_argument(
+        "--threshold", type=float, default=1.2, help="Batas rasio waktu"
+    )
+    args = parser.parse_args(argv)
+
+    with open(args.base) as handle:
+        base = json.load(handle)
+    with open(args.head) as handle:
+        head = json.load(handle)
+
+    rows = compare(base, head, args.threshold)
+    for (
+        (scale, stage, filter_name),
+        base_ms,
+        head_ms,
+        time_ratio,
+        memory_ratio,
+        regressed,
+    ) in rows:
+        flag = "  REGRESI" if regressed else ""
+        print(
+            f"x{scale:<5} {stage:<22} {filter_name or '-':<15} "
+            f"{base_ms:>10.2f} -> {head_ms:>10.2f} ms  x{time_ratio:.2f}  "
+            f"mem x{memory_ratio:.2f}{flag}"
+        )
+
+    if any(row[-1] for row in rows):
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,46 @@
+"""
+Dataset berskala untuk benchmark
+
+Dataset N kali lipat dibuat oleh generator sintetis (components.synthetic) yang
+mengikuti distribusi data/layoffs.csv. Seed tetap sehingga setiap run benchmark
+memakai data yang sama.
+"""
+
+import os
+
+from components.synthetic import LayoffsProfile, write_csv
+from config import DATA_PATH
+
+BENCHMARK_SEED = 20240501
+
+
+def scaled_csv_path(workdir, scale, seed=BENCHMARK_SEED):
+    """Lokasi file CSV untuk skala tertentu di dalam workdir"""
+    return os.path.join(workdir, f"layoffs-x{scale}-s{seed}.csv")
+
+
+def write_scaled_csv(scale, workdir, source_path=DATA_PATH, seed=BENCHMARK_SEED):
+    """
+    Menulis dataset sintetis berskala (dilewati jika file sudah ada)
+
+    Args:
+        scale (int): Faktor pengali jumlah baris
+        workdir (str): Direktori tujuan
+        source_path (str): CSV sumber distribusi
+        seed (int): Seed generator
+
+    Returns:
+        str: Path file CSV berskala (source_path untuk skala 1)
+    """
+    if scale == 1:
+        return source_path
+
+    path = scaled_csv_path(workdir, scale, seed)
+    if os.path.exists(path):
+        return path
+
+    os.makedirs(workdir, exist_ok=True)
+    profile = LayoffsProfile.fit(source_path)
+    with open(source_path) as handle:
+        source_rows = sum(1 for _ in handle) - 1
+    return write_csv(path, source_rows * scale, seed=seed, profile=profile)
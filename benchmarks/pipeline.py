@@ -0,0 +1,265 @@
+"""
+Benchmark tahap pipeline data dan figure pada beberapa skala dataset
+
+Setiap tahap (load_data, apply_filters, create_layoffs_trend,
+create_country_map, create_treemap, dan jalur callback lengkap dengan treemap di
+thread pool maupun di process pool) diukur untuk beberapa kombinasi filter. Waktu diukur tanpa tracemalloc; puncak memori diukur
+pada satu putaran tambahan dengan tracemalloc aktif. Hasil ditulis sebagai JSON.
+
+Contoh:
+    python -m benchmarks.pipeline --scales 1 10 100 --output bench.json
+"""
+
+import argparse
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+import tracemalloc
+from datetime import datetime, timezone
+
+import numpy as np
+import pandas as pd
+
+from benchmarks.datasets import write_scaled_csv
+from components.cache import FigureCache, MemoryFigureBackend
+from components.callbacks import make_figure_builder
+from components.data_processor import apply_filters, load_data
+from components.executor import FigureExecutor
+from components.filter_index import get_filter_index
+from components.visualizations import (
+    create_country_map,
+    create_layoffs_trend,
+    create_treemap,
+)
+
+DEFAULT_SCALES = [1, 10, 100, 1000]
+FIGURE_NAMES = ["layoffs-trend", "country-map", "treemap-chart"]
+
+
+def filter_mixes(df):
+    """
+    Kombinasi filter representatif untuk dataset
+
+    Args:
+        df (DataFrame): Dataset hasil load_data()
+
+    Returns:
+        dict: Nama kombinasi -> isi filter-store
+    """
+    years = sorted(int(year) for year in df["year"].dropna().unique())
+    top_industries = df["industry"].value_counts().index[:3].tolist()
+    return {
+        "all": {"years": years, "industries": [], "countries": []},
+        "single_year": {"years": [years[-1]], "industries": [], "countries": []},
+        "non_us": {"years": years, "industries": [], "countries": ["Non-US"]},
+        "multi_industry": {
+            "years": years,
+            "industries": top_industries,
+            "countries": [],
+        },
+    }
+
+
+def measure(func, repeat, setup=None):
+    """
+    Mengukur waktu dan puncak memori sebuah fungsi
+
+    Args:
+        func (callable): Fungsi tanpa argumen yang diukur
+        repeat (int): Jumlah putaran pengukuran waktu
+        setup (callable): Dipanggil sebelum setiap putaran (tidak ikut diukur)
+
+    Returns:
+        dict: time_ms (min/median/mean) dan peak_bytes
+    """
+    timings = []
+    for _ in range(repeat):
+        if setup is not None:
+            setup()
+        start = time.perf_counter()
+        func()
+        timings.append((time.perf_counter() - start) * 1000)
+
+    if setup is not None:
+        setup()
+    tracemalloc.start()
+    try:
+        func()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    return {
+        "time_ms": {
+            "min": round(min(timings), 3),
+            "median": round(statistics.median(timings), 3),
+            "mean": round(statistics.fmean(timings), 3),
+        },
+        "peak_bytes": peak,
+    }
+
+
+def bench_scale(path, scale, repeat):
+    """
+    Menjalankan semua tahap untuk satu dataset
+
+    Args:
+        path (str): Path CSV dataset
+        scale (int): Faktor skala (untuk dicatat di hasil)
+        repeat (int): Jumlah putaran per pengukuran
+
+    Returns:
+        list: Baris hasil per (tahap, filter)
+    """
+    results = []
+
+    def record(stage, filter_name, rows, measurement):
+        results.append(
+            dict(
+                scale=scale,
+                rows=rows,
+                stage=stage,
+                filter=filter_name,
+                **measurement,
+            )
+        )
+
+    # Cold start dari CSV, lalu dari snapshot kolumnar
+    cold = measure(lambda: load_data(path, use_snapshot=False), max(1, repeat // 2))
+    df = load_data(path)
+    rows = len(df)
+    record("load_data_csv", None, rows, cold)
+    record("load_data_snapshot", None, rows, measure(lambda: load_data(path), repeat))
+
+    index = get_filter_index(df)
+    executors = {
+        "callback": FigureExecutor(workers=len(FIGURE_NAMES)),
+        "callback_process": FigureExecutor(
+            workers=len(FIGURE_NAMES), mode="process", data_path=path
+        ),
+    }
+
+    for filter_name, filter_data in filter_mixes(df).items():
+        years = filter_data["years"]
+        industries = filter_data["industries"]
+        countries = filter_data["countries"]
+
+        # Cache hasil filter dikosongkan agar yang diukur adalah komputasinya
+        record(
+            "apply_filters",
+            filter_name,
+            rows,
+            measure(
+                lambda: apply_filters(df, years, industries, countries),
+                repeat,
+                setup=index.views.clear,
+            ),
+        )
+        for stage, func in (
+            ("create_layoffs_trend", create_layoffs_trend),
+            ("create_country_map", create_country_map),
+            ("create_treemap", create_treemap),
+        ):
+            record(
+                stage,
+                filter_name,
+                rows,
+                measure(
+                    lambda: func(df, years, industries, countries),
+                    repeat,
+                    setup=index.views.clear,
+                ),
+            )
+
+        # Jalur callback lengkap: filter, tiga figure paralel, Patch, dan JSON
+        for stage, executor in executors.items():
+
+            def callback():
+                build_figures = make_figure_builder(
+                    df, FigureCache(MemoryFigureBackend(64 * 1024 * 1024)), executor
+                )
+                response = build_figures(filter_data, FIGURE_NAMES)
+                json.dumps(response, default=lambda patch: patch.to_plotly_json())
+
+            # Pemanasan: process pool dibuat dan worker memuat dataset di luar ukuran
+            if executor.mode == "process":
+                callback()
+            record(
+                stage,
+                filter_name,
+                rows,
+                measure(callback, repeat, setup=index.views.clear),
+            )
+
+    for executor in executors.values():
+        executor.shutdown()
+    return results
+
+
+def git_commit():
+    """Commit git saat ini, atau None jika tidak tersedia"""
+    try:
+        return subprocess.check_output(
+            ["git", "rev-parse", "HEAD"], stderr=subprocess.DEVNULL, text=True
+        ).strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def run(scales=DEFAULT_SCALES, repeat=5, workdir=None):
+    """
+    Menjalankan benchmark untuk semua skala
+
+    Args:
+        scales (list): Faktor skala dataset
+        repeat (int): Jumlah putaran per pengukuran
+        workdir (str): Direktori dataset berskala (default direktori sementara)
+
+    Returns:
+        dict: Metadata lingkungan dan daftar hasil
+    """
+    workdir = workdir or os.path.join(tempfile.gettempdir(), "layoffs-bench")
+    results = []
+    for scale in scales:
+        path = write_scaled_csv(scale, workdir)
+        results.extend(bench_scale(path, scale, repeat))
+
+    return {
+        "meta": {
+            "commit": git_commit(),
+            "timestamp": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+            "python": platform.python_version(),
+            "pandas": pd.__version__,
+            "numpy": np.__version__,
+            "repeat": repeat,
+        },
+        "results": results,
+    }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument(
+        "--scales", type=int, nargs="+", default=DEFAULT_SCALES, help="Faktor skala"
+    )
+    parser.add_argument("--repeat", type=int, default=5, help="Putaran per pengukuran")
+    parser.add_argument("--workdir", help="Direktori dataset berskala")
+    parser.add_argument("--output", help="File JSON hasil (default stdout)")
+    args = parser.parse_args(argv)
+
+    report = run(args.scales, args.repeat, args.workdir)
+    payload = json.dumps(report, indent=2)
+    if args.output:
+        with open(args.output, "w") as handle:
+            handle.write(payload + "\n")
+    else:
+        sys.stdout.write(payload + "\n")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,335 @@
+"""
+Utilitas cache untuk hasil filter dan visualisasi
+"""
+
+import hashlib
+import json
+import os
+import threading
+from collections import OrderedDict
+
+
+class LRUCache:
+    """Cache LRU berukuran terbatas yang aman dipakai dari banyak thread"""
+
+    def __init__(self, maxsize=128):
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._data = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key, default=None):
+        """Mengambil nilai dan menandainya sebagai yang terbaru dipakai"""
+        with self._lock:
+            try:
+                value = self._data[key]
+            except KeyError:
+                self.misses += 1
+                return default
+            self._data.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def set(self, key, value):
+        """Menyimpan nilai dan membuang entri terlama jika melebihi kapasitas"""
+        with self._lock:
+            self._data[key] = value
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+                self.evictions += 1
+
+    def get_or_compute(self, key, compute):
+        """
+        Mengambil nilai dari cache atau menghitungnya lalu menyimpannya
+
+        Args:
+            key (hashable): Kunci cache
+            compute (callable): Fungsi tanpa argumen untuk menghitung nilai
+
+        Returns:
+            object: Nilai dari cache atau hasil compute()
+        """
+        missing = object()
+        value = self.get(key, missing)
+        if value is missing:
+            value = compute()
+            self.set(key, value)
+        return value
+
+    def clear(self):
+        """Mengosongkan cache"""
+        with self._lock:
+            self._data.clear()
+
+    def __len__(self):
+        return len(self._data)
+
+    def stats(self):
+        """Mengembalikan counter hit/miss/eviction"""
+        return {
+            "size": len(self._data),
+            "maxsize": self.maxsize,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+        }
+
+
+class MemoryFigureBackend:
+    """
+    Backend figure cache di memori proses, dibatasi total ukuran byte
+
+    Figure disimpan sebagai objek hasil decode sehingga hit tidak perlu
+    json.loads; ukurannya dihitung dari panjang JSON-nya.
+    """
+
+    def __init__(self, max_bytes):
+        self.max_bytes = max_bytes
+        self.evictions = 0
+        self._data = OrderedDict()
+        self._size = 0
+        self._lock = threading.Lock()
+
+    def get(self, key):
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None:
+                return None
+            self._data.move_to_end(key)
+            return entry[1]
+
+    def set(self, key, payload, fig):
+        with self._lock:
+            previous = self._data.pop(key, None)
+            if previous is not None:
+                self._size -= previous[0]
+            self._data[key] = (len(payload), fig)
+            self._size += len(payload)
+            while self._size > self.max_bytes and len(self._data) > 1:
+                _, (evicted, _) = self._data.popitem(last=False)
+                self._size -= evicted
+                self.evictions += 1
+
+    def size_bytes(self):
+        return self._size
+
+    def __len__(self):
+        return len(self._data)
+
+
+class FileFigureBackend:
+    """
+    Backend figure cache berbasis direktori yang dapat dipakai bersama antar worker
+
+    Setiap entri adalah satu file JSON; mtime file dipakai sebagai penanda LRU.
+    Arahkan ke /dev/shm agar cache tinggal di shared memory.
+
+    Ukuran direktori dilacak per proses saat menulis; direktori baru dipindai
+    (dan ukuran disinkronkan dengan tulisan worker lain) ketika ukuran itu melewati
+    max_bytes, lalu entri terlama dibuang sekaligus sampai low_water * max_bytes.
+    Figure yang sudah di-decode disimpan di LRU kecil per proses (decoded_entries)
+    sehingga hit berulang tidak membaca dan mem-parse file lagi.
+    """
+
+    # Batas bawah eviksi relatif terhadap max_bytes
+    low_water = 0.9
+
+    def __init__(self, directory, max_bytes, decoded_entries=64):
+        self.directory = directory
+        self.max_bytes = max_bytes
+        self.evictions = 0
+        self._decoded = LRUCache(decoded_entries)
+        self._lock = threading.Lock()
+        os.makedirs(directory, exist_ok=True)
+        self._size = sum(size for _, size, _ in self._entries())
+
+    def _path(self, key):
+        return os.path.join(self.directory, f"{key}.json")
+
+    def get(self, key):
+        from components.metrics import timed
+
+        path = self._path(key)
+        fig = self._decoded.get(key)
+        try:
+            if fig is None:
+                with open(path, "rb") as handle:
+                    payload = handle.read()
+            os.utime(path)
+        except OSError:
+            # Entri dibuang worker lain; objek yang sudah di-decode tetap valid
+            # karena kunci memuat versi dataset
+            return fig
+        if fig is None:
+            with timed("serialize"):
+                fig = json.loads(payload)
+            self._decoded.set(key, fig)
+        return fig
+
+    def set(self, key, payload, fig):
+        path = self._path(key)
+        data = payload.encode("utf-8")
+        try:
+            previous = os.stat(path).st_size
+        except OSError:
+            previous = 0
+        tmp_path = os.path.join(self.directory, f".{key}.{os.getpid()}.tmp")
+        with open(tmp_path, "wb") as handle:
+            handle.write(data)
+        os.replace(tmp_path, path)
+        self._decoded.set(key, fig)
+        with self._lock:
+            self._size += len(data) - previous
+            if self._size <= self.max_bytes:
+                return
+        self._evict()
+
+    def _entries(self):
+        entries = []
+        for entry in os.scandir(self.directory):
+            if entry.name.endswith(".json"):
+                try:
+                    stat = entry.stat()
+                except OSError:
+                    continue
+                entries.append((stat.st_mtime_ns, stat.st_size, entry.path))
+        return entries
+
+    def _evict(self):
+        entries = self._entries()
+        total = sum(size for _, size, _ in entries)
+        if total > self.max_bytes:
+            target = self.max_bytes * self.low_water
+            for _, size, path in sorted(entries)[:-1]:
+                try:
+                    os.remove(path)
+                except OSError:
+                    continue
+                self.evictions += 1
+                total -= size
+                if total <= target:
+                    break
+        with self._lock:
+            self._size = total
+
+    def size_bytes(self):
+        return sum(size for _, size, _ in self._entries())
+
+    def __len__(self):
+        return len(self._entries())
+
+
+class FigureCache:
+    """
+    Cache respons figure berdasarkan signature filter
+
+    Kunci terdiri dari nama figure, versi dataset, dan signature filter, sehingga
+    entri lama otomatis tidak terpakai lagi saat dataset berubah. Figure yang
+    dikembalikan dipakai bersama antar request dan tidak boleh diubah.
+    """
+
+    def __init__(self, backend):
+        self.backend = backend
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def make_key(name, signature, version):
+        """Membuat kunci cache yang aman dipakai sebagai nama file"""
+        raw = json.dumps([name, version, signature], default=str)
+        return f"{name}-{hashlib.sha1(raw.encode('utf-8')).hexdigest()}"
+
+    def get_or_build(self, name, signature, version, build):
+        """
+        Mengambil figure dari cache atau membangunnya
+
+        Args:
+            name (str): Nama figure (misalnya "layoffs-trend")
+            signature (tuple): Signature filter hasil filter_signature()
+            version (str): Versi dataset; None menonaktifkan cache
+            build (callable): Fungsi tanpa argumen yang mengembalikan Figure atau dict
+
+        Returns:
+            dict: Figure dalam bentuk dict siap dikirim ke dcc.Graph
+        """
+        from components.figure_specs import figure_to_json
+        from components.metrics import record_cache_outcome, timed
+
+        if version is None:
+            record_cache_outcome(name, "bypass")
+            fig = build()
+            with timed("serialize"):
+                return json.loads(figure_to_json(fig))
+
+        key = self.make_key(name, signature, version)
+        cached = self.backend.get(key)
+        with self._lock:
+            if cached is None:
+                self.misses += 1
+            else:
+                self.hits += 1
+        record_cache_outcome(name, "miss" if cached is None else "hit")
+        if cached is not None:
+            return cached
+
+        fig = build()
+        with timed("serialize"):
+            payload = figure_to_json(fig)
+            if not isinstance(fig, dict):
+                fig = json.loads(payload)
+        self.backend.set(key, payload, fig)
+        return fig
+
+    def stats(self):
+        """Mengembalikan counter hit/miss/eviction dan ukuran cache"""
+        lookups = self.hits + self.misses
+        return {
+            "backend": type(self.backend).__name__,
+            "entries": len(self.backend),
+            "size_bytes": self.backend.size_bytes(),
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.backend.evictions,
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+        }
+
+
+_figure_cache = None
+_figure_cache_lock = threading.Lock()
+
+
+def get_figure_cache():
+    """
+    Mengembalikan figure cache proses ini sesuai konfigurasi
+
+    Pembuatan dijaga lock agar callback paralel pertama tidak membuat dua cache.
+
+    Returns:
+        FigureCache: Instance figure cache (dibuat sekali per proses)
+    """
+    global _figure_cache
+    if _figure_cache is not None:
+        return _figure_cache
+    with _figure_cache_lock:
+        if _figure_cache is None:
+            from config import (
+                FIGURE_CACHE_BACKEND,
+                FIGURE_CACHE_DECODED_ENTRIES,
+                FIGURE_CACHE_DIR,
+                FIGURE_CACHE_MAX_BYTES,
+            )
+
+            if FIGURE_CACHE_BACKEND == "file":
+                backend = FileFigureBackend(
+                    FIGURE_CACHE_DIR,
+                    FIGURE_CACHE_MAX_BYTES,
+                    FIGURE_CACHE_DECODED_ENTRIES,
+                )
+            else:
+                backend = MemoryFigureBackend(FIGURE_CACHE_MAX_BYTES)
+            _figure_cache = FigureCache(backend)
+    return _figure_cache
@@ -1,33 +1,222 @@
-from dash import Input, Output, State, html
+from functools import partial
+
+from dash import ClientsideFunction, Input, Output, State
 import dash
 from components.visualizations import (
     create_layoffs_trend,
     create_country_map,
-    create_treemap,
+    create_treemap_figure,
+)
+from components.data_processor import (
+    apply_filters,
+    filter_signature_from_store,
+    get_dataset_version,
+)
+from components.cache import get_figure_cache
+from components.executor import get_figure_executor
+from components.refresh import LiveDataset
+from components.metrics import instrument_callback, timed
+from components.profiling import profile_callback
+from components.payload import encode_figure
+from components.responses import note_figure_keys
+from components.figure_specs import (
+    MAP_DATA_PATHS,
+    TREEMAP_DATA_PATHS,
+    TREND_DATA_PATHS,
+    figure_patch,
 )
-from components.data_processor import apply_filters
+from config import PARTIAL_UPDATES, CLIENTSIDE_FILTERING
+
+# Path array data dan key layout yang dikirim lewat dash.Patch per figure
+FIGURE_PATCHES = {
+    "layoffs-trend": (TREND_DATA_PATHS, ()),
+    "country-map": (MAP_DATA_PATHS, ()),
+    # Anotasi "No data" ikut diganti agar transisi kosong <-> berisi tetap benar
+    "treemap-chart": (TREEMAP_DATA_PATHS, ("annotations",)),
+}
+
+FILTER_STATES = [
+    State("year-slider", "value"),
+    State("industry-dropdown", "value"),
+    State("country-dropdown", "value"),
+]
+
+
+def _build_encoded(name, build):
+    """Membangun figure lalu meringkas array datanya (hasil ini yang di-cache)"""
+    with timed("build"):
+        return encode_figure(name, build())
+
+
+def make_figure_builder(data, figure_cache=None, figure_executor=None):
+    """
+    Membuat fungsi pembangun figure untuk satu dataset (jalur callback lengkap)
+
+    Args:
+        data (DataFrame | LiveDataset): Data layoffs; untuk LiveDataset frame aktif
+            dan versinya dibaca ulang setiap pemanggilan
+        figure_cache (FigureCache): Cache figure, default cache proses ini
+        figure_executor (FigureExecutor): Executor figure, default executor proses ini
+
+    Returns:
+        callable: build_figures(filter_data, names)
+    """
+    if figure_cache is None:
+        figure_cache = get_figure_cache()
+    if figure_executor is None:
+        figure_executor = get_figure_executor()
+
+    def build_figures(filter_data, names):
+        """
+        Membangun figure bernama untuk satu filter secara bersamaan
+
+        Args:
+            filter_data (dict): Isi filter-store (None saat render awal)
+            names (list): Nama figure yang dibangun, sesuai urutan Output
+
+        Returns:
+            list: Figure lengkap, atau dash.Patch setelah render pertama
+        """
+        # Tanpa filter (render awal) signature-nya sama dengan "semua data"
+        signature = filter_signature_from_store(filter_data)
+        years, industries, countries = signature
+        df = data.df if isinstance(data, LiveDataset) else data
+        dataset_version = get_dataset_version(df)
 
+        # Data terfilter untuk treemap; tidak dihitung jika treemap dibangun di
+        # process pool (worker memfilter datasetnya sendiri)
+        def filtered_df():
+            with timed("filter"):
+                return apply_filters(df, years, industries, countries)
 
-def register_callbacks(app, df):
+        builders = {
+            "layoffs-trend": lambda: create_layoffs_trend(
+                df, years, industries, countries
+            ),
+            "country-map": lambda: create_country_map(df, years, industries, countries),
+            "treemap-chart": lambda: figure_executor.run_heavy(
+                create_treemap_figure, df, signature, filtered_df
+            ),
+        }
+
+        figures = figure_executor.run(
+            {
+                name: partial(
+                    figure_cache.get_or_build,
+                    name,
+                    signature,
+                    dataset_version,
+                    partial(_build_encoded, name, builders[name]),
+                )
+                for name in names
+            }
+        )
+
+        # Render pertama mengirim figure lengkap, selanjutnya hanya array data
+        full = filter_data is None or not PARTIAL_UPDATES
+
+        # Isi respons ditentukan oleh kunci figure cache dan bentuknya (ETag)
+        if dataset_version is not None:
+            note_figure_keys(
+                [
+                    figure_cache.make_key(name, signature, dataset_version)
+                    for name in names
+                ]
+                + ["full" if full else "patch"]
+            )
+
+        if full:
+            return [figures[name] for name in names]
+        return [figure_patch(figures[name], *FIGURE_PATCHES[name]) for name in names]
+
+    return build_figures
+
+
+def register_callbacks(app, data, clientside=CLIENTSIDE_FILTERING):
     """
     Mendaftarkan semua callbacks ke aplikasi Dash
 
     Args:
         app (Dash): Aplikasi Dash
-        df (DataFrame): DataFrame berisi data layoffs
+        data (DataFrame | LiveDataset): Data layoffs
+        clientside (bool): Filter dan grafik tren/peta dihitung di browser
+    """
+    build_figures = make_figure_builder(data)
+
+    if clientside:
+        register_clientside_callbacks(app)
+
+        # Callback untuk treemap (tren dan peta dihitung di browser)
+        @app.callback(
+            Output("treemap-chart", "figure"),
+            [Input("filter-store", "data")],
+            prevent_initial_call=False,
+        )
+        @instrument_callback("update_treemap")
+        @profile_callback("update_treemap")
+        def update_treemap(filter_data):
+            """Update treemap berdasarkan filter"""
+            return build_figures(filter_data, ["treemap-chart"])[0]
+
+    else:
+        register_server_callbacks(app, build_figures)
+
+
+def register_clientside_callbacks(app):
+    """
+    Mendaftarkan callback filter, tren, dan peta yang berjalan di browser
+
+    Fungsi JavaScript-nya ada di assets/clientside_filters.js dan bekerja di atas
+    cube agregat pada dcc.Store "cube-store".
+
+    Args:
+        app (Dash): Aplikasi Dash
+    """
+    app.clientside_callback(
+        ClientsideFunction(namespace="layoffs", function_name="storeFilters"),
+        Output("filter-store", "data"),
+        Input("apply-filter-btn", "n_clicks"),
+        *FILTER_STATES,
+        prevent_initial_call=True,
+    )
+
+    app.clientside_callback(
+        ClientsideFunction(namespace="layoffs", function_name="updateTrend"),
+        Output("layoffs-trend", "figure"),
+        Input("filter-store", "data"),
+        State("cube-store", "data"),
+        State("layoffs-trend", "figure"),
+        prevent_initial_call=True,
+    )
+
+    app.clientside_callback(
+        ClientsideFunction(namespace="layoffs", function_name="updateMap"),
+        Output("country-map", "figure"),
+        Input("filter-store", "data"),
+        State("cube-store", "data"),
+        State("country-map", "figure"),
+        prevent_initial_call=True,
+    )
+
+
+def register_server_callbacks(app, build_figures):
+    """
+    Mendaftarkan callback filter dan visualisasi yang berjalan di server
+
+    Args:
+        app (Dash): Aplikasi Dash
+        build_figures (callable): Pembangun figure dari register_callbacks
     """
 
     # Callback untuk menyimpan filter
     @app.callback(
         Output("filter-store", "data"),
         [Input("apply-filter-btn", "n_clicks")],
-        [
-            State("year-slider", "value"),
-            State("industry-dropdown", "value"),
-            State("country-dropdown", "value"),
-        ],
+        FILTER_STATES,
         prevent_initial_call=True,
     )
+    @instrument_callback("store_filters")
+    @profile_callback("store_filters", store_from="output")
     def store_filters(n_clicks, year_range, industries, countries):
         """Menyimpan filter yang dipilih"""
         if n_clicks is None:
@@ -36,51 +225,20 @@ def register_callbacks(app, df):
         years = list(range(year_range[0], year_range[1] + 1))
         return {"years": years, "industries": industries, "countries": countries}
 
-    # Callback untuk update visualisasi
+    # Callback untuk update semua visualisasi dalam satu round trip
     @app.callback(
         [
             Output("layoffs-trend", "figure"),
             Output("country-map", "figure"),
+            Output("treemap-chart", "figure"),
         ],
         [Input("filter-store", "data")],
         prevent_initial_call=False,
     )
+    @instrument_callback("update_visualizations")
+    @profile_callback("update_visualizations")
     def update_visualizations(filter_data):
         """Update semua visualisasi berdasarkan filter"""
-        if filter_data is None:
-            # Default visualizations with all data
-            return (
-                create_layoffs_trend(df),
-                create_country_map(df),
-            )
-
-        filtered_df = df.copy()
-
-        years = filter_data.get("years", None)
-        industries = filter_data.get("industries", None)
-        countries = filter_data.get("countries", None)
-
-        filtered_df = apply_filters(filtered_df, years, industries, countries)
-
-        return (
-            create_layoffs_trend(df, years, industries, countries),
-            create_country_map(df, years, industries, countries),
+        return build_figures(
+            filter_data, ["layoffs-trend", "country-map", "treemap-chart"]
         )
-
-    # Callback untuk treemap
-    @app.callback(
-        Output("treemap-chart", "figure"),
-        [Input("filter-store", "data")],
-        prevent_initial_call=False,
-    )
-    def update_treemap(filter_data):
-        """Update treemap berdasarkan filter"""
-        if filter_data is None:
-            # Default treemap with all data
-            return create_treemap(df)
-
-        years = filter_data.get("years", None)
-        industries = filter_data.get("industries", None)
-        countries = filter_data.get("countries", None)
-
-        return create_treemap(df, years, industries, countries)
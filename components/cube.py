@@ -0,0 +1,414 @@
+"""
+Cube agregat (bulan x industri x negara) untuk visualisasi tren dan peta
+
+Cube dibangun sekali saat data dimuat. Setiap sel menyimpan jumlah
+total_laid_off, jumlah baris berperusahaan, jumlah dan cacah
+percentage_laid_off (untuk rata-rata), serta keanggotaan perusahaan per sel.
+Grafik tren dan peta cukup memotong dan me-rollup cube yang jauh lebih kecil
+dari data baris, sehingga waktu respons tidak bergantung pada jumlah baris.
+"""
+
+import numpy as np
+import pandas as pd
+
+from components.filter_index import NON_US, US_COUNTRY
+from components.geo import country_iso3
+from components.registry import attach, lookup
+
+
+def _codes(series):
+    """Mengembalikan (kode int, tabel nilai) untuk kolom categorical atau teks"""
+    if isinstance(series.dtype, pd.CategoricalDtype):
+        return series.cat.codes.to_numpy().astype(np.int64), series.cat.categories
+    codes, uniques = pd.factorize(series, use_na_sentinel=True, sort=True)
+    return codes.astype(np.int64), pd.Index(uniques)
+
+
+def _period_codes(df):
+    """Kode periode bulanan (tahun * 12 + bulan - 1), -1 untuk tanggal kosong"""
+    year = pd.to_numeric(df["year"]).to_numpy(dtype=float, na_value=np.nan)
+    month = pd.to_numeric(df["month"]).to_numpy(dtype=float, na_value=np.nan)
+    period = year * 12 + (month - 1)
+    return np.where(np.isnan(period), -1, period).astype(np.int64)
+
+
+class AggregateCube:
+    """Agregat per sel (periode, industri, negara) untuk satu DataFrame"""
+
+    def __init__(self, df):
+        period = _period_codes(df)
+        industry, self.industries = _codes(df["industry"])
+        country, self.countries = _codes(df["country"])
+        company, self.companies = _codes(df["company"])
+        self._index_dimensions()
+
+        # Gabungkan tiga dimensi menjadi satu kunci sel (kode -1 digeser ke 0)
+        n_industry = len(self.industries) + 1
+        n_country = len(self.countries) + 1
+        key = ((period + 1) * n_industry + (industry + 1)) * n_country + (country + 1)
+        cell_ids, cell_keys = pd.factorize(key)
+        cell_keys = np.asarray(cell_keys, dtype=np.int64)
+
+        self.cell_country = cell_keys % n_country - 1
+        self.cell_industry = (cell_keys // n_country) % n_industry - 1
+        self.cell_period = cell_keys // (n_country * n_industry) - 1
+        n_cells = len(cell_keys)
+
+        total = df["total_laid_off"].to_numpy(dtype=float, na_value=np.nan)
+        percentage = df["percentage_laid_off"].to_numpy(dtype=float, na_value=np.nan)
+        has_percentage = ~np.isnan(percentage)
+
+        self.total_sum = np.bincount(
+            cell_ids, weights=np.nan_to_num(total), minlength=n_cells
+        )
+        self.company_rows = np.bincount(
+            cell_ids, weights=company >= 0, minlength=n_cells
+        ).astype(np.int64)
+        self.percentage_sum = np.bincount(
+            cell_ids, weights=np.where(has_percentage, percentage, 0.0), minlength=n_cells
+        )
+        self.percentage_count = np.bincount(
+            cell_ids, weights=has_percentage, minlength=n_cells
+        ).astype(np.int64)
+
+        # Keanggotaan perusahaan per sel sebagai pasangan unik (sel, perusahaan)
+        n_company = len(self.companies)
+        has_company = company >= 0
+        pairs = np.unique(cell_ids[has_company] * n_company + company[has_company])
+        self.pair_cell = pairs // n_company
+        self.pair_company = pairs % n_company
+
+    @classmethod
+    def from_cells(cls, industries, countries, companies, cells, pairs):
+        """
+        Membuat cube dari sel yang sudah diagregasi (misalnya hasil ingest per chunk)
+
+        Args:
+            industries (Index): Tabel nilai industri (urutan kode)
+            countries (Index): Tabel nilai negara (urutan kode)
+            companies (Index): Tabel nilai perusahaan (urutan kode)
+            cells (dict): Array per sel: cell_period, cell_industry, cell_country,
+                total_sum, company_rows, percentage_sum, percentage_count
+            pairs (tuple): (pair_cell, pair_company) unik
+
+        Returns:
+            AggregateCube: Cube baru
+        """
+        cube = cls.__new__(cls)
+        cube.industries = industries
+        cube.countries = countries
+        cube.companies = companies
+        cube._index_dimensions()
+        for name, values in cells.items():
+            setattr(cube, name, values)
+        cube.pair_cell, cube.pair_company = pairs
+        return cube
+
+    def _index_dimensions(self):
+        self.industry_codes = {value: code for code, value in enumerate(self.industries)}
+        self.country_codes = {value: code for code, value in enumerate(self.countries)}
+        self.country_iso3 = country_iso3(self.countries)
+
+    def select_cells(self, years=None, industries=None, countries=None):
+        """
+        Membuat mask sel yang lolos filter
+
+        Args:
+            years (list): Daftar tahun untuk filter (rentang min..max)
+            industries (list): Daftar industri untuk filter
+            countries (list): Daftar negara untuk filter (mendukung "Non-US")
+
+        Returns:
+            ndarray: Mask boolean per sel
+        """
+        mask = np.ones(len(self.cell_period), dtype=bool)
+
+        if years:
+            cell_year = np.where(self.cell_period >= 0, self.cell_period // 12, -1)
+            mask &= (
+                (self.cell_period >= 0)
+                & (cell_year >= min(years))
+                & (cell_year <= max(years))
+            )
+
+        if industries:
+            codes = [self.industry_codes[i] for i in industries if i in self.industry_codes]
+            mask &= np.isin(self.cell_industry, codes)
+
+        if countries:
+            if NON_US in countries and US_COUNTRY not in countries:
+                mask &= self.cell_country != self.country_codes.get(US_COUNTRY, -2)
+            elif NON_US not in countries:
+                codes = [self.country_codes[c] for c in countries if c in self.country_codes]
+                mask &= np.isin(self.cell_country, codes)
+
+        return mask
+
+    def monthly(self, years=None, industries=None, countries=None):
+        """
+        Rollup per bulan untuk grafik tren
+
+        Returns:
+            DataFrame: Kolom year_month (kode periode), total_layoffs, companies
+        """
+        mask = self.select_cells(years, industries, countries) & (self.cell_period >= 0)
+        periods, inverse = np.unique(self.cell_period[mask], return_inverse=True)
+        return pd.DataFrame(
+            {
+                "year_month": periods,
+                "total_layoffs": np.bincount(
+                    inverse, weights=self.total_sum[mask], minlength=len(periods)
+                ),
+                "companies": np.bincount(
+                    inverse, weights=self.company_rows[mask], minlength=len(periods)
+                ).astype(np.int64),
+            }
+        )
+
+    def by_country(self, years=None, industries=None, countries=None):
+        """
+        Rollup per negara untuk peta
+
+        Returns:
+            DataFrame: Kolom country, iso3, percentage_layoffs, total_layoffs, companies
+        """
+        mask = self.select_cells(years, industries, countries) & (self.cell_country >= 0)
+        codes, inverse = np.unique(self.cell_country[mask], return_inverse=True)
+        n_groups = len(codes)
+
+        percentage_sum = np.bincount(
+            inverse, weights=self.percentage_sum[mask], minlength=n_groups
+        )
+        percentage_count = np.bincount(
+            inverse, weights=self.percentage_count[mask], minlength=n_groups
+        )
+        with np.errstate(invalid="ignore", divide="ignore"):
+            percentage_mean = np.where(
+                percentage_count > 0, percentage_sum / percentage_count, np.nan
+            )
+
+        # Jumlah perusahaan unik per negara dari pasangan (sel, perusahaan) terpilih
+        pair_mask = mask[self.pair_cell]
+        pair_country = self.cell_country[self.pair_cell[pair_mask]]
+        country_company = np.unique(
+            pair_country * len(self.companies) + self.pair_company[pair_mask]
+        )
+        companies = np.bincount(
+            np.searchsorted(codes, country_company // len(self.companies)),
+            minlength=n_groups,
+        )
+
+        return pd.DataFrame(
+            {
+                "country": np.asarray(self.countries[codes], dtype=object),
+                "iso3": self.country_iso3[codes],
+                "percentage_layoffs": percentage_mean,
+                "total_layoffs": np.bincount(
+                    inverse, weights=self.total_sum[mask], minlength=n_groups
+                ),
+                "companies": companies.astype(np.int64),
+            }
+        )
+
+    def merge(self, other, df):
+        """
+        Menggabungkan cube ini dengan cube baris tambahan
+
+        Penggabungan bekerja di tingkat sel dan pasangan (sel, perusahaan); baris
+        frame hanya dipakai untuk tabel nilai (kategori) gabungan.
+
+        Args:
+            other (AggregateCube): Cube untuk baris tambahan
+            df (DataFrame): Frame gabungan
+
+        Returns:
+            AggregateCube: Cube gabungan
+        """
+        industries = _codes(df["industry"])[1]
+        countries = _codes(df["country"])[1]
+        companies = _codes(df["company"])[1]
+        builder = CubeBuilder()
+        builder.add_cube(self, industries, countries, companies)
+        builder.add_cube(other, industries, countries, companies)
+        return builder.build(industries, countries, companies)
+
+    def to_client_payload(self):
+        """
+        Serialisasi cube ringkas untuk filtering di browser (dcc.Store)
+
+        Dimensi dikirim sebagai kode integer beserta tabel namanya; baris data
+        tidak ikut dikirim.
+
+        Returns:
+            dict: Array per sel dan pasangan (sel, perusahaan) dalam list biasa
+        """
+        return {
+            "industries": [str(value) for value in self.industries],
+            "countries": [str(value) for value in self.countries],
+            "country_iso3": self.country_iso3.tolist(),
+            "us_code": self.country_codes.get(US_COUNTRY, -2),
+            "cell_period": self.cell_period.tolist(),
+            "cell_industry": self.cell_industry.tolist(),
+            "cell_country": self.cell_country.tolist(),
+            "total_sum": self.total_sum.tolist(),
+            "company_rows": self.company_rows.tolist(),
+            "percentage_sum": self.percentage_sum.tolist(),
+            "percentage_count": self.percentage_count.tolist(),
+            "pair_cell": self.pair_cell.tolist(),
+            "pair_company": self.pair_company.tolist(),
+        }
+
+
+class CubeBuilder:
+    """
+    Membangun AggregateCube bertahap dari chunk baris
+
+    Setiap chunk langsung direduksi menjadi agregat per sel dan pasangan unik
+    (sel, perusahaan); baris mentahnya tidak disimpan.
+    """
+
+    KEYS = ["period", "industry", "country"]
+
+    def __init__(self):
+        self._cells = []
+        self._pairs = []
+
+    def add_chunk(self, period, industry, country, company, total, percentage):
+        """
+        Menambahkan satu chunk berkode
+
+        Args:
+            period (ndarray): Kode periode bulanan, -1 untuk tanggal kosong
+            industry (ndarray): Kode industri, -1 untuk kosong
+            country (ndarray): Kode negara, -1 untuk kosong
+            company (ndarray): Kode perusahaan, -1 untuk kosong
+            total (ndarray): total_laid_off (float, NaN untuk kosong)
+            percentage (ndarray): percentage_laid_off (float, NaN untuk kosong)
+        """
+        has_percentage = ~np.isnan(percentage)
+        rows = pd.DataFrame(
+            {
+                "period": period,
+                "industry": industry,
+                "country": country,
+                "total_sum": np.nan_to_num(total),
+                "company_rows": (company >= 0).astype(np.int64),
+                "percentage_sum": np.where(has_percentage, percentage, 0.0),
+                "percentage_count": has_percentage.astype(np.int64),
+            }
+        )
+        self._cells.append(rows.groupby(self.KEYS, sort=False).sum().reset_index())
+
+        has_company = company >= 0
+        self._pairs.append(
+            rows.loc[has_company, self.KEYS]
+            .assign(company=company[has_company])
+            .drop_duplicates()
+        )
+
+    def add_cube(self, cube, industries, countries, companies):
+        """
+        Menambahkan sel dan pasangan cube lain, dipetakan ke tabel nilai final
+
+        Args:
+            cube (AggregateCube): Cube sumber
+            industries (Index): Tabel nilai industri final
+            countries (Index): Tabel nilai negara final
+            companies (Index): Tabel nilai perusahaan final
+        """
+
+        def remap(codes, source, target):
+            mapping = np.append(target.get_indexer(source), -1)
+            return mapping[codes]
+
+        cells = pd.DataFrame(
+            {
+                "period": cube.cell_period,
+                "industry": remap(cube.cell_industry, cube.industries, industries),
+                "country": remap(cube.cell_country, cube.countries, countries),
+                "total_sum": cube.total_sum,
+                "company_rows": cube.company_rows,
+                "percentage_sum": cube.percentage_sum,
+                "percentage_count": cube.percentage_count,
+            }
+        )
+        self._cells.append(cells)
+        self._pairs.append(
+            cells.loc[cube.pair_cell, self.KEYS]
+            .assign(company=remap(cube.pair_company, cube.companies, companies))
+            .reset_index(drop=True)
+        )
+
+    def build(self, industries, countries, companies, remaps=None):
+        """
+        Menyusun cube dari semua chunk
+
+        Args:
+            industries (Index): Tabel nilai industri final
+            countries (Index): Tabel nilai negara final
+            companies (Index): Tabel nilai perusahaan final
+            remaps (dict): Kolom -> array pemetaan kode chunk ke kode final
+                (indeks -1 dipetakan ke -1)
+
+        Returns:
+            AggregateCube: Cube untuk seluruh baris
+        """
+        cells = pd.concat(self._cells, ignore_index=True)
+        pairs = pd.concat(self._pairs, ignore_index=True)
+        for column, remap in (remaps or {}).items():
+            if column in cells:
+                cells[column] = remap[cells[column].to_numpy()]
+            pairs[column] = remap[pairs[column].to_numpy()]
+
+        cells = cells.groupby(self.KEYS, sort=False).sum().reset_index()
+        cells["cell"] = np.arange(len(cells))
+        pairs = pairs.drop_duplicates().merge(cells[self.KEYS + ["cell"]], on=self.KEYS)
+        pairs = pairs.sort_values(["cell", "company"])
+
+        return AggregateCube.from_cells(
+            industries,
+            countries,
+            companies,
+            {
+                "cell_period": cells["period"].to_numpy(dtype=np.int64),
+                "cell_industry": cells["industry"].to_numpy(dtype=np.int64),
+                "cell_country": cells["country"].to_numpy(dtype=np.int64),
+                "total_sum": cells["total_sum"].to_numpy(dtype=float),
+                "company_rows": cells["company_rows"].to_numpy(dtype=np.int64),
+                "percentage_sum": cells["percentage_sum"].to_numpy(dtype=float),
+                "percentage_count": cells["percentage_count"].to_numpy(dtype=np.int64),
+            },
+            (
+                pairs["cell"].to_numpy(dtype=np.int64),
+                pairs["company"].to_numpy(dtype=np.int64),
+            ),
+        )
+
+
+def build_cube(df, cube=None):
+    """
+    Membangun dan mendaftarkan cube agregat untuk DataFrame
+
+    Args:
+        df (DataFrame): DataFrame berisi data layoffs
+        cube (AggregateCube): Cube yang sudah dibangun untuk frame ini (opsional)
+
+    Returns:
+        AggregateCube: Cube yang terdaftar untuk frame tersebut
+    """
+    if cube is None:
+        cube = AggregateCube(df)
+    return attach(df, "cube", cube)
+
+
+def get_cube(df):
+    """
+    Mengambil cube agregat yang terdaftar untuk DataFrame
+
+    Args:
+        df (DataFrame): DataFrame berisi data layoffs
+
+    Returns:
+        AggregateCube: Cube frame, atau None jika belum dibangun
+    """
+    return lookup(df, "cube")
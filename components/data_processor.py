@@ -1,34 +1,478 @@
+import warnings
 import pandas as pd
 import numpy as np
+from pandas.api.types import union_categoricals
 from datetime import datetime
 
+from config import (
+    DATA_PATH,
+    SNAPSHOT_ENABLED,
+    SNAPSHOT_MMAP,
+    COMPACT_SCHEMA,
+    FILTER_CACHE_SIZE,
+    INGEST_CHUNK_SIZE,
+)
+from components.snapshot import (
+    file_hasher,
+    is_snapshot_valid,
+    read_snapshot,
+    read_snapshot_meta,
+    snapshot_path_for,
+    write_snapshot,
+)
+from components.registry import attach, lookup
+from components.cube import AggregateCube, CubeBuilder, build_cube, get_cube
+from components.filter_index import (
+    NON_US,
+    US_COUNTRY,
+    FilterIndex,
+    FilterIndexBuilder,
+    build_filter_index,
+    get_filter_index,
+)
 
-def load_data():
+# Kolom teks berkardinalitas rendah yang disimpan sebagai categorical
+CATEGORICAL_COLUMNS = [
+    "company", "location", "industry", "source", "stage", "country", "date_added"
+]
+
+# Naikkan jika pra-proses berubah agar snapshot lama tidak dipakai lagi
+SCHEMA_REVISION = 2
+
+# Kolom numerik yang dikonversi dengan pd.to_numeric
+NUMERIC_COLUMNS = ["total_laid_off", "percentage_laid_off", "funds_raised"]
+
+# Format kolom date pada CSV layoffs
+DATE_FORMAT = "%m/%d/%Y"
+
+# Nama bulan tetap (tidak bergantung locale) untuk kode month_name
+MONTH_NAMES = ["Jan", "Feb", "Mar", "Apr", "May", "Jun",
+               "Jul", "Aug", "Sep", "Oct", "Nov", "Dec"]
+
+
+def load_data(
+    path=DATA_PATH,
+    use_snapshot=SNAPSHOT_ENABLED,
+    compact=COMPACT_SCHEMA,
+    mmap=SNAPSHOT_MMAP,
+    chunksize=INGEST_CHUNK_SIZE,
+):
     """
     Load dan pra-proses dataset layoffs
 
+    Jika snapshot kolumnar yang masih valid tersedia, frame dibaca langsung dari
+    snapshot. Jika tidak, CSV diproses ulang lalu snapshot baru ditulis.
+
+    Args:
+        path (str): Path file CSV dataset
+        use_snapshot (bool): Gunakan snapshot kolumnar on-disk
+        compact (bool): Gunakan skema ringkas (categorical + kode periode integer)
+        mmap (bool): Petakan kolom snapshot read-only alih-alih membacanya ke memori
+        chunksize (int): Baca CSV per chunk berukuran ini (hanya skema ringkas);
+            0/None membaca seluruh file sekaligus
+
     Returns:
         DataFrame: Pandas DataFrame berisi data layoffs yang telah diproses
     """
-    df = pd.read_csv("data/layoffs.csv")
+    schema = dataset_schema(compact)
+    mmap_mode = "r" if mmap else None
+
+    if use_snapshot:
+        df = read_snapshot(path, schema=schema, mmap_mode=mmap_mode)
+        if df is not None:
+            return _register_frame(df, path, schema)
+
+    prebuilt = {}
+    if compact and chunksize:
+        df, prebuilt = _ingest_csv_chunked(path, chunksize)
+    else:
+        df = _process_csv(path)
+        if compact:
+            df = compact_frame(df)
+
+    if use_snapshot:
+        try:
+            write_snapshot(df, path, schema=schema)
+        except OSError as exc:
+            warnings.warn(f"Gagal menulis snapshot data: {exc}")
+        else:
+            if mmap:
+                # Pakai snapshot yang baru ditulis agar kolom tetap berupa memory-map
+                mapped = read_snapshot(path, schema=schema, mmap_mode=mmap_mode)
+                if mapped is not None:
+                    df = mapped
+
+    return _register_frame(df, path, schema, **prebuilt)
+
+
+def dataset_schema(compact=COMPACT_SCHEMA):
+    """
+    Penanda skema loader yang dicatat di snapshot dan versi dataset
+
+    Args:
+        compact (bool): Skema ringkas
+
+    Returns:
+        str: Misalnya "compact-r2"
+    """
+    return f"{'compact' if compact else 'default'}-r{SCHEMA_REVISION}"
+
+
+def content_version(schema, source_hash):
+    """
+    Versi dataset dari skema loader dan hash SHA-256 isi file sumber
+
+    Dipakai load_data() maupun refresh live, sehingga isi file yang sama selalu
+    menghasilkan versi yang sama di semua worker.
+
+    Args:
+        schema (str): Penanda skema dari dataset_schema()
+        source_hash (str): Hex digest SHA-256 seluruh byte file sumber
+
+    Returns:
+        str: Misalnya "compact-r2:974305d0410d80a2"
+    """
+    return f"{schema}:{source_hash[:16]}"
+
+
+def _register_frame(df, path, schema, filter_index=None, cube=None):
+    """
+    Membangun indeks filter dan cube agregat serta mencatat versi dataset untuk
+    frame hasil load
+
+    Versi dataset diturunkan dari hash isi file sumber sehingga sama di semua
+    worker dan dapat dipakai sebagai bagian kunci cache bersama. Jumlah byte yang
+    tercakup versi dicatat sebagai "source_size", dan objek hash-nya (jika file
+    di-hash di sini) sebagai "source_hasher", agar refresh live dapat melanjutkan
+    hash tanpa membaca ulang file. Indeks dan cube yang sudah dibangun saat ingest
+    per chunk dipakai langsung.
+    """
+    snapshot_path = snapshot_path_for(path)
+    meta = read_snapshot_meta(snapshot_path)
+    if is_snapshot_valid(meta, path, schema, snapshot_path):
+        source_hash = meta["source"]["sha256"]
+        source_size = meta["source"]["size"]
+    else:
+        hasher, source_size = file_hasher(path)
+        source_hash = hasher.hexdigest()
+        attach(df, "source_hasher", hasher)
+
+    attach(df, "version", content_version(schema, source_hash))
+    attach(df, "source_size", source_size)
+    build_filter_index(df, cache_size=FILTER_CACHE_SIZE, index=filter_index)
+    build_cube(df, cube=cube)
+    return df
+
+
+def get_dataset_version(df):
+    """
+    Mengambil versi dataset untuk frame hasil load_data()
+
+    Args:
+        df (DataFrame): DataFrame berisi data layoffs
+
+    Returns:
+        str: Versi dataset, atau None untuk frame yang tidak berasal dari load_data()
+    """
+    return lookup(df, "version")
+
+
+def append_frame(df, delta, version):
+    """
+    Menambahkan baris baru ke frame hasil load_data() tanpa memproses ulang baris lama
+
+    Kolom categorical digabung dengan kategori terurut (setara compact_frame pada
+    seluruh data), indeks filter disambung per bitmap, dan cube digabung di tingkat
+    sel. Frame lama tidak diubah.
+
+    Args:
+        df (DataFrame): Frame terdaftar hasil load_data()
+        delta (DataFrame): Baris baru yang sudah diproses dengan skema yang sama
+        version (str): Versi dataset untuk frame gabungan
+
+    Returns:
+        DataFrame: Frame gabungan yang terdaftar (indeks, cube, dan versi)
+    """
+    data = {}
+    for col in df.columns:
+        left, right = df[col], delta[col]
+        if isinstance(left.dtype, pd.CategoricalDtype) and not left.cat.ordered:
+            data[col] = union_categoricals([left, right], sort_categories=True)
+        else:
+            data[col] = pd.concat([left, right], ignore_index=True).array
+    merged = pd.DataFrame(data, columns=df.columns, copy=False)
+
+    attach(merged, "version", version)
+    index = get_filter_index(df)
+    if index is not None:
+        delta_index = FilterIndex(delta, cache_size=index.views.maxsize)
+        build_filter_index(merged, index=index.append(delta_index))
+    else:
+        build_filter_index(merged, cache_size=FILTER_CACHE_SIZE)
+    cube = get_cube(df)
+    if cube is not None:
+        build_cube(merged, cube=cube.merge(AggregateCube(delta), merged))
+    else:
+        build_cube(merged)
+    return merged
+
+
+def _process_csv(path):
+    """
+    Membaca dan pra-proses CSV layoffs dari teks
+
+    Args:
+        path (str): Path file CSV dataset (atau buffer berisi teks CSV)
+
+    Returns:
+        DataFrame: DataFrame yang telah diproses
+    """
+    return prepare_frame(pd.read_csv(path))
 
-    # Konversi kolom date menjadi datetime
-    df["date"] = pd.to_datetime(df["date"], errors="coerce")
+
+def prepare_frame(df):
+    """
+    Pra-proses frame mentah hasil pembacaan CSV layoffs (diubah di tempat)
+
+    Args:
+        df (DataFrame): Frame dengan kolom-kolom CSV layoffs
+
+    Returns:
+        DataFrame: DataFrame yang telah diproses
+    """
+    for col, values in derive_dates(df["date"]).items():
+        df[col] = values
 
     # Mengisi nilai NaN dengan 0 untuk kolom numerik
-    numeric_cols = ["total_laid_off", "percentage_laid_off", "funds_raised"]
-    for col in numeric_cols:
+    for col in NUMERIC_COLUMNS:
         df[col] = pd.to_numeric(df[col], errors="coerce")
 
-    # Ekstrak tahun dan bulan dari date
-    df["year"] = df["date"].dt.year
-    df["month"] = df["date"].dt.month
-    df["month_name"] = df["date"].dt.strftime("%b")
-    df["year_month"] = df["date"].dt.strftime("%Y-%m")
-
     return df
 
 
+def derive_dates(dates):
+    """
+    Parse kolom date dan turunkan kolom periode
+
+    Setiap string tanggal unik di-parse sekali dengan DATE_FORMAT lalu hasilnya
+    dipetakan kembali ke semua baris lewat kode faktorisasi. Nilai yang tidak
+    cocok dengan format dicoba lagi dengan inferensi pandas. Periode disimpan
+    sebagai integer (year_month = tahun * 12 + bulan - 1, month_name berupa kode
+    categorical); label tampilan baru dibuat saat render.
+
+    Args:
+        dates (Series): Kolom date mentah (string)
+
+    Returns:
+        dict: Kolom date, year, month, month_name, dan year_month
+    """
+    codes, uniques = pd.factorize(dates)
+    parsed = pd.to_datetime(uniques, format=DATE_FORMAT, errors="coerce")
+    retry = parsed.isna()
+    if retry.any():
+        values = parsed.to_numpy(copy=True)
+        values[retry] = pd.to_datetime(
+            uniques[retry], format="mixed", errors="coerce"
+        ).to_numpy()
+        parsed = pd.DatetimeIndex(values)
+
+    year = pd.array(parsed.year, dtype="Int16")
+    month = pd.array(parsed.month, dtype="Int8")
+    period = year.astype("Int32") * 12 + (month.astype("Int32") - 1)
+    month_codes = (month.astype("Int16") - 1).to_numpy(dtype=np.int8, na_value=-1)
+
+    # Kode -1 (tanggal kosong) menjadi NaT / <NA>
+    return {
+        "date": parsed.array.take(codes, allow_fill=True),
+        "year": year.take(codes, allow_fill=True),
+        "month": month.take(codes, allow_fill=True),
+        "month_name": pd.Categorical.from_codes(
+            np.append(month_codes, np.int8(-1))[codes],
+            categories=MONTH_NAMES,
+            ordered=True,
+        ),
+        "year_month": period.take(codes, allow_fill=True),
+    }
+
+
+class _CategoryEncoder:
+    """Kode integer stabil untuk nilai teks yang bertambah antar chunk"""
+
+    def __init__(self):
+        self.codes = {}
+        self.values = []
+
+    def encode(self, values):
+        """Mengodekan satu chunk (urutan kemunculan pertama, -1 untuk NaN)"""
+        local_codes, uniques = pd.factorize(values, use_na_sentinel=True)
+        mapping = np.empty(len(uniques) + 1, dtype=np.int32)
+        for local, value in enumerate(uniques):
+            code = self.codes.get(value)
+            if code is None:
+                code = self.codes[value] = len(self.values)
+                self.values.append(value)
+            mapping[local] = code
+        mapping[-1] = -1
+        return mapping[local_codes]
+
+    def finalize(self):
+        """
+        Mengurutkan kategori seperti compact_frame
+
+        Returns:
+            tuple: (kategori terurut, array pemetaan kode lama -> kode baru;
+                indeks -1 dipetakan ke -1)
+        """
+        values = np.empty(len(self.values), dtype=object)
+        values[:] = self.values
+        order = np.argsort(values, kind="stable")
+        remap = np.full(len(values) + 1, -1, dtype=np.int32)
+        remap[order] = np.arange(len(values), dtype=np.int32)
+        return pd.Index(values[order], dtype=object), remap
+
+
+def _ingest_csv_chunked(path, chunksize):
+    """
+    Membaca CSV per chunk langsung ke skema ringkas dengan memori terbatas
+
+    Setiap chunk dikonversi tipenya, diturunkan kolom tanggalnya, lalu hanya
+    disimpan sebagai kode dan array numerik. Indeks filter dan cube agregat
+    dibangun bertahap dari chunk yang sama, sehingga teks mentah tidak pernah
+    dimuat sekaligus. Hasilnya setara dengan compact_frame(_process_csv(path)).
+
+    Args:
+        path (str): Path file CSV dataset
+        chunksize (int): Jumlah baris per chunk (dibulatkan ke kelipatan 8)
+
+    Returns:
+        tuple: (DataFrame ringkas, {"filter_index": ..., "cube": ...})
+    """
+    # Bitmap indeks disambung per byte, jadi ukuran chunk harus kelipatan 8
+    chunksize = max(8, -(-int(chunksize) // 8) * 8)
+
+    encoders = {col: _CategoryEncoder() for col in CATEGORICAL_COLUMNS}
+    parts = {}
+    index_builder = FilterIndexBuilder()
+    cube_builder = CubeBuilder()
+
+    reader = pd.read_csv(
+        path, chunksize=chunksize, dtype={col: str for col in CATEGORICAL_COLUMNS}
+    )
+    columns = None
+    for chunk in reader:
+        if columns is None:
+            columns = list(chunk.columns)
+
+        dates = derive_dates(chunk["date"])
+        year = pd.Series(dates["year"])
+        period = dates["year_month"]
+
+        values = {
+            "date": dates["date"].to_numpy(),
+            "year": dates["year"],
+            "month": dates["month"],
+            "month_name": dates["month_name"].codes,
+            "year_month": period,
+        }
+        for col in columns:
+            if col in encoders:
+                values[col] = encoders[col].encode(chunk[col])
+            elif col in NUMERIC_COLUMNS:
+                values[col] = pd.to_numeric(chunk[col], errors="coerce").to_numpy(
+                    dtype=float, na_value=np.nan
+                )
+            elif col not in values:
+                values[col] = chunk[col].to_numpy(dtype=object)
+        for name, value in values.items():
+            parts.setdefault(name, []).append(value)
+
+        index_builder.add_chunk(year, chunk["industry"], chunk["country"])
+        cube_builder.add_chunk(
+            period.fillna(-1).to_numpy(dtype=np.int64),
+            values["industry"],
+            values["country"],
+            values["company"],
+            values["total_laid_off"],
+            values["percentage_laid_off"],
+        )
+
+    data = {}
+    categories = {}
+    remaps = {}
+    for col in columns + ["year", "month", "month_name", "year_month"]:
+        if col in CATEGORICAL_COLUMNS:
+            # Encoder dilepas segera agar kamus nilainya tidak menumpuk
+            categories[col], remaps[col] = encoders.pop(col).finalize()
+            codes = remaps[col][np.concatenate(parts.pop(col))]
+            data[col] = pd.Categorical.from_codes(
+                codes, categories=categories[col], validate=False
+            )
+        elif col == "month_name":
+            data[col] = pd.Categorical.from_codes(
+                np.concatenate(parts.pop(col)), categories=MONTH_NAMES, ordered=True
+            )
+        elif col in ("year", "month", "year_month"):
+            parts_series = [pd.Series(part, copy=False) for part in parts.pop(col)]
+            data[col] = pd.concat(parts_series, ignore_index=True).array
+        else:
+            data[col] = np.concatenate(parts.pop(col))
+    df = pd.DataFrame(data, columns=list(data), copy=False)
+
+    cube = cube_builder.build(
+        categories["industry"],
+        categories["country"],
+        categories["company"],
+        remaps={col: remaps[col] for col in ("industry", "country", "company")},
+    )
+    return df, {
+        "filter_index": index_builder.build(cache_size=FILTER_CACHE_SIZE),
+        "cube": cube,
+    }
+
+
+def compact_frame(df):
+    """
+    Mengubah frame hasil pra-proses ke skema ringkas
+
+    Kolom teks menjadi categorical dengan tabel kode terurut (stabil). Kolom
+    periode (year, month, month_name, year_month) sudah ringkas sejak
+    prepare_frame().
+
+    Args:
+        df (DataFrame): DataFrame hasil pra-proses
+
+    Returns:
+        DataFrame: DataFrame dengan skema ringkas
+    """
+    compact_df = df.copy()
+
+    for col in CATEGORICAL_COLUMNS:
+        categories = sorted(compact_df[col].dropna().unique())
+        compact_df[col] = pd.Categorical(compact_df[col], categories=categories)
+
+    return compact_df
+
+
+def year_month_to_datetime(year_month):
+    """
+    Mengubah nilai year_month menjadi datetime awal bulan
+
+    Mendukung kode periode integer (skema ringkas) maupun string "YYYY-MM".
+
+    Args:
+        year_month (Series): Kolom year_month
+
+    Returns:
+        Series: Datetime awal bulan
+    """
+    if pd.api.types.is_integer_dtype(year_month.dtype):
+        periods = pd.Series(year_month, copy=False)
+        return pd.to_datetime(
+            pd.DataFrame({"year": periods // 12, "month": periods % 12 + 1, "day": 1})
+        )
+    return pd.to_datetime(year_month)
+
+
 def get_filter_options(df):
     """
     Mendapatkan nilai unik untuk opsi filter
@@ -39,18 +483,71 @@ def get_filter_options(df):
     Returns:
         tuple: (available_years, available_industries, available_countries)
     """
-    available_years = sorted(df["year"].dropna().unique())
+    available_years = sorted(int(year) for year in df["year"].dropna().unique())
     available_industries = sorted(df["industry"].dropna().unique())
     available_countries = sorted(df["country"].dropna().unique())
-    available_countries.insert(0,"Non-US")
+    available_countries.insert(0, "Non-US")
 
     return available_years, available_industries, available_countries
 
 
+def filter_signature(years=None, industries=None, countries=None):
+    """
+    Menormalkan pilihan filter menjadi kunci yang stabil dan hashable
+
+    Tahun direduksi menjadi rentang (min, max), industri dan negara diurutkan,
+    dan pilihan "Non-US" dikanonikalisasi: "Non-US" tanpa "United States" berarti
+    semua negara selain AS, sedangkan keduanya sekaligus berarti tanpa filter negara.
+
+    Args:
+        years (list): Daftar tahun untuk filter
+        industries (list): Daftar industri untuk filter
+        countries (list): Daftar negara untuk filter
+
+    Returns:
+        tuple: (years, industries, countries), tiap elemen None jika tidak difilter
+    """
+    year_range = (min(years), max(years)) if years else None
+    industry_key = tuple(sorted(set(industries))) if industries else None
+
+    country_key = None
+    if countries:
+        if NON_US in countries and US_COUNTRY not in countries:
+            country_key = (NON_US,)
+        elif NON_US not in countries:
+            country_key = tuple(sorted(set(countries)))
+
+    return year_range, industry_key, country_key
+
+
+def filter_signature_from_store(filter_data):
+    """
+    Membuat signature filter dari isi filter-store
+
+    Args:
+        filter_data (dict): Data dari dcc.Store "filter-store" (boleh None)
+
+    Returns:
+        tuple: Signature filter hasil filter_signature()
+    """
+    filter_data = filter_data or {}
+    return filter_signature(
+        filter_data.get("years"),
+        filter_data.get("industries"),
+        filter_data.get("countries"),
+    )
+
+
 def apply_filters(df, years=None, industries=None, countries=None):
     """
     Menerapkan filter ke DataFrame
 
+    Jika frame memiliki indeks bitmap (dibangun oleh load_data), filter di-resolve
+    lewat indeks menjadi satu take() tanpa menyalin frame, dan hasilnya disimpan di
+    cache LRU per signature filter sehingga dipakai bersama oleh semua visualisasi.
+    Hasil tanpa filter adalah frame asli itu sendiri, jadi hasil filter tidak boleh
+    dimodifikasi.
+
     Args:
         df (DataFrame): DataFrame berisi data layoffs
         years (list): Daftar tahun untuk filter
@@ -60,6 +557,15 @@ def apply_filters(df, years=None, industries=None, countries=None):
     Returns:
         DataFrame: DataFrame yang telah difilter
     """
+    index = get_filter_index(df)
+    if index is not None:
+        signature = filter_signature(years, industries, countries)
+        if signature == (None, None, None):
+            return df
+        return index.views.get_or_compute(
+            signature, lambda: df.take(index.select(*signature))
+        )
+
     filtered_df = df.copy()
 
     if years:
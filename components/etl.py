@@ -0,0 +1,351 @@
+"""
+ETL dataset layoffs: data/layoffs_dirty.csv -> data/layoffs_etl.csv + snapshot
+
+Menggantikan sel ad hoc di data/data_processing.ipynb dengan langkah yang dapat
+diulang:
+- file sumber dipotong per blok byte pada batas record (tanda kutip seimbang)
+  dan tiap blok di-parse serta dibersihkan di process pool,
+- pembersihan memakai operasi string vektor: spasi di-trim, string kosong
+  menjadi NaN, "$17" / "1,200" / "95%" menjadi angka,
+- validasi skema: kolom wajib harus ada di header; baris dengan kolom wajib
+  kosong, angka/tanggal tak valid, atau nilai di luar rentang dibuang dan
+  dihitung per alasan. REQUIRED_COLUMNS lebih luas dari dropna 6 kolom di
+  notebook (company, date, dan country juga wajib), sehingga hasilnya dapat
+  berisi lebih sedikit baris,
+- duplikat dibuang berdasarkan hash 64-bit baris yang sudah bersih,
+- hasil ditulis sebagai CSV bersih (kolom angka sebagai angka, misalnya
+  funds_raised 402.0 bukan "$402") beserta snapshot kolumnar untuk skema
+  loader, sehingga load_data() berikutnya langsung membaca snapshot.
+
+Secara default hasil ditulis ke ETL_OUTPUT_PATH, bukan ke DATA_PATH:
+data/layoffs_dirty.csv lebih lama dari data/layoffs.csv yang dilayani, sehingga
+menimpanya akan menghilangkan record terbaru. Perbarui file mentah lebih dulu,
+lalu timpa dataset dengan --force.
+
+Contoh:
+    python -m components.etl
+    python -m components.etl --output data/layoffs.csv --force --workers 4
+"""
+
+import argparse
+import io
+import multiprocessing
+import os
+import time
+import uuid
+from collections import Counter, deque
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+import pandas as pd
+
+from config import (
+    COMPACT_SCHEMA,
+    DATA_PATH,
+    DIRTY_DATA_PATH,
+    ETL_OUTPUT_PATH,
+    ETL_WORKERS,
+)
+from components.data_processor import (
+    DATE_FORMAT,
+    compact_frame,
+    dataset_schema,
+    prepare_frame,
+)
+from components.snapshot import write_snapshot
+
+# Tipe setiap kolom keluaran (urutan kolom CSV bersih mengikuti dict ini)
+SCHEMA = {
+    "company": "text",
+    "location": "text",
+    "total_laid_off": "count",
+    "date": "date",
+    "percentage_laid_off": "percent",
+    "industry": "text",
+    "source": "text",
+    "stage": "text",
+    "funds_raised": "currency",
+    "country": "text",
+    "date_added": "date",
+}
+
+# Kolom yang tidak boleh kosong (sama dengan dropna di notebook, ditambah kolom
+# yang dipakai dashboard untuk filter)
+REQUIRED_COLUMNS = [
+    "company",
+    "location",
+    "total_laid_off",
+    "date",
+    "percentage_laid_off",
+    "industry",
+    "stage",
+    "source",
+    "country",
+]
+
+# Rentang nilai yang valid untuk kolom numerik (inklusif)
+VALUE_RANGES = {
+    "total_laid_off": (0, None),
+    "percentage_laid_off": (0, 100),
+    "funds_raised": (0, None),
+}
+
+# Karakter yang dibuang sebelum konversi angka
+NUMBER_NOISE = {
+    "count": r"[,\s]",
+    "percent": r"[%,\s]",
+    "currency": r"[$,\s]",
+}
+
+# Ukuran blok byte per tugas worker
+DEFAULT_CHUNK_BYTES = 4 * 1024 * 1024
+
+
+def validate_header(columns):
+    """
+    Memastikan semua kolom skema ada di header file sumber
+
+    Args:
+        columns (list): Nama kolom file sumber
+
+    Raises:
+        ValueError: Jika ada kolom skema yang tidak ditemukan
+    """
+    missing = [name for name in SCHEMA if name not in columns]
+    if missing:
+        raise ValueError(f"Kolom tidak ditemukan di file sumber: {', '.join(missing)}")
+
+
+def _record_boundary(data):
+    """Posisi setelah newline terakhir yang berada di luar tanda kutip"""
+    raw = np.frombuffer(data, dtype=np.uint8)
+    inside_quotes = np.cumsum(raw == ord('"')) % 2 == 1
+    ends = np.flatnonzero((raw == ord("\n")) & ~inside_quotes)
+    return int(ends[-1]) + 1 if len(ends) else 0
+
+
+def iter_blocks(path, chunk_bytes=DEFAULT_CHUNK_BYTES):
+    """
+    Memotong file CSV menjadi blok berisi record utuh
+
+    Args:
+        path (str): Path file CSV sumber
+        chunk_bytes (int): Perkiraan ukuran blok dalam byte
+
+    Yields:
+        tuple: (baris header, blok byte tanpa header)
+    """
+    with open(path, "rb") as handle:
+        header = handle.readline()
+        carry = b""
+        for block in iter(lambda: handle.read(chunk_bytes), b""):
+            data = carry + block
+            end = _record_boundary(data)
+            if end:
+                yield header, data[:end]
+            carry = data[end:]
+        if carry.strip():
+            yield header, carry
+
+
+def _parse_number(series, kind):
+    """Mengubah teks angka ("$17", "95%", "1,200") menjadi float; tak valid -> NaN"""
+    cleaned = series.str.replace(NUMBER_NOISE[kind], "", regex=True)
+    return pd.to_numeric(cleaned, errors="coerce")
+
+
+def clean_frame(raw):
+    """
+    Membersihkan dan memvalidasi satu potongan data mentah
+
+    Args:
+        raw (DataFrame): Potongan CSV sumber yang dibaca dengan dtype=str
+
+    Returns:
+        tuple: (frame bersih, hash baris uint64, Counter baris dibuang per alasan)
+    """
+    clean = {}
+    invalid = {}
+    for name, kind in SCHEMA.items():
+        text = raw[name].str.strip()
+        text = text.mask(text == "")
+        present = text.notna()
+        if kind in NUMBER_NOISE:
+            value = _parse_number(text, kind)
+            invalid[name] = present & value.isna()
+            low, high = VALUE_RANGES.get(name, (None, None))
+            if low is not None:
+                invalid[name] |= value < low
+            if high is not None:
+                invalid[name] |= value > high
+        else:
+            value = text
+            if kind == "date":
+                parsed = pd.to_datetime(text, format=DATE_FORMAT, errors="coerce")
+                invalid[name] = present & parsed.isna()
+        clean[name] = value
+
+    clean = pd.DataFrame(clean)
+    dropped = Counter()
+    keep = np.ones(len(clean), dtype=bool)
+
+    for name, mask in invalid.items():
+        mask = mask.to_numpy()
+        dropped[f"invalid_{name}"] += int((keep & mask).sum())
+        keep &= ~mask
+    missing = clean[REQUIRED_COLUMNS].isna().any(axis=1).to_numpy()
+    dropped["missing_required"] += int((keep & missing).sum())
+    keep &= ~missing
+
+    clean = clean[keep].reset_index(drop=True)
+    hashes = pd.util.hash_pandas_object(clean, index=False).to_numpy()
+    return clean, hashes, +dropped
+
+
+def _clean_block(task):
+    """Tugas worker: parse satu blok byte lalu bersihkan"""
+    header, block = task
+    raw = pd.read_csv(io.BytesIO(header + block), dtype=str, keep_default_na=False)
+    return len(raw), clean_frame(raw)
+
+
+def _ordered_map(func, tasks, workers):
+    """map() berurutan dengan paling banyak 2 x workers tugas yang tertunda"""
+    if workers <= 1:
+        yield from map(func, tasks)
+        return
+
+    context = multiprocessing.get_context("spawn")
+    with ProcessPoolExecutor(max_workers=workers, mp_context=context) as pool:
+        pending = deque()
+        for task in tasks:
+            pending.append(pool.submit(func, task))
+            if len(pending) >= 2 * workers:
+                yield pending.popleft().result()
+        while pending:
+            yield pending.popleft().result()
+
+
+def _write_csv(df, path):
+    """Menulis CSV lewat file sementara lalu rename (atomik)"""
+    directory = os.path.dirname(os.path.abspath(path))
+    tmp_path = os.path.join(directory, f".tmp-{uuid.uuid4().hex}.csv")
+    try:
+        df.to_csv(tmp_path, index=False)
+        os.replace(tmp_path, path)
+    finally:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+
+
+def run_etl(
+    source=DIRTY_DATA_PATH,
+    output=ETL_OUTPUT_PATH,
+    workers=ETL_WORKERS,
+    chunk_bytes=DEFAULT_CHUNK_BYTES,
+    compact=COMPACT_SCHEMA,
+    snapshot=True,
+    force=False,
+):
+    """
+    Menjalankan ETL dari file mentah ke dataset yang dilayani dashboard
+
+    Args:
+        source (str): Path CSV mentah
+        output (str): Path CSV bersih
+        workers (int): Jumlah proses worker; 0 = jumlah core
+        chunk_bytes (int): Perkiraan ukuran blok byte per tugas
+        compact (bool): Skema snapshot yang ditulis (sama dengan load_data())
+        snapshot (bool): Tulis snapshot kolumnar di samping CSV bersih
+        force (bool): Izinkan menimpa DATA_PATH (dataset yang dilayani)
+
+    Returns:
+        dict: Ringkasan (rows_in, rows_out, duplicates, dropped, seconds)
+
+    Raises:
+        ValueError: Jika output adalah DATA_PATH dan force=False
+    """
+    if not force and os.path.abspath(output) == os.path.abspath(DATA_PATH):
+        raise ValueError(
+            f"{output} adalah dataset yang dilayani; perbarui {source} lalu "
+            "jalankan dengan --force untuk menimpanya"
+        )
+    started = time.perf_counter()
+    validate_header(pd.read_csv(source, nrows=0).columns)
+    workers = workers or os.cpu_count() or 1
+
+    frames, hashes = [], []
+    rows_in = 0
+    dropped = Counter()
+    for rows, (clean, row_hashes, reasons) in _ordered_map(
+        _clean_block, iter_blocks(source, chunk_bytes), workers
+    ):
+        rows_in += rows
+        frames.append(clean)
+        hashes.append(row_hashes)
+        dropped.update(reasons)
+
+    if frames:
+        result = pd.concat(frames, ignore_index=True)
+    else:
+        result = pd.DataFrame({name: pd.Series(dtype=object) for name in SCHEMA})
+    duplicate = pd.Index(np.concatenate(hashes or [[]])).duplicated(keep="first")
+    result = result[~duplicate].reset_index(drop=True)
+
+    _write_csv(result, output)
+    if snapshot:
+        frame = prepare_frame(result.copy())
+        if compact:
+            frame = compact_frame(frame)
+        write_snapshot(frame, output, schema=dataset_schema(compact))
+
+    return {
+        "rows_in": rows_in,
+        "rows_out": len(result),
+        "duplicates": int(duplicate.sum()),
+        "dropped": dict(sorted(dropped.items())),
+        "workers": workers,
+        "seconds": round(time.perf_counter() - started, 3),
+    }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="ETL data layoffs mentah")
+    parser.add_argument("--source", default=DIRTY_DATA_PATH, help="CSV mentah")
+    parser.add_argument("--output", default=ETL_OUTPUT_PATH, help="CSV bersih")
+    parser.add_argument(
+        "--workers", type=int, default=ETL_WORKERS, help="Jumlah proses (0 = core)"
+    )
+    parser.add_argument(
+        "--chunk-bytes", type=int, default=DEFAULT_CHUNK_BYTES, help="Byte per blok"
+    )
+    parser.add_argument(
+        "--no-snapshot", action="store_true", help="Jangan tulis snapshot kolumnar"
+    )
+    parser.add_argument(
+        "--force", action="store_true", help=f"Izinkan menimpa {DATA_PATH}"
+    )
+    args = parser.parse_args(argv)
+
+    try:
+        summary = run_etl(
+            args.source,
+            args.output,
+            workers=args.workers,
+            chunk_bytes=args.chunk_bytes,
+            snapshot=not args.no_snapshot,
+            force=args.force,
+        )
+    except ValueError as exc:
+        parser.error(str(exc))
+    print(
+        f"{summary['rows_out']} dari {summary['rows_in']} baris ditulis ke "
+        f"{args.output} ({summary['workers']} worker, {summary['seconds']} s)"
+    )
+    print(f"duplikat: {summary['duplicates']}")
+    for reason, count in summary["dropped"].items():
+        print(f"{reason}: {count}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,186 @@
+"""
+Eksekusi paralel pembangunan figure untuk satu perubahan filter
+
+Figure tren, peta, dan treemap saling independen, sehingga dibangun bersamaan
+di thread pool. Waktu respons mendekati figure yang paling lambat, bukan jumlah
+semuanya. Pekerjaan berat (treemap) dapat dipindah ke process pool agar tidak
+berebut GIL dengan figure lain. Setiap proses worker memuat dataset sendiri
+sekali saat dibuat, sehingga per request yang dikirim hanya signature filter dan
+versi dataset, bukan frame-nya.
+"""
+
+import contextvars
+import multiprocessing
+import threading
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+
+# Dataset milik proses worker di process pool (diisi _init_worker)
+_worker_data = {}
+
+# Set ident thread pool yang sedang menjalankan tugas pemanggil; diisi hanya jika
+# pemanggil memasang set (misalnya sampler profiling callback)
+job_threads = contextvars.ContextVar("figure_job_threads", default=None)
+
+
+def _run_job(job):
+    """Menjalankan satu tugas dan mencatat thread-nya di job_threads selama berjalan"""
+    threads = job_threads.get()
+    if threads is None:
+        return job()
+    ident = threading.get_ident()
+    threads.add(ident)
+    try:
+        return job()
+    finally:
+        threads.discard(ident)
+
+
+def _init_worker(data_path):
+    """Initializer process pool: memuat dataset sekali per proses worker"""
+    from components.data_processor import load_data
+
+    _worker_data["path"] = data_path
+    _worker_data["df"] = load_data(data_path)
+    _worker_data["unavailable"] = None
+
+
+def _run_on_worker_data(func, signature, version):
+    """
+    Menjalankan func pada dataset worker yang difilter dengan signature
+
+    Dataset dimuat ulang jika versinya berbeda dari versi pemanggil (misalnya
+    setelah data di-append). Mengembalikan None jika load_data() tidak
+    menghasilkan versi tersebut; versi itu dicatat agar tidak dimuat ulang lagi.
+    """
+    from components.data_processor import apply_filters, get_dataset_version, load_data
+
+    df = _worker_data["df"]
+    if get_dataset_version(df) != version:
+        if _worker_data["unavailable"] == version:
+            return None
+        df = _worker_data["df"] = load_data(_worker_data["path"])
+        if get_dataset_version(df) != version:
+            _worker_data["unavailable"] = version
+            return None
+    return func(apply_filters(df, *signature))
+
+
+class FigureExecutor:
+    """Menjalankan builder figure secara bersamaan dengan jumlah worker terbatas"""
+
+    def __init__(self, workers=1, mode="thread", data_path=None):
+        self.workers = max(int(workers), 1)
+        self.mode = mode
+        self.data_path = data_path
+        # Versi dataset yang tidak dapat dimuat worker process pool
+        self._unavailable_version = None
+        self._threads = None
+        self._processes = None
+        self._lock = threading.Lock()
+        if self.workers > 1:
+            self._threads = ThreadPoolExecutor(
+                max_workers=self.workers, thread_name_prefix="figure"
+            )
+
+    def run(self, jobs):
+        """
+        Menjalankan sekumpulan builder dan menunggu semuanya selesai
+
+        Args:
+            jobs (dict): Nama figure -> fungsi tanpa argumen
+
+        Returns:
+            dict: Nama figure -> hasil fungsi
+        """
+        if self._threads is None or len(jobs) < 2:
+            return {name: job() for name, job in jobs.items()}
+
+        # Context disalin per tugas agar metrik fase tetap tercatat untuk callback-nya
+        futures = {
+            name: self._threads.submit(contextvars.copy_context().run, _run_job, job)
+            for name, job in jobs.items()
+        }
+        return {name: future.result() for name, future in futures.items()}
+
+    def run_heavy(self, func, df, signature, filtered_df):
+        """
+        Menjalankan func(frame terfilter), di process pool jika mode="process"
+
+        Di process pool hanya signature dan versi dataset yang di-pickle; worker
+        memfilter dataset miliknya sendiri. Tanpa data_path, untuk frame tanpa
+        versi, atau jika worker tidak dapat memuat versi tersebut, func dijalankan
+        di thread pemanggil. Versi yang gagal dimuat worker diingat sehingga
+        request berikutnya dengan versi yang sama langsung memakai thread.
+
+        Args:
+            func (callable): Fungsi tingkat modul (harus dapat di-pickle)
+            df (DataFrame): Dataset pemanggil (untuk versinya)
+            signature (tuple): (years, industries, countries) hasil filter_signature()
+            filtered_df (callable): Fungsi tanpa argumen yang mengembalikan hasil
+                filter df dengan signature; hanya dipanggil di jalur thread
+
+        Returns:
+            object: Hasil func(filtered_df())
+        """
+        from components.data_processor import get_dataset_version
+
+        version = get_dataset_version(df)
+        if (
+            self.mode != "process"
+            or self.data_path is None
+            or version is None
+            or version == self._unavailable_version
+        ):
+            return func(filtered_df())
+
+        with self._lock:
+            if self._processes is None:
+                # Dibuat saat pertama dipakai (setelah fork worker gunicorn); "spawn"
+                # menghindari fork dari proses yang sudah memiliki thread aktif
+                self._processes = ProcessPoolExecutor(
+                    max_workers=self.workers,
+                    mp_context=multiprocessing.get_context("spawn"),
+                    initializer=_init_worker,
+                    initargs=(self.data_path,),
+                )
+        result = self._processes.submit(
+            _run_on_worker_data, func, signature, version
+        ).result()
+        if result is None:
+            self._unavailable_version = version
+            return func(filtered_df())
+        return result
+
+    def shutdown(self):
+        """Menghentikan pool thread dan proses"""
+        if self._threads is not None:
+            self._threads.shutdown(wait=True)
+        if self._processes is not None:
+            self._processes.shutdown(wait=True)
+            self._processes = None
+
+
+_figure_executor = None
+_figure_executor_lock = threading.Lock()
+
+
+def get_figure_executor():
+    """
+    Mengembalikan executor figure proses ini sesuai konfigurasi
+
+    Pembuatan dijaga lock agar request paralel pertama tidak membuat dua pool.
+
+    Returns:
+        FigureExecutor: Instance executor (dibuat sekali per proses)
+    """
+    global _figure_executor
+    if _figure_executor is not None:
+        return _figure_executor
+    with _figure_executor_lock:
+        if _figure_executor is None:
+            from config import DATA_PATH, FIGURE_EXECUTOR, FIGURE_WORKERS
+
+            _figure_executor = FigureExecutor(
+                FIGURE_WORKERS, FIGURE_EXECUTOR, DATA_PATH
+            )
+    return _figure_executor
@@ -0,0 +1,385 @@
+"""
+Spesifikasi figure sebagai dict biasa (tanpa validasi objek Plotly)
+
+Setiap figure disusun dari kerangka tetap (layout, style, hovertemplate, dan
+template yang diserialisasi sekali) lalu hanya array datanya yang diganti per
+request. Hasilnya dict JSON-ready yang identik dengan keluaran jalur Plotly
+(make_subplots / px.choropleth / px.treemap) namun tanpa biaya validator dan
+object graph Plotly. Kesetaraannya diuji di tests/test_figure_specs.py.
+"""
+
+import json
+import math
+from functools import lru_cache
+
+import numpy as np
+import pandas as pd
+
+from components.colors import Colors
+
+
+@lru_cache(maxsize=None)
+def get_template(name):
+    """
+    Mengambil template Plotly dalam bentuk dict (diserialisasi sekali per proses)
+
+    Args:
+        name (str): Nama template, misalnya "plotly" atau "plotly_white"
+
+    Returns:
+        dict: Template siap dipakai di layout.template (jangan dimodifikasi)
+    """
+    import plotly.io as pio
+    from plotly.utils import PlotlyJSONEncoder
+
+    return json.loads(json.dumps(pio.templates[name], cls=PlotlyJSONEncoder))
+
+
+def to_list(values):
+    """Mengubah array numerik menjadi list Python dengan NaN menjadi None"""
+    array = np.asarray(values, dtype=float)
+    result = array.tolist()
+    if np.isnan(array).any():
+        result = [None if math.isnan(value) else value for value in result]
+    return result
+
+
+def to_date_strings(values):
+    """Mengubah array datetime menjadi string ISO seperti keluaran Plotly"""
+    array = np.asarray(values, dtype="datetime64[s]")
+    return np.datetime_as_string(array, unit="s").tolist()
+
+
+def figure_to_json(fig):
+    """
+    Serialisasi figure (dict biasa atau objek Figure Plotly) ke JSON
+
+    Args:
+        fig (dict | Figure): Figure yang akan diserialisasi
+
+    Returns:
+        str: Figure dalam format JSON
+    """
+    if isinstance(fig, dict):
+        return json.dumps(fig, separators=(",", ":"))
+    return fig.to_json()
+
+
+def trend_figure(monthly_data):
+    """
+    Figure tren layoffs (garis total layoffs + bar jumlah perusahaan)
+
+    Args:
+        monthly_data (DataFrame): Kolom year_month_date, total_layoffs, companies
+
+    Returns:
+        dict: Figure dengan dua sumbu y
+    """
+    x = to_date_strings(monthly_data["year_month_date"])
+    return {
+        "data": [
+            {
+                "line": {"color": Colors.VIZ_PRIMARY_LINE, "width": 3},
+                "marker": {"size": 8},
+                "mode": "lines+markers",
+                "name": "Total Layoffs",
+                "x": x,
+                "y": to_list(monthly_data["total_layoffs"]),
+                "type": "scatter",
+                "xaxis": "x",
+                "yaxis": "y",
+            },
+            {
+                "marker": {"color": Colors.VIZ_SECONDARY_BAR, "opacity": 0.6},
+                "name": "Total Companies",
+                "x": x,
+                "y": monthly_data["companies"].astype(int).tolist(),
+                "type": "bar",
+                "xaxis": "x",
+                "yaxis": "y2",
+            },
+        ],
+        "layout": {
+            "template": get_template("plotly_white"),
+            "xaxis": {
+                "anchor": "y",
+                "domain": [0.0, 0.94],
+                "title": {"text": "Months"},
+                "tickformat": "%b %Y",
+                "tickangle": -45,
+                "gridcolor": Colors.VIZ_GRID,
+            },
+            "yaxis": {
+                "anchor": "x",
+                "domain": [0.0, 1.0],
+                "title": {"text": "Total Layoffs"},
+                "gridcolor": Colors.VIZ_GRID,
+            },
+            "yaxis2": {
+                "anchor": "x",
+                "overlaying": "y",
+                "side": "right",
+                "title": {"text": "Total Companies"},
+                "gridcolor": Colors.VIZ_GRID,
+            },
+            "legend": {
+                "orientation": "h",
+                "yanchor": "bottom",
+                "y": 1.02,
+                "xanchor": "right",
+                "x": 1,
+            },
+            "margin": {"l": 30, "r": 30, "t": 80, "b": 20},
+            "font": {"color": Colors.TEXT_WHITE},
+            "height": 500,
+            "paper_bgcolor": Colors.BG_CARD,
+            "plot_bgcolor": Colors.TRANSPARENT,
+        },
+    }
+
+
+def map_figure(country_data, hovertemplate):
+    """
+    Figure choropleth tingkat PHK per negara
+
+    Args:
+        country_data (DataFrame): Kolom country, iso3, percentage_layoffs, total_layoffs,
+            companies
+        hovertemplate (str): Hovertemplate untuk trace choropleth
+
+    Returns:
+        dict: Figure choropleth
+    """
+    countries = country_data["country"].astype(object).tolist()
+    locations = country_data["iso3"].astype(object).tolist()
+    customdata = country_data[
+        ["percentage_layoffs", "total_layoffs", "companies"]
+    ].to_numpy(dtype=float)
+    colorscale = Colors.get_map_colorscale()
+
+    return {
+        "data": [
+            {
+                "coloraxis": "coloraxis",
+                "customdata": [to_list(row) for row in customdata],
+                "geo": "geo",
+                "hovertemplate": hovertemplate,
+                "hovertext": countries,
+                "locationmode": "ISO-3",
+                "locations": locations,
+                "name": "",
+                "z": to_list(country_data["percentage_layoffs"]),
+                "type": "choropleth",
+            }
+        ],
+        "layout": {
+            "template": get_template("plotly"),
+            "geo": {
+                "domain": {"x": [0.0, 1.0], "y": [0.0, 1.0]},
+                "projection": {"type": "natural earth", "scale": 1.2},
+                "center": {"lat": 10, "lon": 0},
+                "showframe": False,
+                "showcoastlines": True,
+                "bgcolor": Colors.BG_CARD,
+            },
+            "coloraxis": {
+                "colorbar": {
+                    "title": {
+                        "text": "Layoff<br>Rate<br>(%)<br>",
+                        "font": {"size": 14, "color": Colors.TEXT_WHITE},
+                    },
+                    "thickness": 15,
+                    "len": 0.8,
+                    "x": 1.02,
+                    "xanchor": "left",
+                    "y": 0.5,
+                    "yanchor": "middle",
+                },
+                "colorscale": [
+                    [i / (len(colorscale) - 1), color]
+                    for i, color in enumerate(colorscale)
+                ],
+                "cmin": 0,
+                "cmax": 100,
+            },
+            "legend": {"tracegroupgap": 0},
+            "margin": {"t": 20, "l": 20, "r": 20, "b": 0},
+            "title": {
+                "font": {"size": 24, "color": Colors.TEXT_WHITE},
+                "y": 0.95,
+                "x": 0.5,
+                "xanchor": "center",
+                "yanchor": "top",
+            },
+            "font": {"color": Colors.TEXT_WHITE},
+            "paper_bgcolor": Colors.BG_CARD,
+            "plot_bgcolor": Colors.BG_CARD,
+        },
+    }
+
+
+def empty_treemap_figure():
+    """
+    Figure kosong untuk treemap ketika filter tidak menghasilkan data
+
+    Returns:
+        dict: Figure tanpa trace dengan anotasi "No data"
+    """
+    return {
+        "data": [],
+        "layout": {
+            "template": get_template("plotly"),
+            "margin": {"l": 1, "r": 1, "t": 0, "b": 1},
+            "xaxis": {"visible": False},
+            "yaxis": {"visible": False},
+            "paper_bgcolor": Colors.BG_CARD,
+            "plot_bgcolor": Colors.BG_CARD,
+            "annotations": [
+                {
+                    "font": {"color": Colors.TEXT_WHITE, "size": 14},
+                    "showarrow": False,
+                    "text": "No data for current filter",
+                    "x": 0.5,
+                    "xref": "paper",
+                    "y": 0.5,
+                    "yref": "paper",
+                }
+            ],
+        },
+    }
+
+
+def treemap_figure(treemap_data, hovertemplate, texttemplate):
+    """
+    Figure treemap industri -> perusahaan
+
+    Node daun (industri/perusahaan) disusun lebih dulu, diikuti node industri
+    dengan nilai hasil penjumlahan daunnya. Warna mengikuti Colors.INDUSTRY_COLORS;
+    industri lain mendapat warna dari colorway template dengan aturan yang sama
+    seperti px.treemap.
+
+    Args:
+        treemap_data (DataFrame): Hasil build_treemap_data()
+        hovertemplate (str): Hovertemplate untuk trace treemap
+        texttemplate (str): Texttemplate untuk trace treemap
+
+    Returns:
+        dict: Figure treemap
+    """
+    if treemap_data.empty:
+        return empty_treemap_figure()
+
+    industries = treemap_data["industry"].astype(str)
+    companies = treemap_data["company"].astype(str)
+    nodes = treemap_data["node"].astype(str)
+    totals = treemap_data["total_layoffs"].astype(float)
+    industry_totals = totals.groupby(industries, sort=False).sum()
+
+    ids = (industries + "/" + nodes).tolist() + industry_totals.index.tolist()
+    labels = companies.tolist() + industry_totals.index.tolist()
+    parents = industries.tolist() + [""] * len(industry_totals)
+    values = totals.tolist() + industry_totals.tolist()
+    node_industries = industries.tolist() + industry_totals.index.tolist()
+
+    # Teks node perusahaan disingkat 4 huruf, node industri tetap utuh
+    company_names = set(companies)
+    text = [label[:4].upper() if label in company_names else label for label in labels]
+
+    colorway = get_template("plotly")["layout"]["colorway"]
+    mapping = dict(Colors.INDUSTRY_COLORS)
+    colors = []
+    for industry in node_industries:
+        if mapping.get(industry) is None:
+            mapping[industry] = colorway[len(mapping) % len(colorway)]
+        colors.append(mapping[industry])
+
+    return {
+        "data": [
+            {
+                "branchvalues": "total",
+                "customdata": [
+                    [value, industry] for value, industry in zip(values, node_industries)
+                ],
+                "domain": {"x": [0.0, 1.0], "y": [0.0, 1.0]},
+                "hovertemplate": hovertemplate,
+                "ids": ids,
+                "labels": labels,
+                "marker": {
+                    "colors": colors,
+                    "line": {"color": Colors.BORDER_WHITE, "width": 0.5},
+                },
+                "name": "",
+                "parents": parents,
+                "values": values,
+                "type": "treemap",
+                "hoverlabel": {
+                    "font": {"family": "Arial, sans-serif", "size": 12},
+                    "bgcolor": Colors.BG_HOVER,
+                    "bordercolor": Colors.TEXT_WHITE,
+                },
+                "textfont": {"size": 10},
+                "text": text,
+                "textposition": "middle center",
+                "texttemplate": texttemplate,
+            }
+        ],
+        "layout": {
+            "template": get_template("plotly"),
+            "legend": {"tracegroupgap": 0},
+            "margin": {"t": 1, "l": 1, "r": 1, "b": 1},
+            "uniformtext": {"minsize": 8, "mode": "hide"},
+            "font": {"color": Colors.TEXT_WHITE},
+            "paper_bgcolor": Colors.TRANSPARENT,
+            "plot_bgcolor": Colors.TRANSPARENT,
+            "autosize": True,
+            "height": 500,
+        },
+    }
+
+
+# Path array data per figure yang dikirim ulang lewat partial update (dash.Patch)
+TREND_DATA_PATHS = [(0, "x"), (0, "y"), (1, "x"), (1, "y")]
+MAP_DATA_PATHS = [(0, "locations"), (0, "z"), (0, "hovertext"), (0, "customdata")]
+TREEMAP_DATA_PATHS = [
+    (0, "ids"),
+    (0, "labels"),
+    (0, "parents"),
+    (0, "values"),
+    (0, "customdata"),
+    (0, "text"),
+    (0, "marker", "colors"),
+]
+
+
+def figure_patch(fig, data_paths, layout_keys=()):
+    """
+    Membuat partial update (dash.Patch) yang hanya berisi array data figure
+
+    Layout, style, dan hovertemplate tidak dikirim ulang karena sudah ada di
+    browser sejak render pertama. Trace yang tidak ada (misalnya treemap kosong)
+    dikirim sebagai array kosong.
+
+    Args:
+        fig (dict): Figure lengkap hasil builder / cache
+        data_paths (list): Daftar path (indeks trace, key, ...) yang diganti
+        layout_keys (iterable): Key layout yang ikut diganti (None -> list kosong)
+
+    Returns:
+        Patch: Partial update untuk properti figure
+    """
+    from dash import Patch
+
+    patch = Patch()
+    for trace_index, *keys in data_paths:
+        value = fig["data"][trace_index] if trace_index < len(fig["data"]) else {}
+        for key in keys:
+            value = value.get(key, {} if key != keys[-1] else [])
+
+        target = patch["data"][trace_index]
+        for key in keys[:-1]:
+            target = target[key]
+        target[keys[-1]] = value
+
+    for key in layout_keys:
+        patch["layout"][key] = fig["layout"].get(key, [])
+    return patch
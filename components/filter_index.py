@@ -0,0 +1,282 @@
+"""
+Indeks bitmap untuk filter tahun, industri, dan negara
+
+Indeks dibangun sekali saat data dimuat. Setiap nilai filter dipetakan ke
+bitmap baris yang dipadatkan (np.packbits), sehingga satu permintaan filter
+cukup di-resolve menjadi OR per dimensi, satu AND antar dimensi, lalu satu
+take() ke DataFrame tanpa menyalin frame penuh.
+"""
+
+from functools import reduce
+
+import numpy as np
+import pandas as pd
+
+from components.cache import LRUCache
+from components.registry import attach, lookup
+
+US_COUNTRY = "United States"
+NON_US = "Non-US"
+
+
+def _value_bitmaps(series):
+    """
+    Membuat bitmap terpadat untuk setiap nilai unik kolom
+
+    Args:
+        series (Series): Kolom yang diindeks
+
+    Returns:
+        dict: {nilai: bitmap np.uint8}
+    """
+    if isinstance(series.dtype, pd.CategoricalDtype):
+        codes = series.cat.codes.to_numpy()
+        uniques = series.cat.categories
+    else:
+        codes, uniques = pd.factorize(series, use_na_sentinel=True)
+
+    n_rows = len(codes)
+    order = np.argsort(codes, kind="stable")
+    bounds = np.searchsorted(codes[order], np.arange(len(uniques) + 1))
+
+    bitmaps = {}
+    for code, value in enumerate(uniques):
+        start, end = bounds[code], bounds[code + 1]
+        if start == end:
+            continue
+        mask = np.zeros(n_rows, dtype=bool)
+        mask[order[start:end]] = True
+        bitmaps[value.item() if hasattr(value, "item") else value] = np.packbits(mask)
+    return bitmaps
+
+
+def _concat_bitmaps(left, n_left, right, n_right):
+    """Menyambung dua bitmap terpadat (None berarti semua nol)"""
+    if left is None:
+        left = np.zeros((n_left + 7) // 8, dtype=np.uint8)
+    if right is None:
+        right = np.zeros((n_right + 7) // 8, dtype=np.uint8)
+    if n_left % 8 == 0:
+        return np.concatenate([left, right])
+    return np.packbits(
+        np.concatenate(
+            [np.unpackbits(left, count=n_left), np.unpackbits(right, count=n_right)]
+        )
+    )
+
+
+class FilterIndex:
+    """Bitmap per tahun, industri, dan negara untuk satu DataFrame"""
+
+    def __init__(self, df, cache_size=64):
+        self._init_bitmaps(
+            len(df),
+            _value_bitmaps(df["year"]),
+            _value_bitmaps(df["industry"]),
+            _value_bitmaps(df["country"]),
+            cache_size,
+        )
+
+    @classmethod
+    def from_bitmaps(cls, n_rows, years, industries, countries, cache_size=64):
+        """
+        Membuat indeks dari bitmap yang sudah jadi (misalnya hasil ingest per chunk)
+
+        Args:
+            n_rows (int): Jumlah baris frame
+            years (dict): {tahun: bitmap}
+            industries (dict): {industri: bitmap}
+            countries (dict): {negara: bitmap}
+            cache_size (int): Jumlah maksimum hasil filter di cache LRU
+
+        Returns:
+            FilterIndex: Indeks baru
+        """
+        index = cls.__new__(cls)
+        index._init_bitmaps(n_rows, years, industries, countries, cache_size)
+        return index
+
+    def append(self, other):
+        """
+        Membuat indeks untuk baris frame ini diikuti baris frame lain
+
+        Hanya bitmap yang disambung; baris lama tidak diindeks ulang. Cache hasil
+        filter indeks baru dimulai kosong.
+
+        Args:
+            other (FilterIndex): Indeks untuk baris tambahan
+
+        Returns:
+            FilterIndex: Indeks gabungan
+        """
+
+        def merge(mine, theirs):
+            return {
+                value: _concat_bitmaps(
+                    mine.get(value), self.n_rows, theirs.get(value), other.n_rows
+                )
+                for value in dict.fromkeys([*mine, *theirs])
+            }
+
+        return FilterIndex.from_bitmaps(
+            self.n_rows + other.n_rows,
+            merge(self.years, other.years),
+            merge(self.industries, other.industries),
+            merge(self.countries, other.countries),
+            self.views.maxsize,
+        )
+
+    def _init_bitmaps(self, n_rows, years, industries, countries, cache_size):
+        self.n_rows = n_rows
+        # Cache hasil filter per signature, dipakai bersama oleh semua callback
+        self.views = LRUCache(cache_size)
+        self.years = years
+        self.industries = industries
+        self.countries = countries
+
+        # Mask Non-US mengikuti semantik query "country != 'United States'"
+        us_bitmap = self.countries.get(US_COUNTRY)
+        if us_bitmap is None:
+            us_bitmap = np.zeros((self.n_rows + 7) // 8, dtype=np.uint8)
+        self.non_us = np.bitwise_not(us_bitmap)
+
+    def _union(self, bitmaps, values):
+        """OR dari bitmap nilai-nilai terpilih (nilai tak dikenal diabaikan)"""
+        selected = [bitmaps[value] for value in values if value in bitmaps]
+        if not selected:
+            return np.zeros((self.n_rows + 7) // 8, dtype=np.uint8)
+        return reduce(np.bitwise_or, selected)
+
+    def select(self, years=None, industries=None, countries=None):
+        """
+        Me-resolve filter menjadi posisi baris
+
+        Args:
+            years (list): Daftar tahun untuk filter (rentang min..max)
+            industries (list): Daftar industri untuk filter
+            countries (list): Daftar negara untuk filter (mendukung "Non-US")
+
+        Returns:
+            ndarray: Posisi baris yang lolos filter, atau None jika tanpa filter
+        """
+        masks = []
+
+        if years:
+            min_year, max_year = min(years), max(years)
+            masks.append(
+                self._union(
+                    self.years,
+                    [year for year in self.years if min_year <= year <= max_year],
+                )
+            )
+
+        if industries:
+            masks.append(self._union(self.industries, industries))
+
+        if countries:
+            if NON_US in countries and US_COUNTRY not in countries:
+                masks.append(self.non_us)
+            elif NON_US not in countries:
+                masks.append(self._union(self.countries, countries))
+
+        if not masks:
+            return None
+
+        combined = reduce(np.bitwise_and, masks)
+        return np.flatnonzero(np.unpackbits(combined, count=self.n_rows))
+
+
+class FilterIndexBuilder:
+    """
+    Membangun FilterIndex bertahap dari chunk baris yang berurutan
+
+    Bitmap tiap chunk disambung per byte, sehingga setiap chunk kecuali yang
+    terakhir harus berukuran kelipatan 8 baris.
+    """
+
+    def __init__(self):
+        self.n_rows = 0
+        self._chunks = []
+
+    def add_chunk(self, years, industries, countries):
+        """
+        Menambahkan bitmap satu chunk
+
+        Args:
+            years (Series): Kolom tahun chunk
+            industries (Series): Kolom industri chunk
+            countries (Series): Kolom negara chunk
+        """
+        if self.n_rows % 8:
+            raise ValueError("Hanya chunk terakhir yang boleh bukan kelipatan 8 baris")
+        self._chunks.append(
+            (
+                (len(years) + 7) // 8,
+                _value_bitmaps(years),
+                _value_bitmaps(industries),
+                _value_bitmaps(countries),
+            )
+        )
+        self.n_rows += len(years)
+
+    def _merge(self, position):
+        """Menyambung bitmap per nilai (chunk tanpa nilai tersebut diisi nol)"""
+        values = dict.fromkeys(
+            value for chunk in self._chunks for value in chunk[position]
+        )
+        return {
+            value: np.concatenate(
+                [
+                    chunk[position].get(value, np.zeros(chunk[0], dtype=np.uint8))
+                    for chunk in self._chunks
+                ]
+            )
+            for value in values
+        }
+
+    def build(self, cache_size=64):
+        """
+        Menyusun FilterIndex dari semua chunk
+
+        Args:
+            cache_size (int): Jumlah maksimum hasil filter di cache LRU
+
+        Returns:
+            FilterIndex: Indeks untuk seluruh baris
+        """
+        return FilterIndex.from_bitmaps(
+            self.n_rows, self._merge(1), self._merge(2), self._merge(3), cache_size
+        )
+
+
+def build_filter_index(df, cache_size=64, index=None):
+    """
+    Membangun dan mendaftarkan indeks bitmap untuk DataFrame
+
+    Frame yang sudah diindeks dianggap immutable; jangan ubah isinya setelah
+    indeks dibangun.
+
+    Args:
+        df (DataFrame): DataFrame berisi data layoffs
+        cache_size (int): Jumlah maksimum hasil filter yang disimpan di cache LRU
+        index (FilterIndex): Indeks yang sudah dibangun untuk frame ini (opsional)
+
+    Returns:
+        FilterIndex: Indeks yang terdaftar untuk frame tersebut
+    """
+    if index is None:
+        index = FilterIndex(df, cache_size=cache_size)
+    return attach(df, "filter_index", index)
+
+
+def get_filter_index(df):
+    """
+    Mengambil indeks bitmap yang terdaftar untuk DataFrame
+
+    Args:
+        df (DataFrame): DataFrame berisi data layoffs
+
+    Returns:
+        FilterIndex: Indeks frame, atau None jika belum diindeks
+    """
+    return lookup(df, "filter_index")
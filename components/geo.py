@@ -0,0 +1,327 @@
+"""
+Geografi untuk peta choropleth
+
+- Nama negara dinormalisasi ke kode ISO 3166-1 alpha-3 sekali saat cube dibangun,
+  sehingga peta memakai locationmode="ISO-3" tanpa pencocokan nama di browser.
+- Topojson dunia Plotly tidak disertakan di repo. Secara default browser
+  mengambilnya dari CDN Plotly, sehingga peta butuh akses ke cdn.plot.ly. File
+  dapat diunduh ke assets/topojson/ (python -m components.geo --download, di
+  mesin yang dapat mengakses CDN) lalu dilayani aplikasi sendiri dengan header
+  cache jangka panjang.
+
+Contoh:
+    python -m components.geo --download
+"""
+
+import argparse
+import os
+import urllib.request
+
+import numpy as np
+
+from config import TOPOJSON_DIR
+
+# Sumber topojson Plotly (dipakai plotly.js jika topojsonURL tidak diatur)
+TOPOJSON_CDN = "https://cdn.plot.ly/"
+
+# Resolusi yang dipakai geo plotly.js (110 default, 50 untuk scope lebih kecil)
+TOPOJSON_FILES = ["world_110m.json", "world_50m.json"]
+
+# URL lokal direktori topojson (assets Dash dilayani di /assets/)
+TOPOJSON_URL = "/assets/topojson/"
+
+# Header cache untuk file topojson (isinya tidak berubah antar rilis Plotly)
+TOPOJSON_CACHE_CONTROL = "public, max-age=31536000"
+
+# Nama negara (termasuk alias umum) -> kode ISO 3166-1 alpha-3
+COUNTRY_ISO3 = {
+    "Afghanistan": "AFG",
+    "Albania": "ALB",
+    "Algeria": "DZA",
+    "Andorra": "AND",
+    "Angola": "AGO",
+    "Antigua and Barbuda": "ATG",
+    "Argentina": "ARG",
+    "Armenia": "ARM",
+    "Australia": "AUS",
+    "Austria": "AUT",
+    "Azerbaijan": "AZE",
+    "Bahamas": "BHS",
+    "Bahrain": "BHR",
+    "Bangladesh": "BGD",
+    "Barbados": "BRB",
+    "Belarus": "BLR",
+    "Belgium": "BEL",
+    "Belize": "BLZ",
+    "Benin": "BEN",
+    "Bermuda": "BMU",
+    "Bhutan": "BTN",
+    "Bolivia": "BOL",
+    "Bosnia and Herzegovina": "BIH",
+    "Botswana": "BWA",
+    "Brazil": "BRA",
+    "Brunei": "BRN",
+    "Bulgaria": "BGR",
+    "Burkina Faso": "BFA",
+    "Burundi": "BDI",
+    "Cambodia": "KHM",
+    "Cameroon": "CMR",
+    "Canada": "CAN",
+    "Cape Verde": "CPV",
+    "Cayman Islands": "CYM",
+    "Central African Republic": "CAF",
+    "Chad": "TCD",
+    "Chile": "CHL",
+    "China": "CHN",
+    "Colombia": "COL",
+    "Comoros": "COM",
+    "Congo": "COG",
+    "Costa Rica": "CRI",
+    "Croatia": "HRV",
+    "Cuba": "CUB",
+    "Cyprus": "CYP",
+    "Czech Republic": "CZE",
+    "Czechia": "CZE",
+    "Democratic Republic of the Congo": "COD",
+    "Denmark": "DNK",
+    "Djibouti": "DJI",
+    "Dominica": "DMA",
+    "Dominican Republic": "DOM",
+    "Ecuador": "ECU",
+    "Egypt": "EGY",
+    "El Salvador": "SLV",
+    "Equatorial Guinea": "GNQ",
+    "Eritrea": "ERI",
+    "Estonia": "EST",
+    "Eswatini": "SWZ",
+    "Ethiopia": "ETH",
+    "Fiji": "FJI",
+    "Finland": "FIN",
+    "France": "FRA",
+    "Gabon": "GAB",
+    "Gambia": "GMB",
+    "Georgia": "GEO",
+    "Germany": "DEU",
+    "Ghana": "GHA",
+    "Gibraltar": "GIB",
+    "Greece": "GRC",
+    "Greenland": "GRL",
+    "Grenada": "GRD",
+    "Guatemala": "GTM",
+    "Guinea": "GIN",
+    "Guinea-Bissau": "GNB",
+    "Guyana": "GUY",
+    "Haiti": "HTI",
+    "Honduras": "HND",
+    "Hong Kong": "HKG",
+    "Hungary": "HUN",
+    "Iceland": "ISL",
+    "India": "IND",
+    "Indonesia": "IDN",
+    "Iran": "IRN",
+    "Iraq": "IRQ",
+    "Ireland": "IRL",
+    "Isle of Man": "IMN",
+    "Israel": "ISR",
+    "Italy": "ITA",
+    "Ivory Coast": "CIV",
+    "Jamaica": "JAM",
+    "Japan": "JPN",
+    "Jordan": "JOR",
+    "Kazakhstan": "KAZ",
+    "Kenya": "KEN",
+    "Kosovo": "XKX",
+    "Kuwait": "KWT",
+    "Kyrgyzstan": "KGZ",
+    "Laos": "LAO",
+    "Latvia": "LVA",
+    "Lebanon": "LBN",
+    "Lesotho": "LSO",
+    "Liberia": "LBR",
+    "Libya": "LBY",
+    "Liechtenstein": "LIE",
+    "Lithuania": "LTU",
+    "Luxembourg": "LUX",
+    "Macau": "MAC",
+    "Madagascar": "MDG",
+    "Malawi": "MWI",
+    "Malaysia": "MYS",
+    "Maldives": "MDV",
+    "Mali": "MLI",
+    "Malta": "MLT",
+    "Mauritania": "MRT",
+    "Mauritius": "MUS",
+    "Mexico": "MEX",
+    "Moldova": "MDA",
+    "Monaco": "MCO",
+    "Mongolia": "MNG",
+    "Montenegro": "MNE",
+    "Morocco": "MAR",
+    "Mozambique": "MOZ",
+    "Myanmar": "MMR",
+    "Namibia": "NAM",
+    "Nepal": "NPL",
+    "Netherlands": "NLD",
+    "New Zealand": "NZL",
+    "Nicaragua": "NIC",
+    "Niger": "NER",
+    "Nigeria": "NGA",
+    "North Korea": "PRK",
+    "North Macedonia": "MKD",
+    "Norway": "NOR",
+    "Oman": "OMN",
+    "Pakistan": "PAK",
+    "Palestine": "PSE",
+    "Panama": "PAN",
+    "Papua New Guinea": "PNG",
+    "Paraguay": "PRY",
+    "Peru": "PER",
+    "Philippines": "PHL",
+    "Poland": "POL",
+    "Portugal": "PRT",
+    "Puerto Rico": "PRI",
+    "Qatar": "QAT",
+    "Romania": "ROU",
+    "Russia": "RUS",
+    "Rwanda": "RWA",
+    "Saudi Arabia": "SAU",
+    "Senegal": "SEN",
+    "Serbia": "SRB",
+    "Seychelles": "SYC",
+    "Sierra Leone": "SLE",
+    "Singapore": "SGP",
+    "Slovakia": "SVK",
+    "Slovenia": "SVN",
+    "Somalia": "SOM",
+    "South Africa": "ZAF",
+    "South Korea": "KOR",
+    "South Sudan": "SSD",
+    "Spain": "ESP",
+    "Sri Lanka": "LKA",
+    "Sudan": "SDN",
+    "Suriname": "SUR",
+    "Sweden": "SWE",
+    "Switzerland": "CHE",
+    "Syria": "SYR",
+    "Taiwan": "TWN",
+    "Tajikistan": "TJK",
+    "Tanzania": "TZA",
+    "Thailand": "THA",
+    "Togo": "TGO",
+    "Trinidad and Tobago": "TTO",
+    "Tunisia": "TUN",
+    "Turkey": "TUR",
+    "Turkmenistan": "TKM",
+    "Uganda": "UGA",
+    "Ukraine": "UKR",
+    "United Arab Emirates": "ARE",
+    "United Kingdom": "GBR",
+    "United States": "USA",
+    "Uruguay": "URY",
+    "Uzbekistan": "UZB",
+    "Venezuela": "VEN",
+    "Vietnam": "VNM",
+    "Yemen": "YEM",
+    "Zambia": "ZMB",
+    "Zimbabwe": "ZWE",
+    # Alias
+    "Korea": "KOR",
+    "Republic of Korea": "KOR",
+    "Russian Federation": "RUS",
+    "Türkiye": "TUR",
+    "UAE": "ARE",
+    "UK": "GBR",
+    "USA": "USA",
+    "United States of America": "USA",
+}
+
+
+def country_iso3(countries):
+    """
+    Memetakan tabel nama negara ke kode ISO-3
+
+    Args:
+        countries (Index): Nama negara (tabel kategori, bukan per baris)
+
+    Returns:
+        ndarray: Kode ISO-3 (object) sejajar dengan countries, None jika tidak dikenal
+    """
+    return np.array(
+        [COUNTRY_ISO3.get(str(name).strip()) for name in countries], dtype=object
+    )
+
+
+def has_local_topojson(directory=TOPOJSON_DIR):
+    """Apakah topojson resolusi default tersedia di assets"""
+    return os.path.isfile(os.path.join(directory, TOPOJSON_FILES[0]))
+
+
+def topojson_url(directory=TOPOJSON_DIR):
+    """
+    URL topojson untuk config dcc.Graph peta
+
+    Returns:
+        str: URL lokal jika file tersedia, None untuk memakai CDN Plotly
+    """
+    return TOPOJSON_URL if has_local_topojson(directory) else None
+
+
+def register_topojson_cache(server):
+    """
+    Menambahkan header cache jangka panjang untuk file topojson lokal
+
+    Args:
+        server (Flask): Server Flask aplikasi Dash
+    """
+
+    @server.after_request
+    def cache_topojson(response):
+        from flask import request
+
+        if request.path.startswith(TOPOJSON_URL) and response.status_code == 200:
+            response.headers["Cache-Control"] = TOPOJSON_CACHE_CONTROL
+        return response
+
+
+def download_topojson(directory=TOPOJSON_DIR, base_url=TOPOJSON_CDN):
+    """
+    Mengunduh topojson dunia Plotly ke assets agar peta tidak bergantung CDN
+
+    Args:
+        directory (str): Direktori tujuan
+        base_url (str): URL dasar sumber topojson
+
+    Returns:
+        list: Path file yang ditulis
+    """
+    os.makedirs(directory, exist_ok=True)
+    written = []
+    for name in TOPOJSON_FILES:
+        path = os.path.join(directory, name)
+        with urllib.request.urlopen(base_url + name, timeout=60) as response:
+            payload = response.read()
+        tmp_path = f"{path}.tmp"
+        with open(tmp_path, "wb") as handle:
+            handle.write(payload)
+        os.replace(tmp_path, path)
+        written.append(path)
+    return written
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Topojson lokal untuk peta")
+    parser.add_argument(
+        "--download", action="store_true", help="Unduh topojson dari CDN Plotly"
+    )
+    parser.add_argument("--directory", default=TOPOJSON_DIR, help="Direktori tujuan")
+    args = parser.parse_args(argv)
+
+    if args.download:
+        for path in download_topojson(args.directory):
+            print(f"Ditulis: {path}")
+    status = "lokal" if has_local_topojson(args.directory) else "CDN Plotly"
+    print(f"Topojson peta: {status}")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,9 +1,17 @@
 from dash import html, dcc
 from components.ui import create_filters
 from components.colors import Colors
+from components.geo import topojson_url
+from config import CLIENTSIDE_FILTERING
 
 
-def create_layout(df, available_years, available_industries, available_countries):
+def create_layout(
+    df,
+    available_years,
+    available_industries,
+    available_countries,
+    clientside=CLIENTSIDE_FILTERING,
+):
     """
     Membuat layout utama aplikasi
 
@@ -12,10 +20,26 @@ def create_layout(df, available_years, available_industries, available_countries
         available_years (list): Daftar tahun yang tersedia
         available_industries (list): Daftar industri yang tersedia
         available_countries (list): Daftar negara yang tersedia
+        clientside (bool): Mode filtering di browser (figure awal dan cube ikut di layout)
 
     Returns:
         Component: Layout utama aplikasi
     """
+    # Mode clientside: figure tren/peta awal dirender di server sekali, lalu
+    # diperbarui di browser dari cube agregat yang dikirim lewat dcc.Store
+    client_stores = []
+    trend_figure = map_figure = None
+    if clientside:
+        from components.cube import get_cube
+        from components.payload import encode_figure
+        from components.visualizations import create_layoffs_trend, create_country_map
+
+        trend_figure = encode_figure("layoffs-trend", create_layoffs_trend(df))
+        map_figure = encode_figure("country-map", create_country_map(df))
+        client_stores.append(
+            dcc.Store(id="cube-store", data=get_cube(df).to_client_payload())
+        )
+
     # Header layout
     header = html.Nav(
         [
@@ -38,7 +62,7 @@ def create_layout(df, available_years, available_industries, available_countries
                                 className="flex-shrink-0",
                             ),
                         ],
-                        className="flex justify-left items-center",
+                        className="flex items-center",
                     ),
                     html.H6(
                         "Explore global layoff trends since 2020 — uncover which countries and industries were hit hardest, how patterns evolved over time, and the scale of their impact.",
@@ -108,7 +132,7 @@ def create_layout(df, available_years, available_industries, available_countries
                         className="flex-col ml-3 items-center justify-center",
                     ),
                 ],
-                className="flex justify-left items-center pt-4",
+                className="flex items-center pt-4",
             ),
             html.Div(
                 [
@@ -133,7 +157,7 @@ def create_layout(df, available_years, available_industries, available_countries
                         className="flex-col ml-3 items-center justify-center",
                     ),
                 ],
-                className="flex justify-left items-center pt-4",
+                className="flex items-center pt-4",
             ),
             html.Div(
                 [
@@ -158,19 +182,25 @@ def create_layout(df, available_years, available_industries, available_countries
                         className="flex-col ml-3 items-center justify-center",
                     ),
                 ],
-                className="flex justify-left items-center pt-4",
+                className="flex items-center pt-4",
             ),
         ],
         id="statistics",
-        className="justify-left mb-2 px-4",
+        className="mb-2 px-4",
     )
 
+    # Topojson dari assets sendiri jika sudah diunduh (tanpa itu plotly.js memakai CDN)
+    url = topojson_url()
+    map_config = {"topojsonURL": url} if url else {}
+
     # Card untuk Country Map (tanpa judul di dalamnya)
     country_map_card = html.Div(
         [
             dcc.Graph(
                 id="country-map",
+                figure=map_figure,
                 className="w-full rounded-lg",
+                config=map_config,
             ),
         ],
         className=f"w-full mb-6 bg-[{Colors.BG_CARD}] rounded-lg shadow-custom card-hover",
@@ -181,6 +211,7 @@ def create_layout(df, available_years, available_industries, available_countries
         [
             dcc.Graph(
                 id="layoffs-trend",
+                figure=trend_figure,
                 className="w-full rounded-lg",
             ),
         ],
@@ -269,6 +300,7 @@ def create_layout(df, available_years, available_industries, available_countries
             # Store untuk menyimpan state filter
             dcc.Store(id="filter-store"),
             dcc.Store(id="active-tab", data="tab-1"),
+            *client_stores,
         ],
         className=f"bg-[{Colors.BG_MAIN}] h-screen overflow-hidden",
     )
@@ -0,0 +1,409 @@
+"""
+Metrik waktu per callback dan endpoint /metrics (format teks Prometheus)
+
+Setiap callback Dash yang dibungkus instrument_callback() mencatat:
+- durasi total callback (histogram per callback),
+- durasi per fase (histogram per callback dan fase):
+  filter    - apply_filters,
+  aggregate - rollup cube atau groupby pandas untuk satu figure,
+  build     - menyusun dict figure dan encoding payload (tanpa aggregate),
+  serialize - JSON figure cache (dumps saat miss, loads saat hit di backend
+              file tanpa salinan hasil decode),
+  response  - sisa waktu request di luar fungsi callback: parsing input,
+              dispatch, dan encoding respons oleh Dash,
+- ukuran isi respons sebelum kompresi (histogram per callback),
+- hit/miss figure cache per figure dan jumlah callback yang gagal.
+
+Fase diukur dengan timed(); waktu fase bersarang tidak dihitung dua kali
+(aggregate di dalam build hanya tercatat sebagai aggregate). Fase yang berjalan
+di thread pool figure tetap tercatat untuk callback pemanggilnya karena context
+disalin ke tiap tugas. Treemap di process pool (FIGURE_EXECUTOR=process) hanya
+tercatat sebagai build.
+
+Tanpa METRICS_ENABLED instrument_callback() mengembalikan fungsi apa adanya dan
+timed() tidak melakukan apa pun, sehingga instrumentasi tidak menambah biaya.
+
+Metrik disimpan per proses; pada gunicorn dengan beberapa worker setiap scrape
+melihat satu worker.
+"""
+
+import bisect
+import contextvars
+import threading
+import time
+from contextlib import contextmanager, nullcontext
+from functools import wraps
+
+from config import METRICS_ENABLED
+
+# Batas bucket histogram durasi (detik) dan ukuran payload (byte)
+DURATION_BUCKETS = (
+    0.001,
+    0.0025,
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.5,
+    5.0,
+    10.0,
+)
+BYTES_BUCKETS = tuple(1024 * 2**i for i in range(11))  # 1 KiB .. 1 MiB
+
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+# Callback yang sedang berjalan (diwarisi tugas di thread pool figure)
+_current_callback = contextvars.ContextVar("metrics_callback", default=None)
+# Tumpukan fase aktif di thread ini: list [nama, waktu anak]
+_phase_stack = contextvars.ContextVar("metrics_phases", default=())
+
+
+def _escape(value):
+    return str(value).replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format_labels(names, values, extra=()):
+    pairs = [f'{name}="{_escape(value)}"' for name, value in zip(names, values)]
+    pairs += [f'{name}="{value}"' for name, value in extra]
+    return "{" + ",".join(pairs) + "}" if pairs else ""
+
+
+def _format_value(value):
+    if value == float("inf"):
+        return "+Inf"
+    if isinstance(value, float) and value.is_integer():
+        return str(int(value))
+    return repr(value) if isinstance(value, float) else str(value)
+
+
+class Counter:
+    """Counter monoton dengan label"""
+
+    kind = "counter"
+
+    def __init__(self, name, documentation, labels=()):
+        self.name = name
+        self.documentation = documentation
+        self.labels = tuple(labels)
+        self._values = {}
+        self._lock = threading.Lock()
+
+    def inc(self, *label_values, amount=1):
+        """
+        Menambah counter
+
+        Args:
+            *label_values: Nilai label sesuai urutan labels
+            amount (float): Besar penambahan
+        """
+        with self._lock:
+            self._values[label_values] = self._values.get(label_values, 0) + amount
+
+    def samples(self):
+        with self._lock:
+            values = sorted(self._values.items())
+        return [
+            (self.name, _format_labels(self.labels, key), value)
+            for key, value in values
+        ]
+
+
+class Histogram:
+    """Histogram kumulatif dengan label (bucket, sum, count)"""
+
+    kind = "histogram"
+
+    def __init__(self, name, documentation, labels=(), buckets=DURATION_BUCKETS):
+        self.name = name
+        self.documentation = documentation
+        self.labels = tuple(labels)
+        self.buckets = tuple(sorted(buckets))
+        self._values = {}
+        self._lock = threading.Lock()
+
+    def observe(self, value, *label_values):
+        """
+        Mencatat satu observasi
+
+        Args:
+            value (float): Nilai observasi
+            *label_values: Nilai label sesuai urutan labels
+        """
+        index = bisect.bisect_left(self.buckets, value)
+        with self._lock:
+            entry = self._values.get(label_values)
+            if entry is None:
+                entry = self._values[label_values] = [
+                    [0] * (len(self.buckets) + 1),
+                    0.0,
+                ]
+            entry[0][index] += 1
+            entry[1] += value
+
+    def samples(self):
+        with self._lock:
+            values = sorted(
+                (key, (list(counts), total))
+                for key, (counts, total) in self._values.items()
+            )
+        result = []
+        for key, (counts, total) in values:
+            cumulative = 0
+            for bound, count in zip(self.buckets + (float("inf"),), counts):
+                cumulative += count
+                labels = _format_labels(
+                    self.labels, key, [("le", _format_value(bound))]
+                )
+                result.append((f"{self.name}_bucket", labels, cumulative))
+            labels = _format_labels(self.labels, key)
+            result.append((f"{self.name}_sum", labels, total))
+            result.append((f"{self.name}_count", labels, cumulative))
+        return result
+
+
+class MetricsRegistry:
+    """Kumpulan metrik dan collector yang dirender ke format teks Prometheus"""
+
+    def __init__(self):
+        self._metrics = []
+        self._collectors = []
+
+    def register(self, metric):
+        """Mendaftarkan Counter/Histogram lalu mengembalikannya"""
+        self._metrics.append(metric)
+        return metric
+
+    def add_collector(self, collect):
+        """
+        Mendaftarkan fungsi yang menghasilkan metrik saat scrape
+
+        Args:
+            collect (callable): Mengembalikan list (name, kind, help, samples)
+                dengan samples berupa list (dict label, nilai)
+        """
+        self._collectors.append(collect)
+
+    def render(self):
+        """
+        Merender semua metrik
+
+        Returns:
+            str: Teks exposition format Prometheus 0.0.4
+        """
+        lines = []
+        for metric in self._metrics:
+            lines.append(f"# HELP {metric.name} {metric.documentation}")
+            lines.append(f"# TYPE {metric.name} {metric.kind}")
+            for name, labels, value in metric.samples():
+                lines.append(f"{name}{labels} {_format_value(value)}")
+        for collect in self._collectors:
+            for name, kind, documentation, samples in collect():
+                lines.append(f"# HELP {name} {documentation}")
+                lines.append(f"# TYPE {name} {kind}")
+                for labels, value in samples:
+                    names, values = zip(*labels.items()) if labels else ((), ())
+                    text = _format_labels(names, values)
+                    lines.append(f"{name}{text} {_format_value(value)}")
+        return "\n".join(lines) + "\n"
+
+
+registry = MetricsRegistry()
+
+CALLBACK_DURATION = registry.register(
+    Histogram(
+        "dashboard_callback_duration_seconds",
+        "Durasi fungsi callback Dash",
+        labels=("callback",),
+    )
+)
+CALLBACK_PHASE = registry.register(
+    Histogram(
+        "dashboard_callback_phase_seconds",
+        "Durasi fase callback (filter, aggregate, build, serialize, response)",
+        labels=("callback", "phase"),
+    )
+)
+CALLBACK_PAYLOAD = registry.register(
+    Histogram(
+        "dashboard_callback_payload_bytes",
+        "Ukuran isi respons callback sebelum kompresi",
+        labels=("callback",),
+        buckets=BYTES_BUCKETS,
+    )
+)
+CALLBACK_ERRORS = registry.register(
+    Counter(
+        "dashboard_callback_errors_total",
+        "Jumlah callback yang melempar exception",
+        labels=("callback",),
+    )
+)
+FIGURE_CACHE_REQUESTS = registry.register(
+    Counter(
+        "dashboard_figure_cache_requests_total",
+        "Permintaan figure cache per hasil (hit, miss, bypass)",
+        labels=("figure", "outcome"),
+    )
+)
+
+
+def timed(phase):
+    """
+    Mengukur satu fase untuk callback yang sedang berjalan
+
+    Tanpa METRICS_ENABLED atau di luar callback yang diinstrumentasi tidak
+    mencatat apa pun. Waktu fase bersarang dikurangkan dari fase luarnya.
+
+    Args:
+        phase (str): "filter", "aggregate", "build", atau "serialize"
+    """
+    if not METRICS_ENABLED:
+        return nullcontext()
+    callback = _current_callback.get()
+    if callback is None:
+        return nullcontext()
+    return _timed_phase(callback, phase)
+
+
+@contextmanager
+def _timed_phase(callback, phase):
+    frame = [phase, 0.0]
+    stack = _phase_stack.get()
+    token = _phase_stack.set(stack + (frame,))
+    started = time.perf_counter()
+    try:
+        yield
+    finally:
+        elapsed = time.perf_counter() - started
+        _phase_stack.reset(token)
+        if stack:
+            stack[-1][1] += elapsed
+        CALLBACK_PHASE.observe(max(elapsed - frame[1], 0.0), callback, phase)
+
+
+def record_cache_outcome(figure, outcome):
+    """
+    Mencatat hasil permintaan figure cache
+
+    Args:
+        figure (str): Nama figure
+        outcome (str): "hit", "miss", atau "bypass" (versi dataset None)
+    """
+    FIGURE_CACHE_REQUESTS.inc(figure, outcome)
+
+
+def instrument_callback(name):
+    """
+    Decorator pencatat durasi dan error untuk fungsi callback Dash
+
+    Pasang di bawah @app.callback. Di dalam request, nama dan durasi callback
+    disimpan di flask.g agar hook register_metrics() dapat mencatat fase
+    response dan ukuran respons. Tanpa METRICS_ENABLED fungsi dikembalikan
+    tanpa pembungkus.
+
+    Args:
+        name (str): Nama callback pada label metrik
+    """
+
+    def decorator(func):
+        if not METRICS_ENABLED:
+            return func
+
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            from flask import g, has_request_context
+
+            token = _current_callback.set(name)
+            started = time.perf_counter()
+            try:
+                return func(*args, **kwargs)
+            except Exception:
+                CALLBACK_ERRORS.inc(name)
+                raise
+            finally:
+                elapsed = time.perf_counter() - started
+                _current_callback.reset(token)
+                CALLBACK_DURATION.observe(elapsed, name)
+                if has_request_context():
+                    g.metrics_callback = name
+                    g.metrics_callback_seconds = elapsed
+
+        return wrapper
+
+    return decorator
+
+
+def _cache_and_payload_metrics():
+    """Collector: ukuran figure cache dan payload figure sebelum/sesudah encoding"""
+    from components.cache import get_figure_cache
+    from components.payload import payload_stats
+
+    cache = get_figure_cache().stats()
+    payload = payload_stats()
+    return [
+        (
+            "dashboard_figure_cache_entries",
+            "gauge",
+            "Jumlah entri figure cache",
+            [({}, cache["entries"])],
+        ),
+        (
+            "dashboard_figure_cache_size_bytes",
+            "gauge",
+            "Ukuran figure cache",
+            [({}, cache["size_bytes"])],
+        ),
+        (
+            "dashboard_figure_payload_bytes_total",
+            "counter",
+            "Ukuran JSON figure yang dibangun, sebelum (raw) dan sesudah encoding",
+            [
+                ({"figure": figure, "stage": stage}, entry[f"{stage}_bytes"])
+                for figure, entry in sorted(payload.items())
+                for stage in ("raw", "encoded")
+            ],
+        ),
+    ]
+
+
+registry.add_collector(_cache_and_payload_metrics)
+
+
+def register_metrics(server, path="/metrics"):
+    """
+    Memasang endpoint metrik dan hook pencatat respons callback di server Flask
+
+    Daftarkan setelah register_http_caching() agar ukuran respons dicatat
+    sebelum dikompresi.
+
+    Args:
+        server (Flask): Server Flask aplikasi Dash
+        path (str): Path endpoint metrik
+    """
+    from flask import Response, g
+
+    @server.before_request
+    def start_request_timer():
+        g.metrics_started = time.perf_counter()
+
+    @server.after_request
+    def record_callback_response(response):
+        name = g.get("metrics_callback")
+        if name is None:
+            return response
+        elapsed = time.perf_counter() - g.get("metrics_started", time.perf_counter())
+        # Sisa waktu request di luar fungsi callback: parsing input, dispatch, dan
+        # encoding JSON respons oleh Dash
+        remainder = elapsed - g.get("metrics_callback_seconds", 0.0)
+        CALLBACK_PHASE.observe(max(remainder, 0.0), name, "response")
+        if not response.direct_passthrough:
+            CALLBACK_PAYLOAD.observe(len(response.get_data()), name)
+        return response
+
+    @server.route(path)
+    def metrics():
+        return Response(registry.render(), content_type=CONTENT_TYPE)
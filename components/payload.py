@@ -0,0 +1,288 @@
+"""
+Encoding ringkas untuk array data figure sebelum dikirim ke browser
+
+Figure dari figure_specs memuat array float presisi penuh (jumlah layoffs,
+rata-rata persentase) dan tanggal ISO lengkap. encode_figure() menerapkan aturan
+per figure pada array tersebut:
+- nilai dibulatkan ke presisi tampilan (mengikuti format hovertemplate), dan
+  float bernilai bulat dikirim sebagai integer,
+- tanggal bulanan dikirim sebagai "YYYY-MM" (Plotly membacanya sebagai tanggal
+  yang sama),
+- dengan FIGURE_TYPED_ARRAYS=1, array numerik dikirim sebagai typed array base64
+  {"dtype", "bdata"}. Butuh plotly.js v2.28+; plotly.js yang dibundel Dash 2.14
+  (2.25) belum mendukungnya, jadi defaultnya mati.
+
+Jika METRICS_ENABLED, ukuran JSON setiap figure sebelum dan sesudah encoding
+dicatat per nama figure (payload_stats()); laporan untuk beberapa filter dapat
+dibuat dengan:
+
+    python -m components.payload
+"""
+
+import argparse
+import base64
+import gzip
+import json
+import math
+import threading
+
+import numpy as np
+
+from config import FIGURE_TYPED_ARRAYS, METRICS_ENABLED
+
+# Aturan encoding per figure: (indeks trace, atribut) -> aturan
+# - "month": tanggal ISO -> "YYYY-MM"
+# - int: dibulatkan ke n desimal (presisi hovertemplate)
+# - None: tanpa pembulatan, float bernilai bulat menjadi int
+# - tuple: aturan per kolom untuk array 2 dimensi (customdata)
+FIGURE_ENCODINGS = {
+    "layoffs-trend": {
+        (0, "x"): "month",
+        (0, "y"): None,
+        (1, "x"): "month",
+        (1, "y"): None,
+    },
+    "country-map": {
+        # z dan customdata[0] ditampilkan dengan format :.2f
+        (0, "z"): 2,
+        (0, "customdata"): (2, None, None),
+    },
+    "treemap-chart": {
+        (0, "values"): None,
+    },
+}
+
+# Kode dtype integer plotly.js -> dtype numpy (little-endian), dari yang terkecil
+INTEGER_DTYPES = [
+    ("u1", "<u1"),
+    ("i1", "<i1"),
+    ("u2", "<u2"),
+    ("i2", "<i2"),
+    ("u4", "<u4"),
+    ("i4", "<i4"),
+]
+
+_stats = {}
+_stats_lock = threading.Lock()
+
+
+def typed_arrays_enabled(setting=FIGURE_TYPED_ARRAYS):
+    """
+    Apakah array numerik dikirim sebagai typed array base64
+
+    Args:
+        setting (str): "1" untuk typed array, selain itu list JSON
+
+    Returns:
+        bool: True jika typed array dipakai
+    """
+    return setting == "1"
+
+
+def _round_values(values, decimals):
+    """Membulatkan array (None/NaN tetap None); hasil bulat menjadi int"""
+    array = np.array([math.nan if v is None else v for v in values], dtype=float)
+    if decimals is not None:
+        array = np.round(array, decimals)
+    missing = np.isnan(array)
+    integral = ~missing & (array == np.floor(array)) & (np.abs(array) < 2**53)
+    return [
+        None if is_missing else int(value) if is_integral else value
+        for value, is_missing, is_integral in zip(array.tolist(), missing, integral)
+    ]
+
+
+def _typed_array(values, shape=None):
+    """
+    Typed array plotly.js untuk list numerik, atau None jika tidak dapat dikodekan
+
+    Integer memakai tipe terkecil yang cukup; float memakai f4 jika semua nilai
+    kembali sama pada 7 digit signifikan, selain itu f8. None dikodekan sebagai
+    NaN (titik kosong di plotly.js).
+    """
+    if any(isinstance(v, (str, bool)) for v in values):
+        return None
+    if values and all(isinstance(v, int) for v in values):
+        low, high = min(values), max(values)
+        for code, dtype in INTEGER_DTYPES:
+            info = np.iinfo(dtype)
+            if info.min <= low and high <= info.max:
+                array = np.array(values, dtype=dtype)
+                break
+        else:
+            return None
+    else:
+        array = np.array([math.nan if v is None else v for v in values], dtype="<f8")
+        narrow = array.astype("<f4")
+        lossless = all(
+            v is None or float(f"{w:.7g}") == v for v, w in zip(values, narrow.tolist())
+        )
+        code = "f4" if lossless else "f8"
+        array = narrow if lossless else array
+
+    spec = {"dtype": code, "bdata": base64.b64encode(array.tobytes()).decode("ascii")}
+    if shape is not None:
+        spec["shape"] = ",".join(str(size) for size in shape)
+    return spec
+
+
+def encode_array(values, rule, typed_arrays=False):
+    """
+    Menerapkan satu aturan encoding pada array data trace
+
+    Args:
+        values (list): Array data (list Python, 1 atau 2 dimensi)
+        rule: Aturan dari FIGURE_ENCODINGS
+        typed_arrays (bool): Izinkan keluaran typed array base64
+
+    Returns:
+        list | dict: Array hasil encoding
+    """
+    if not isinstance(values, list):  # sudah dikodekan atau bukan array
+        return values
+    if rule == "month":
+        return [v[:7] if isinstance(v, str) else v for v in values]
+
+    if isinstance(rule, tuple):
+        columns = [
+            _round_values([row[i] for row in values], decimals)
+            for i, decimals in enumerate(rule)
+        ]
+        rows = [list(row) for row in zip(*columns)]
+        if typed_arrays and rows:
+            flat = [value for row in rows for value in row]
+            spec = _typed_array(flat, shape=(len(rows), len(rule)))
+            return rows if spec is None else spec
+        return rows
+
+    values = _round_values(values, rule)
+    if typed_arrays:
+        spec = _typed_array(values)
+        return values if spec is None else spec
+    return values
+
+
+def _json_size(fig):
+    return len(json.dumps(fig, separators=(",", ":")).encode("utf-8"))
+
+
+def record_payload(name, raw_bytes, encoded_bytes):
+    """
+    Mencatat ukuran figure sebelum dan sesudah encoding
+
+    Args:
+        name (str): Nama figure
+        raw_bytes (int): Ukuran JSON sebelum encoding
+        encoded_bytes (int): Ukuran JSON sesudah encoding
+    """
+    with _stats_lock:
+        entry = _stats.setdefault(
+            name, {"figures": 0, "raw_bytes": 0, "encoded_bytes": 0}
+        )
+        entry["figures"] += 1
+        entry["raw_bytes"] += raw_bytes
+        entry["encoded_bytes"] += encoded_bytes
+        entry["last_raw_bytes"] = raw_bytes
+        entry["last_encoded_bytes"] = encoded_bytes
+
+
+def payload_stats():
+    """
+    Ukuran payload per figure sejak proses berjalan
+
+    Returns:
+        dict: Nama figure -> figures, raw_bytes, encoded_bytes, last_raw_bytes,
+            last_encoded_bytes, dan ratio (encoded / raw)
+    """
+    with _stats_lock:
+        return {
+            name: dict(entry, ratio=entry["encoded_bytes"] / entry["raw_bytes"])
+            for name, entry in _stats.items()
+            if entry["raw_bytes"]
+        }
+
+
+def encode_figure(name, fig, typed_arrays=None, record=METRICS_ENABLED):
+    """
+    Mengodekan array data figure menurut FIGURE_ENCODINGS
+
+    Figure tanpa aturan (atau objek Figure Plotly) dikembalikan apa adanya.
+
+    Args:
+        name (str): Nama figure (id dcc.Graph)
+        fig (dict | Figure): Figure hasil builder
+        typed_arrays (bool): Pakai typed array base64; None mengikuti konfigurasi
+        record (bool): Catat ukuran JSON sebelum/sesudah encoding (dua json.dumps
+            tambahan; default hanya jika METRICS_ENABLED)
+
+    Returns:
+        dict | Figure: Figure dengan array yang sudah dikodekan
+    """
+    rules = FIGURE_ENCODINGS.get(name)
+    if not rules or not isinstance(fig, dict):
+        return fig
+    if typed_arrays is None:
+        typed_arrays = typed_arrays_enabled()
+
+    data = list(fig.get("data", []))
+    for (index, attribute), rule in rules.items():
+        if index < len(data) and attribute in data[index]:
+            trace = dict(data[index])
+            trace[attribute] = encode_array(trace[attribute], rule, typed_arrays)
+            data[index] = trace
+    encoded = dict(fig, data=data)
+
+    if record:
+        record_payload(name, _json_size(fig), _json_size(encoded))
+    return encoded
+
+
+def main(argv=None):
+    from components.data_processor import apply_filters, load_data
+    from components.visualizations import (
+        create_country_map,
+        create_layoffs_trend,
+        create_treemap_figure,
+    )
+
+    parser = argparse.ArgumentParser(description="Ukuran payload figure")
+    parser.add_argument("--data", default=None, help="Path CSV (default DATA_PATH)")
+    parser.add_argument(
+        "--typed-arrays", choices=["0", "1"], default=FIGURE_TYPED_ARRAYS
+    )
+    args = parser.parse_args(argv)
+
+    df = load_data(args.data) if args.data else load_data()
+    typed_arrays = typed_arrays_enabled(args.typed_arrays)
+    years = sorted(int(year) for year in df["year"].dropna().unique())
+    cases = {"semua data": (None, None, None)}
+    cases.update({f"tahun {year}": ([year], None, None) for year in years})
+
+    builders = {
+        "layoffs-trend": lambda y, i, c: create_layoffs_trend(df, y, i, c),
+        "country-map": lambda y, i, c: create_country_map(df, y, i, c),
+        "treemap-chart": lambda y, i, c: create_treemap_figure(
+            apply_filters(df, y, i, c)
+        ),
+    }
+
+    print(f"typed array: {typed_arrays}")
+    print(f"{'figure':<15} {'filter':<12} {'mentah':>9} {'encoded':>9} {'gzip':>13}")
+    for label, (y, i, c) in cases.items():
+        for name, build in builders.items():
+            fig = build(y, i, c)
+            encoded = encode_figure(name, fig, typed_arrays, record=True)
+            raw = json.dumps(fig, separators=(",", ":")).encode("utf-8")
+            packed = json.dumps(encoded, separators=(",", ":")).encode("utf-8")
+            gz = f"{len(gzip.compress(raw))}->{len(gzip.compress(packed))}"
+            print(f"{name:<15} {label:<12} {len(raw):>9} {len(packed):>9} {gz:>13}")
+
+    print()
+    for name, entry in payload_stats().items():
+        print(
+            f"{name}: {entry['ratio']:.1%} dari ukuran awal ({entry['figures']} figure)"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,69 @@
+"""
+Persiapan berbagi data antar worker gunicorn (preload lalu fork)
+
+Dengan preload_app, data dimuat dan diindeks sekali di proses master. Worker
+hasil fork berbagi page memori master selama page tersebut tidak ditulis
+(copy-on-write). Modul ini menandai array besar (kolom frame, bitmap indeks,
+dan cube agregat) sebagai read-only dan membekukan objek yang sudah ada dari
+garbage collector agar page tersebut tidak tersentuh lagi setelah fork.
+"""
+
+import gc
+
+import numpy as np
+
+from components.registry import lookup
+
+# Atribut ExtensionArray pandas yang menyimpan buffer numpy
+_BUFFER_ATTRIBUTES = ("_ndarray", "_data", "_mask")
+
+
+def _freeze_array(array):
+    """Menandai ndarray sebagai read-only (memory-map read-only dibiarkan)"""
+    if isinstance(array, np.ndarray) and array.flags.writeable:
+        array.setflags(write=False)
+
+
+def _freeze_attributes(obj):
+    """Menandai semua atribut ndarray (juga di dalam dict) sebagai read-only"""
+    for value in vars(obj).values():
+        if isinstance(value, dict):
+            for item in value.values():
+                _freeze_array(item)
+        else:
+            _freeze_array(value)
+
+
+def freeze_frame(df):
+    """
+    Menandai buffer kolom DataFrame serta indeks dan cube-nya sebagai read-only
+
+    Penulisan tak sengaja ke data bersama akan gagal dengan ValueError alih-alih
+    diam-diam menyalin page di worker.
+
+    Args:
+        df (DataFrame): DataFrame hasil load_data()
+    """
+    for name in df.columns:
+        values = df[name].array
+        for attribute in _BUFFER_ATTRIBUTES:
+            _freeze_array(getattr(values, attribute, None))
+
+    for structure in (lookup(df, "filter_index"), lookup(df, "cube")):
+        if structure is not None:
+            _freeze_attributes(structure)
+
+
+def prepare_for_fork(df):
+    """
+    Menyiapkan proses master sebelum worker di-fork
+
+    Args:
+        df (DataFrame): DataFrame hasil load_data()
+    """
+    freeze_frame(df)
+
+    # Objek yang sudah ada dipindah ke generasi permanen agar siklus GC di worker
+    # tidak menulis header objek (dan menyalin page) milik master
+    gc.collect()
+    gc.freeze()
@@ -0,0 +1,413 @@
+"""
+Profiling opt-in untuk callback dashboard yang lambat
+
+Diaktifkan dengan PROFILE_CALLBACKS:
+- "sample": sampler statistik (sys._current_frames setiap PROFILE_INTERVAL_MS)
+  pada thread callback dan thread pool figure yang sedang menjalankan tugas
+  callback tersebut. Hasil berupa stack terlipat (.folded) yang dapat dibuka di
+  speedscope atau flamegraph.pl.
+- "cprofile": profil deterministik cProfile (.prof, untuk pstats/snakeviz) pada
+  thread callback. Figure yang dibangun di thread pool hanya terlihat sebagai
+  waktu tunggu; pakai FIGURE_WORKERS=1 agar seluruh pembangunan tercatat.
+
+Pemanggilan yang terpilih sampel acak PROFILE_SAMPLE_RATE diprofil dengan mode
+di atas dan selalu disimpan. Jika PROFILE_THRESHOLD_MS > 0, pemanggilan lain
+dipantau dengan sampler statistik (apa pun modenya, agar request cepat tidak
+menanggung biaya cProfile) dan hanya disimpan jika melewati ambang. Setiap profil ditulis ke PROFILE_DIR
+bersama file .json berisi isi filter-store yang memicunya, input callback,
+durasi, dan versi dataset; hanya PROFILE_KEEP profil terbaru yang disimpan.
+
+Profil dapat dibaca ulang atau filter-nya dijalankan ulang di data lokal:
+
+    python -m components.profiling
+    python -m components.profiling --replay <file .json>
+"""
+
+import argparse
+import cProfile
+import json
+import os
+import random
+import sys
+import threading
+import time
+import uuid
+import warnings
+from collections import Counter
+from functools import wraps
+
+from config import (
+    FIGURE_CACHE_MAX_BYTES,
+    PROFILE_CALLBACKS,
+    PROFILE_DIR,
+    PROFILE_INTERVAL_MS,
+    PROFILE_KEEP,
+    PROFILE_SAMPLE_RATE,
+    PROFILE_THRESHOLD_MS,
+)
+
+PROFILE_EXTENSIONS = {"sample": ".folded", "cprofile": ".prof"}
+
+
+class StackSampler:
+    """Sampler statistik stack thread callback dan tugas thread pool figure-nya"""
+
+    mode = "sample"
+
+    def __init__(self, interval):
+        self.interval = interval
+        self.samples = Counter()
+        self._target = threading.get_ident()
+        # Thread pool yang sedang menjalankan tugas callback ini (diisi executor)
+        self._jobs = set()
+        self._token = None
+        self._stop = threading.Event()
+        self._thread = threading.Thread(
+            target=self._run, name="callback-profiler", daemon=True
+        )
+
+    def _run(self):
+        while not self._stop.wait(self.interval):
+            idents = self._jobs.copy()
+            idents.add(self._target)
+            for ident, frame in sys._current_frames().items():
+                if ident not in idents:
+                    continue
+                stack = []
+                while frame is not None:
+                    code = frame.f_code
+                    name = os.path.basename(code.co_filename)
+                    stack.append(f"{code.co_name} ({name}:{frame.f_lineno})")
+                    frame = frame.f_back
+                self.samples[";".join(reversed(stack))] += 1
+
+    def start(self):
+        from components.executor import job_threads
+
+        self._token = job_threads.set(self._jobs)
+        self._thread.start()
+
+    def stop(self):
+        from components.executor import job_threads
+
+        job_threads.reset(self._token)
+        self._stop.set()
+        self._thread.join()
+
+    def dump(self, path):
+        """Menulis stack terlipat: satu baris "frame;frame;... jumlah" per stack"""
+        with open(path, "w", encoding="utf-8") as handle:
+            for stack, count in self.samples.most_common():
+                handle.write(f"{stack} {count}\n")
+
+
+class CProfileCapture:
+    """Profil deterministik cProfile pada thread callback"""
+
+    mode = "cprofile"
+
+    def __init__(self):
+        self.profile = cProfile.Profile()
+
+    def start(self):
+        self.profile.enable()
+
+    def stop(self):
+        self.profile.disable()
+
+    def dump(self, path):
+        self.profile.dump_stats(path)
+
+
+class CallbackProfiler:
+    """Menentukan pemanggilan mana yang diprofil dan menyimpan hasilnya"""
+
+    def __init__(
+        self,
+        mode=PROFILE_CALLBACKS,
+        directory=PROFILE_DIR,
+        threshold_ms=PROFILE_THRESHOLD_MS,
+        sample_rate=PROFILE_SAMPLE_RATE,
+        keep=PROFILE_KEEP,
+        interval_ms=PROFILE_INTERVAL_MS,
+    ):
+        if mode not in PROFILE_EXTENSIONS:
+            raise ValueError(f"PROFILE_CALLBACKS tidak dikenal: {mode!r}")
+        self.mode = mode
+        self.directory = directory
+        self.threshold = threshold_ms / 1000
+        self.sample_rate = sample_rate
+        self.keep = keep
+        self.interval = interval_ms / 1000
+        self.captured = 0
+        self._lock = threading.Lock()
+
+    def _start_capture(self, sampled):
+        # Pemantauan ambang selalu memakai sampler agar request cepat tetap murah
+        if self.mode == "sample" or not sampled:
+            capture = StackSampler(self.interval)
+        else:
+            capture = CProfileCapture()
+        capture.start()
+        return capture
+
+    def wrap(self, name, func, store_from):
+        """
+        Membungkus fungsi callback dengan profiling
+
+        Args:
+            name (str): Nama callback
+            func (callable): Fungsi callback
+            store_from (str): "input" jika argumen pertama adalah isi filter-store,
+                "output" jika isi filter-store adalah nilai kembalian
+
+        Returns:
+            callable: Fungsi callback terbungkus
+        """
+
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            sampled = self.sample_rate > 0 and random.random() < self.sample_rate
+            if not sampled and self.threshold <= 0:
+                return func(*args, **kwargs)
+
+            capture = self._start_capture(sampled)
+            started = time.perf_counter()
+            result, error = None, None
+            try:
+                result = func(*args, **kwargs)
+                return result
+            except Exception as exc:
+                error = repr(exc)
+                raise
+            finally:
+                elapsed = time.perf_counter() - started
+                capture.stop()
+                if sampled or elapsed >= self.threshold:
+                    store = result if store_from == "output" else args[0]
+                    # Profil gagal disimpan tidak boleh menggagalkan callback
+                    try:
+                        self.save(name, capture, elapsed, store, args, error, sampled)
+                    except Exception as exc:
+                        warnings.warn(f"Profil callback gagal disimpan: {exc}")
+
+        return wrapper
+
+    def save(self, name, capture, elapsed, filter_store, inputs, error, sampled):
+        """
+        Menulis profil dan metadata lalu membuang profil terlama di luar PROFILE_KEEP
+
+        Args:
+            name (str): Nama callback
+            capture (StackSampler | CProfileCapture): Profil yang sudah dihentikan
+            elapsed (float): Durasi callback (detik)
+            filter_store (dict): Isi filter-store yang memicu callback
+            inputs (tuple): Argumen callback
+            error (str): repr exception, None jika berhasil
+            sampled (bool): Terpilih sampel acak (bukan karena ambang)
+
+        Returns:
+            str: Path file metadata (.json)
+        """
+        os.makedirs(self.directory, exist_ok=True)
+        stamp = time.strftime("%Y%m%d-%H%M%S")
+        base = os.path.join(
+            self.directory,
+            f"{stamp}-{name}-{int(elapsed * 1000)}ms-{uuid.uuid4().hex[:8]}",
+        )
+        profile_path = base + PROFILE_EXTENSIONS[capture.mode]
+        meta = {
+            "callback": name,
+            "duration_ms": round(elapsed * 1000, 3),
+            "trigger": "sample" if sampled else "threshold",
+            "mode": capture.mode,
+            "profile": os.path.basename(profile_path),
+            "filter_store": _jsonable(filter_store),
+            "inputs": [_jsonable(value) for value in inputs],
+            "error": error,
+            "dataset_version": _dataset_version(),
+            "pid": os.getpid(),
+            "timestamp": time.time(),
+        }
+
+        # Profil ditulis lebih dulu; metadata (penanda profil lengkap) terakhir
+        _write_atomic(profile_path, capture.dump)
+        _write_atomic(
+            base + ".json",
+            lambda path: _dump_json(meta, path),
+        )
+        with self._lock:
+            self.captured += 1
+            self._rotate()
+        return base + ".json"
+
+    def _rotate(self):
+        """Menyisakan PROFILE_KEEP profil terbaru di direktori"""
+        metas = list_profiles(self.directory)
+        for meta_path in metas[self.keep :]:
+            paths = [meta_path]
+            # Metadata dapat sedang dihapus/ditulis worker lain
+            try:
+                paths.append(_profile_path(meta_path))
+            except (OSError, ValueError, KeyError):
+                pass
+            for path in paths:
+                try:
+                    os.remove(path)
+                except OSError:
+                    pass
+
+
+def _jsonable(value):
+    """Nilai apa adanya jika dapat diserialisasi JSON, selain itu repr-nya"""
+    try:
+        json.dumps(value)
+        return value
+    except (TypeError, ValueError):
+        return repr(value)
+
+
+def _dataset_version():
+    """Versi dataset yang sedang dilayani app (None di luar aplikasi)"""
+    app = sys.modules.get("app")
+    dataset = getattr(app, "dataset", None)
+    return getattr(dataset, "version", None)
+
+
+def _dump_json(data, path):
+    with open(path, "w", encoding="utf-8") as handle:
+        json.dump(data, handle, indent=2)
+
+
+def _write_atomic(path, write):
+    """Memanggil write(path_sementara) lalu rename ke path"""
+    tmp_path = os.path.join(os.path.dirname(path), f".tmp-{uuid.uuid4().hex}")
+    try:
+        write(tmp_path)
+        os.replace(tmp_path, path)
+    finally:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+
+
+def _profile_path(meta_path):
+    with open(meta_path, encoding="utf-8") as handle:
+        return os.path.join(os.path.dirname(meta_path), json.load(handle)["profile"])
+
+
+def list_profiles(directory=PROFILE_DIR):
+    """
+    Metadata profil di direktori, terbaru lebih dulu
+
+    Args:
+        directory (str): Direktori profil
+
+    Returns:
+        list: Path file .json
+    """
+    try:
+        entries = [
+            entry
+            for entry in os.scandir(directory)
+            if entry.name.endswith(".json") and not entry.name.startswith(".")
+        ]
+    except FileNotFoundError:
+        return []
+    stamped = []
+    for entry in entries:
+        # File dapat dihapus worker lain di antara scandir dan stat
+        try:
+            stamped.append((entry.stat().st_mtime, entry.path))
+        except OSError:
+            continue
+    stamped.sort(reverse=True)
+    return [path for _, path in stamped]
+
+
+_profiler = None
+
+
+def profile_callback(name, store_from="input"):
+    """
+    Decorator profiling opt-in untuk fungsi callback Dash
+
+    Tanpa PROFILE_CALLBACKS fungsi dikembalikan apa adanya (tanpa overhead).
+
+    Args:
+        name (str): Nama callback
+        store_from (str): "input" atau "output", lihat CallbackProfiler.wrap()
+    """
+
+    def decorator(func):
+        global _profiler
+        if PROFILE_CALLBACKS in ("", "0"):
+            return func
+        if _profiler is None:
+            _profiler = CallbackProfiler()
+        return _profiler.wrap(name, func, store_from)
+
+    return decorator
+
+
+def replay(meta_path, data_path=None):
+    """
+    Menjalankan ulang filter dari profil di data lokal dengan cProfile
+
+    Args:
+        meta_path (str): File metadata profil (.json)
+        data_path (str): Path CSV, default DATA_PATH
+
+    Returns:
+        pstats.Stats: Statistik hasil pemanggilan ulang
+    """
+    import pstats
+
+    from components.cache import FigureCache, MemoryFigureBackend
+    from components.callbacks import make_figure_builder
+    from components.data_processor import get_dataset_version, load_data
+    from components.executor import FigureExecutor
+
+    with open(meta_path, encoding="utf-8") as handle:
+        meta = json.load(handle)
+    df = load_data(data_path) if data_path else load_data()
+    version = get_dataset_version(df)
+    if meta.get("dataset_version") and meta["dataset_version"] != version:
+        print(f"Peringatan: versi dataset lokal {version} != {meta['dataset_version']}")
+
+    # Cache baru agar pembangunan figure benar-benar diukur, dan figure dibangun
+    # berurutan agar seluruhnya terlihat oleh cProfile
+    figure_cache = FigureCache(MemoryFigureBackend(FIGURE_CACHE_MAX_BYTES))
+    build_figures = make_figure_builder(
+        df, figure_cache=figure_cache, figure_executor=FigureExecutor(1)
+    )
+    names = ["layoffs-trend", "country-map", "treemap-chart"]
+    profile = cProfile.Profile()
+    profile.runcall(build_figures, meta["filter_store"], names)
+    return pstats.Stats(profile)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Profil callback yang lambat")
+    parser.add_argument("--directory", default=PROFILE_DIR, help="Direktori profil")
+    parser.add_argument("--replay", help="Jalankan ulang filter dari file .json profil")
+    parser.add_argument("--data", default=None, help="CSV untuk --replay")
+    parser.add_argument("--top", type=int, default=25, help="Baris statistik --replay")
+    args = parser.parse_args(argv)
+
+    if args.replay:
+        stats = replay(args.replay, args.data)
+        stats.sort_stats("cumulative").print_stats(args.top)
+        return
+
+    for meta_path in list_profiles(args.directory):
+        with open(meta_path, encoding="utf-8") as handle:
+            meta = json.load(handle)
+        print(
+            f"{meta['duration_ms']:>10.1f} ms  {meta['callback']:<22} "
+            f"{meta['trigger']:<9} {os.path.basename(meta_path)}"
+        )
+        print(f"{'':>14}filter-store: {json.dumps(meta['filter_store'])}")
+
+
+if __name__ == "__main__":
+    main()
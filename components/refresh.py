@@ -0,0 +1,230 @@
+"""
+Refresh data secara live saat baris baru ditambahkan ke file CSV
+
+LiveDataset memegang frame yang sedang dipakai. Thread polling memeriksa ukuran
+file sumber; jika bertambah, hanya byte baru (baris lengkap) yang dibaca,
+diproses, lalu digabung ke frame, indeks filter, dan cube lewat append_frame().
+
+Versi dataset adalah SHA-256 seluruh byte file sampai offset yang sudah dibaca
+(content_version(), sama dengan load_data()). Hash dilanjutkan secara inkremental
+dengan byte delta, sehingga worker yang membaca dua append dalam dua polling,
+worker yang membacanya dalam satu polling, dan worker yang baru dimulai
+menghasilkan versi yang sama untuk isi file yang sama. Kunci figure cache
+bersama dan ETag pun sama di semua worker.
+
+Offset awal adalah jumlah byte yang tercakup versi frame hasil load_data()
+(source_size), sehingga start tidak meng-hash ulang file. Hash SHA-256 tidak dapat
+dilanjutkan dari digest-nya; jika load_data() tidak meng-hash file (snapshot
+valid), isi [0, offset) di-hash sekali saat append pertama di thread polling.
+
+Jika isi file sebelum offset berubah (file ditulis ulang, bukan di-append),
+dataset dimuat ulang penuh dengan load_data().
+"""
+
+import hashlib
+import io
+import os
+import threading
+import warnings
+
+from components.data_processor import (
+    append_frame,
+    compact_frame,
+    content_version,
+    get_dataset_version,
+    get_filter_options,
+    load_data,
+    _process_csv,
+)
+from components.registry import attach, lookup
+
+# Jumlah byte terakhir sebelum offset yang dicocokkan untuk mendeteksi file ditulis ulang
+TAIL_BYTES = 4096
+
+# Batas percobaan memuat ulang saat file terus bertambah selama load_data()
+RELOAD_ATTEMPTS = 3
+
+
+def _read_range(path, start, end):
+    """Membaca byte [start, end) dari file"""
+    with open(path, "rb") as handle:
+        handle.seek(start)
+        return handle.read(end - start)
+
+
+class LiveDataset:
+    """Pemegang frame aktif yang diperbarui saat file sumber bertambah"""
+
+    def __init__(self, df, path, interval=30.0):
+        self.path = path
+        self.interval = interval
+        self.refreshes = 0
+        self._df = df
+        self._lock = threading.Lock()
+        self._poller = None
+        self._poller_pid = None
+        self._stop = threading.Event()
+
+        offset = lookup(df, "source_size")
+        if offset is None:
+            # Frame tidak berasal dari load_data(): muat ulang agar versinya diketahui
+            self._reload()
+        else:
+            # Baris yang di-append sejak load_data() digabung pada check() berikutnya
+            self._track(offset, lookup(df, "source_hasher"))
+
+    @property
+    def df(self):
+        """Frame yang sedang aktif"""
+        return self._df
+
+    @property
+    def version(self):
+        """Versi dataset frame aktif"""
+        return get_dataset_version(self._df)
+
+    def filter_options(self):
+        """
+        Opsi filter untuk frame aktif (dihitung sekali per frame)
+
+        Returns:
+            tuple: (available_years, available_industries, available_countries)
+        """
+        df = self._df
+        options = lookup(df, "filter_options")
+        if options is None:
+            options = attach(df, "filter_options", get_filter_options(df))
+        return options
+
+    def _read_tail(self, offset):
+        return _read_range(self.path, max(offset - TAIL_BYTES, 0), offset)
+
+    def _track(self, offset, hasher=None):
+        """
+        Mulai melacak file dari offset (byte yang tercakup frame aktif)
+
+        Args:
+            offset (int): Jumlah byte file yang sudah dibaca frame aktif
+            hasher: Objek hash SHA-256 isi [0, offset), None untuk dihitung saat
+                dibutuhkan
+        """
+        with open(self.path, "rb") as handle:
+            self._header = handle.readline()
+        self._hasher = hasher.copy() if hasher is not None else None
+        self._offset = offset
+        self._tail = self._read_tail(offset)
+
+    def _prefix_hasher(self):
+        """Hash isi file [0, offset), dihitung sekali jika belum tersedia"""
+        if self._hasher is None:
+            hasher = hashlib.sha256()
+            with open(self.path, "rb") as handle:
+                remaining = self._offset
+                while remaining > 0:
+                    block = handle.read(min(remaining, 1 << 20))
+                    if not block:
+                        break
+                    hasher.update(block)
+                    remaining -= len(block)
+            self._hasher = hasher
+        return self._hasher
+
+    def _content_version(self, version):
+        """Versi untuk isi file sampai offset, dengan skema dari versi frame"""
+        schema = (version or "").split(":", 1)[0]
+        return content_version(schema, self._prefix_hasher().hexdigest())
+
+    def check(self):
+        """
+        Memeriksa file sumber dan menggabungkan baris baru jika ada
+
+        Returns:
+            bool: True jika frame aktif berganti
+        """
+        with self._lock:
+            try:
+                size = os.path.getsize(self.path)
+            except OSError:
+                return False
+
+            if size < self._offset or self._read_tail(self._offset) != self._tail:
+                self._reload()
+                return True
+            if size == self._offset:
+                return False
+
+            # Hanya baris lengkap; sisa baris yang belum selesai ditulis menunggu
+            delta = _read_range(self.path, self._offset, size)
+            end = delta.rfind(b"\n") + 1
+            if end == 0:
+                return False
+            delta = delta[:end]
+
+            self._append(delta)
+            self._offset += end
+            self._tail = self._read_tail(self._offset)
+            return True
+
+    def _append(self, delta):
+        """Memproses byte baru dan menggabungkannya ke frame aktif"""
+        df = self._df
+        version = get_dataset_version(df)
+
+        rows = _process_csv(io.BytesIO(self._header + delta))
+        if (version or "").startswith("compact"):
+            rows = compact_frame(rows)
+
+        self._prefix_hasher().update(delta)
+        self._df = append_frame(df, rows, self._content_version(version))
+        self.refreshes += 1
+
+    def _reload(self):
+        """
+        Memuat ulang seluruh dataset (file ditulis ulang)
+
+        Offset dan hash diambil dari byte yang tercakup versi frame baru. Jika
+        file bertambah selama load_data() (ukuran sebelum dan sesudah berbeda),
+        frame mungkin memuat lebih sedikit baris dari yang di-hash, jadi dimuat
+        ulang sampai ukurannya stabil.
+        """
+        for _ in range(RELOAD_ATTEMPTS):
+            before = os.path.getsize(self.path)
+            df = load_data(self.path)
+            if lookup(df, "source_size") == before == os.path.getsize(self.path):
+                break
+        self._df = df
+        self._track(lookup(df, "source_size"), lookup(df, "source_hasher"))
+        self.refreshes += 1
+
+    def _poll(self):
+        while not self._stop.wait(self.interval):
+            try:
+                self.check()
+            except Exception as exc:  # thread polling tidak boleh mati
+                warnings.warn(f"Refresh data gagal: {exc}")
+
+    def ensure_polling(self):
+        """
+        Menjalankan thread polling di proses ini jika belum berjalan
+
+        Aman dipanggil berkali-kali (misalnya sebelum setiap request); thread
+        dibuat ulang di proses hasil fork karena thread tidak ikut di-fork.
+        """
+        if self.interval <= 0:
+            return
+        pid = os.getpid()
+        if self._poller_pid == pid:
+            return
+        with self._lock:
+            if self._poller_pid == pid:
+                return
+            self._stop = threading.Event()
+            self._poller = threading.Thread(
+                target=self._poll, name="dataset-refresh", daemon=True
+            )
+            self._poller.start()
+            self._poller_pid = pid
+
+    def stop(self):
+        """Menghentikan thread polling"""
+        self._stop.set()
@@ -0,0 +1,51 @@
+"""
+Registry struktur turunan per objek DataFrame
+
+Indeks, versi dataset, dan agregat disimpan di luar DataFrame (bukan di
+df.attrs, yang ikut disalin oleh operasi pandas). Entri dibersihkan otomatis
+saat frame dibuang oleh garbage collector.
+"""
+
+import weakref
+
+_REGISTRY = {}
+
+
+def attach(df, name, value):
+    """
+    Menyimpan struktur turunan untuk DataFrame
+
+    Args:
+        df (DataFrame): Frame pemilik
+        name (str): Nama struktur (misalnya "filter_index")
+        value (object): Struktur yang disimpan
+
+    Returns:
+        object: value yang disimpan
+    """
+    key = id(df)
+    entry = _REGISTRY.get(key)
+    if entry is None or entry[0]() is not df:
+        entry = (weakref.ref(df), {})
+        _REGISTRY[key] = entry
+        weakref.finalize(df, _REGISTRY.pop, key, None)
+    entry[1][name] = value
+    return value
+
+
+def lookup(df, name, default=None):
+    """
+    Mengambil struktur turunan untuk DataFrame
+
+    Args:
+        df (DataFrame): Frame pemilik
+        name (str): Nama struktur
+        default (object): Nilai jika tidak ada
+
+    Returns:
+        object: Struktur yang tersimpan, atau default
+    """
+    entry = _REGISTRY.get(id(df))
+    if entry is None or entry[0]() is not df:
+        return default
+    return entry[1].get(name, default)
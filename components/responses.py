@@ -0,0 +1,220 @@
+"""
+Kompresi, ETag, dan respons 304 untuk server Flask aplikasi Dash
+
+Satu hook after_request menangani semua respons:
+- Encoding dinegosiasikan dari Accept-Encoding: brotli (jika modul brotli
+  terpasang) atau gzip. Hanya tipe teks/JSON/JS/SVG di atas ukuran minimum yang
+  dikompresi; Vary: Accept-Encoding selalu ditambahkan untuk tipe tersebut.
+- ETag kuat hanya untuk GET/HEAD (hanya request ini yang dapat dijawab 304):
+  ETag yang sudah ada (asset dari send_file dan resource Dash tanpa sidik jari)
+  dipakai apa adanya, respons dinamis (index, layout) memakai hash isi. Resource
+  Dash bersidik jari (cache 1 tahun) tidak diberi ETag sehingga isinya tidak
+  di-hash setiap request. Varian terkompresi diberi akhiran "-gzip" / "-br"
+  karena byte-nya berbeda.
+- GET/HEAD dengan If-None-Match yang cocok dijawab 304 tanpa isi.
+- Isi terkompresi disimpan di cache LRU per kunci isi (ETag, path resource
+  bersidik jari, atau kunci figure cache yang dicatat callback lewat
+  note_figure_keys() untuk _dash-update-component), sehingga bundle JS dan
+  figure yang sering diminta tidak dikompresi ulang.
+"""
+
+import gzip
+import hashlib
+import json
+
+from flask import g, has_request_context, request
+
+from components.cache import LRUCache
+
+try:
+    import brotli
+except ImportError:  # brotli opsional; tanpa modul ini hanya gzip
+    brotli = None
+
+# Prefiks mimetype yang layak dikompresi
+COMPRESSIBLE_TYPES = (
+    "text/",
+    "application/json",
+    "application/javascript",
+    "application/x-javascript",
+    "image/svg+xml",
+)
+
+# Jumlah isi terkompresi (per ETag dan encoding) yang disimpan
+COMPRESSED_CACHE_ENTRIES = 64
+
+UPDATE_COMPONENT_PATH = "/_dash-update-component"
+COMPONENT_SUITES_PATH = "/_dash-component-suites/"
+
+
+def supported_encodings():
+    """Encoding yang didukung, urut preferensi server"""
+    return ["br", "gzip"] if brotli is not None else ["gzip"]
+
+
+def negotiate_encoding(accept_encodings):
+    """
+    Memilih encoding terbaik dari header Accept-Encoding
+
+    Args:
+        accept_encodings (Accept): request.accept_encodings
+
+    Returns:
+        str: "br", "gzip", atau None untuk tanpa kompresi
+    """
+    best, best_quality = None, 0
+    for encoding in supported_encodings():
+        quality = accept_encodings.quality(encoding)
+        if quality > best_quality:
+            best, best_quality = encoding, quality
+    return best
+
+
+def compress(data, encoding, level=6):
+    """
+    Mengompresi isi respons
+
+    Args:
+        data (bytes): Isi respons
+        encoding (str): "br" atau "gzip"
+        level (int): Level kompresi gzip (1-9); brotli memakai quality setara
+
+    Returns:
+        bytes: Isi terkompresi
+    """
+    if encoding == "br":
+        return brotli.compress(data, quality=min(level, 11))
+    # mtime=0 agar hasil deterministik (ETag varian tetap sama)
+    return gzip.compress(data, compresslevel=level, mtime=0)
+
+
+def note_figure_keys(keys):
+    """
+    Mencatat kunci figure cache untuk ETag respons callback yang sedang berjalan
+
+    Dipanggil dari callback; di luar request (misalnya benchmark) tidak berbuat apa-apa.
+
+    Args:
+        keys (list): Bagian kunci yang menentukan isi respons
+    """
+    if has_request_context():
+        g.figure_keys = list(keys)
+
+
+def _is_compressible(response):
+    return response.mimetype.startswith(COMPRESSIBLE_TYPES)
+
+
+def _is_fingerprinted(response):
+    """Resource Dash bersidik jari: isinya tetap untuk path yang sama"""
+    return (
+        request.path.startswith(COMPONENT_SUITES_PATH)
+        and response.cache_control.max_age is not None
+    )
+
+
+def _identity_etag(response):
+    """ETag isi tanpa kompresi untuk GET/HEAD, atau None jika tidak diperlukan"""
+    if request.method not in ("GET", "HEAD"):
+        return None
+    etag, _ = response.get_etag()
+    if etag:
+        return etag
+    if _is_fingerprinted(response):
+        return None
+    return hashlib.sha1(response.get_data()).hexdigest()
+
+
+def _content_key(response):
+    """Kunci isi respons tanpa ETag untuk cache isi terkompresi, atau None"""
+    if request.path == UPDATE_COMPONENT_PATH:
+        keys = g.get("figure_keys")
+        if not keys:
+            return None
+        raw = json.dumps(keys, default=str).encode("utf-8")
+        return hashlib.sha1(raw).hexdigest()
+    if request.method in ("GET", "HEAD") and _is_fingerprinted(response):
+        return request.path
+    return None
+
+
+def _replace_body(response, data):
+    """Mengganti isi respons (file dari send_file ditutup lebih dulu)"""
+    close = getattr(response.response, "close", None)
+    if close is not None:
+        close()
+    response.set_data(data)
+
+
+def _not_modified(response):
+    """Mengubah respons menjadi 304 (header validator dan cache tetap)"""
+    response.status_code = 304
+    _replace_body(response, b"")
+    for header in ("Content-Length", "Content-Encoding", "Content-Type"):
+        response.headers.pop(header, None)
+    return response
+
+
+def register_http_caching(server, compression=True, level=6, min_bytes=500):
+    """
+    Memasang kompresi, ETag, dan penanganan 304 di server Flask
+
+    Daftarkan sebelum hook after_request lain agar hook ini berjalan terakhir
+    (Flask menjalankan after_request dalam urutan terbalik) dan header cache
+    dari hook lain ikut terbawa ke respons 304.
+
+    Args:
+        server (Flask): Server Flask aplikasi Dash
+        compression (bool): Aktifkan kompresi
+        level (int): Level kompresi
+        min_bytes (int): Ukuran minimum isi yang dikompresi
+    """
+    compressed_bodies = LRUCache(maxsize=COMPRESSED_CACHE_ENTRIES)
+
+    @server.after_request
+    def finalize_response(response):
+        if response.status_code != 200 or "Content-Encoding" in response.headers:
+            return response
+        if response.is_streamed and not response.direct_passthrough:
+            return response
+
+        compressible = compression and _is_compressible(response)
+        if response.direct_passthrough:
+            if not compressible:
+                return response
+            # File statis dari send_file: isi dibaca agar dapat dikompresi
+            response.direct_passthrough = False
+
+        etag = _identity_etag(response)
+        encoding = None
+        if compressible:
+            response.vary.add("Accept-Encoding")
+            size = response.content_length
+            if size is None or size >= min_bytes:
+                encoding = negotiate_encoding(request.accept_encodings)
+
+        if etag:
+            variant = f"{etag}-{encoding}" if encoding else etag
+            response.set_etag(variant)
+            if request.method in ("GET", "HEAD") and variant in request.if_none_match:
+                return _not_modified(response)
+
+        if encoding:
+            content_key = etag or _content_key(response)
+            key = (content_key, encoding) if content_key else None
+            body = compressed_bodies.get(key) if key else None
+            if body is None:
+                data = response.get_data()
+                if len(data) < min_bytes:
+                    if etag:
+                        response.set_etag(etag)
+                    return response
+                body = compress(data, encoding, level)
+                if key:
+                    compressed_bodies.set(key, body)
+            _replace_body(response, body)
+            response.headers["Content-Encoding"] = encoding
+
+        return response
+
+    server.extensions["http_caching"] = compressed_bodies
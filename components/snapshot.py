@@ -0,0 +1,308 @@
+"""
+Snapshot kolumnar on-disk untuk dataset layoffs
+
+Frame hasil load_data() disimpan sebagai satu direktori berisi satu file .npy
+per kolom ditambah meta.json. Snapshot divalidasi terhadap ukuran, mtime, dan
+hash isi file sumber sehingga worker berikutnya cukup membaca array biner
+tanpa parsing CSV ulang.
+"""
+
+import hashlib
+import json
+import os
+import shutil
+import uuid
+
+import numpy as np
+import pandas as pd
+
+SNAPSHOT_FORMAT_VERSION = 1
+META_FILE = "meta.json"
+
+
+def snapshot_path_for(source_path):
+    """
+    Menentukan lokasi direktori snapshot untuk file sumber
+
+    Args:
+        source_path (str): Path file CSV sumber
+
+    Returns:
+        str: Path direktori snapshot (di samping file sumber)
+    """
+    directory, filename = os.path.split(os.path.abspath(source_path))
+    return os.path.join(directory, f".{filename}.snapshot")
+
+
+def file_fingerprint(path):
+    """
+    Mengambil ukuran dan mtime file sumber
+
+    Args:
+        path (str): Path file
+
+    Returns:
+        dict: {"size": int, "mtime_ns": int}
+    """
+    stat = os.stat(path)
+    return {"size": stat.st_size, "mtime_ns": stat.st_mtime_ns}
+
+
+def file_hasher(path, block_size=1 << 20):
+    """
+    Menghitung hash SHA-256 isi file secara bertahap
+
+    Args:
+        path (str): Path file
+        block_size (int): Ukuran blok baca dalam byte
+
+    Returns:
+        tuple: (objek hash SHA-256 yang dapat dilanjutkan, jumlah byte yang di-hash)
+    """
+    digest = hashlib.sha256()
+    size = 0
+    with open(path, "rb") as handle:
+        for block in iter(lambda: handle.read(block_size), b""):
+            digest.update(block)
+            size += len(block)
+    return digest, size
+
+
+def file_hash(path, block_size=1 << 20):
+    """
+    Menghitung hash SHA-256 isi file secara bertahap
+
+    Args:
+        path (str): Path file
+        block_size (int): Ukuran blok baca dalam byte
+
+    Returns:
+        str: Hex digest SHA-256
+    """
+    return file_hasher(path, block_size)[0].hexdigest()
+
+
+def _encode_column(series, name, directory, index):
+    """Menulis satu kolom ke file .npy dan mengembalikan metadata kolom"""
+    prefix = f"c{index}"
+    spec = {"name": name, "dtype": str(series.dtype)}
+
+    if isinstance(series.dtype, pd.CategoricalDtype):
+        categories = series.cat.categories
+        spec.update(kind="category", ordered=bool(series.cat.ordered))
+        np.save(os.path.join(directory, f"{prefix}.codes.npy"), series.cat.codes.to_numpy())
+        np.save(
+            os.path.join(directory, f"{prefix}.categories.npy"),
+            np.asarray(categories, dtype=str if categories.dtype == object else None),
+            allow_pickle=False,
+        )
+        spec["categories_dtype"] = str(categories.dtype)
+    elif pd.api.types.is_datetime64_any_dtype(series.dtype):
+        spec["kind"] = "datetime"
+        np.save(
+            os.path.join(directory, f"{prefix}.values.npy"),
+            series.to_numpy(dtype="datetime64[ns]").view("int64"),
+        )
+    elif isinstance(series.dtype, pd.api.extensions.ExtensionDtype):
+        # Tipe nullable pandas (Int8, Int16, ...): nilai + mask
+        spec["kind"] = "masked"
+        values = series.to_numpy(dtype=series.dtype.numpy_dtype, na_value=0)
+        np.save(os.path.join(directory, f"{prefix}.values.npy"), values)
+        np.save(os.path.join(directory, f"{prefix}.mask.npy"), series.isna().to_numpy())
+    elif series.dtype == object:
+        # Kolom string disimpan sebagai kode + tabel nilai unik
+        spec["kind"] = "object"
+        codes, uniques = pd.factorize(series, use_na_sentinel=True)
+        np.save(os.path.join(directory, f"{prefix}.codes.npy"), codes.astype(np.int32))
+        np.save(
+            os.path.join(directory, f"{prefix}.categories.npy"),
+            np.asarray(uniques, dtype=str),
+            allow_pickle=False,
+        )
+    else:
+        spec["kind"] = "numeric"
+        np.save(os.path.join(directory, f"{prefix}.values.npy"), series.to_numpy())
+
+    return spec
+
+
+def _decode_column(spec, directory, index, mmap_mode=None):
+    """Membaca kembali satu kolom dari direktori snapshot"""
+    prefix = f"c{index}"
+    kind = spec["kind"]
+
+    def load(suffix, mode=mmap_mode):
+        return np.load(
+            os.path.join(directory, f"{prefix}.{suffix}.npy"),
+            mmap_mode=mode,
+            allow_pickle=False,
+        )
+
+    if kind == "category":
+        categories = pd.Index(load("categories", None).astype(spec["categories_dtype"]))
+        # Kode berasal dari write_snapshot sendiri; tanpa validasi array kode tidak
+        # disalin sehingga tetap berupa memory-map
+        return pd.Categorical.from_codes(
+            load("codes"), categories=categories, ordered=spec["ordered"], validate=False
+        )
+    if kind == "object":
+        categories = load("categories", None).astype(object)
+        return pd.Categorical.from_codes(load("codes"), categories=categories).astype(
+            object
+        )
+    if kind == "datetime":
+        return load("values").view("datetime64[ns]")
+    if kind == "masked":
+        array_type = pd.api.types.pandas_dtype(spec["dtype"]).construct_array_type()
+        return array_type(load("values"), load("mask"))
+    return load("values")
+
+
+def write_snapshot(df, source_path, schema="default", snapshot_path=None):
+    """
+    Menulis frame yang sudah diproses sebagai snapshot kolumnar
+
+    Args:
+        df (DataFrame): Frame hasil pra-proses
+        source_path (str): Path file CSV sumber
+        schema (str): Penanda skema loader (snapshot beda skema tidak dipakai)
+        snapshot_path (str): Lokasi snapshot, default di samping file sumber
+
+    Returns:
+        str: Path direktori snapshot yang ditulis
+    """
+    snapshot_path = snapshot_path or snapshot_path_for(source_path)
+    parent = os.path.dirname(snapshot_path)
+    tmp_path = os.path.join(parent, f".tmp-{uuid.uuid4().hex}")
+    os.makedirs(tmp_path)
+
+    try:
+        columns = [
+            _encode_column(df[name], name, tmp_path, i)
+            for i, name in enumerate(df.columns)
+        ]
+        meta = {
+            "format_version": SNAPSHOT_FORMAT_VERSION,
+            "schema": schema,
+            "rows": len(df),
+            "source": dict(file_fingerprint(source_path), sha256=file_hash(source_path)),
+            "columns": columns,
+        }
+        with open(os.path.join(tmp_path, META_FILE), "w") as handle:
+            json.dump(meta, handle)
+
+        # Ganti snapshot lama secara atomik (rename direktori)
+        if os.path.isdir(snapshot_path):
+            stale_path = os.path.join(parent, f".stale-{uuid.uuid4().hex}")
+            os.replace(snapshot_path, stale_path)
+            shutil.rmtree(stale_path, ignore_errors=True)
+        os.replace(tmp_path, snapshot_path)
+    finally:
+        shutil.rmtree(tmp_path, ignore_errors=True)
+
+    return snapshot_path
+
+
+def read_snapshot_meta(snapshot_path):
+    """
+    Membaca meta.json snapshot
+
+    Args:
+        snapshot_path (str): Path direktori snapshot
+
+    Returns:
+        dict: Metadata snapshot, atau None jika tidak ada / rusak
+    """
+    try:
+        with open(os.path.join(snapshot_path, META_FILE)) as handle:
+            return json.load(handle)
+    except (OSError, ValueError):
+        return None
+
+
+def _write_meta(snapshot_path, meta):
+    """Menulis ulang meta.json secara atomik (file sementara + rename)"""
+    tmp_path = os.path.join(snapshot_path, f".{META_FILE}.{uuid.uuid4().hex}")
+    try:
+        with open(tmp_path, "w") as handle:
+            json.dump(meta, handle)
+        os.replace(tmp_path, os.path.join(snapshot_path, META_FILE))
+    finally:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+
+
+def is_snapshot_valid(meta, source_path, schema="default", snapshot_path=None):
+    """
+    Memeriksa apakah snapshot masih sesuai dengan file sumber
+
+    Ukuran dan mtime dicek lebih dulu; hash isi hanya dihitung jika mtime
+    berubah (misalnya file di-checkout ulang dengan isi yang sama). Jika hash
+    cocok dan snapshot_path diberikan, mtime baru dicatat di meta.json agar
+    pemeriksaan berikutnya tidak meng-hash ulang file.
+
+    Args:
+        meta (dict): Metadata snapshot
+        source_path (str): Path file CSV sumber
+        schema (str): Penanda skema loader yang diharapkan
+        snapshot_path (str): Direktori snapshot pemilik meta (opsional)
+
+    Returns:
+        bool: True jika snapshot dapat dipakai
+    """
+    if (
+        meta is None
+        or meta.get("format_version") != SNAPSHOT_FORMAT_VERSION
+        or meta.get("schema") != schema
+    ):
+        return False
+
+    source = meta["source"]
+    current = file_fingerprint(source_path)
+    if current["size"] != source["size"]:
+        return False
+    if current["mtime_ns"] == source["mtime_ns"]:
+        return True
+    if file_hash(source_path) != source["sha256"]:
+        return False
+
+    source["mtime_ns"] = current["mtime_ns"]
+    if snapshot_path is not None:
+        try:
+            _write_meta(snapshot_path, meta)
+        except OSError:
+            # Direktori read-only: snapshot tetap valid, hash dihitung ulang nanti
+            pass
+    return True
+
+
+def read_snapshot(source_path, schema="default", snapshot_path=None, mmap_mode=None):
+    """
+    Memuat frame dari snapshot jika masih valid
+
+    Args:
+        source_path (str): Path file CSV sumber
+        schema (str): Penanda skema loader yang diharapkan
+        snapshot_path (str): Lokasi snapshot, default di samping file sumber
+        mmap_mode (str): Mode memory-map numpy (misalnya "r"), None untuk baca penuh
+
+    Returns:
+        DataFrame: Frame dari snapshot, atau None jika snapshot tidak valid
+    """
+    snapshot_path = snapshot_path or snapshot_path_for(source_path)
+    meta = read_snapshot_meta(snapshot_path)
+    if not is_snapshot_valid(meta, source_path, schema, snapshot_path):
+        return None
+
+    try:
+        data = {
+            spec["name"]: _decode_column(spec, snapshot_path, i, mmap_mode)
+            for i, spec in enumerate(meta["columns"])
+        }
+    except (OSError, ValueError):
+        return None
+
+    # copy=False agar kolom numerik tidak digabung (disalin) menjadi satu blok
+    return pd.DataFrame(
+        data, columns=[spec["name"] for spec in meta["columns"]], copy=False
+    )
@@ -0,0 +1,75 @@
+"""
+Pencatat waktu cold start aplikasi per fase
+
+Dipakai oleh app.py untuk memecah waktu startup (imports, load_data,
+get_filter_options, create_layout, register_callbacks) sehingga regresi cold
+start dapat dipantau. Laporan dicetak dengan `python app.py --startup-report`.
+"""
+
+import time
+from contextlib import contextmanager
+
+
+class StartupTimer:
+    """Mencatat durasi fase-fase startup secara berurutan"""
+
+    def __init__(self, start=None):
+        self.start = time.perf_counter() if start is None else start
+        self.phases = []
+        self._last = self.start
+
+    def mark(self, name):
+        """
+        Menutup fase yang berjalan sejak penanda sebelumnya
+
+        Args:
+            name (str): Nama fase
+        """
+        now = time.perf_counter()
+        self.phases.append((name, now - self._last))
+        self._last = now
+
+    @contextmanager
+    def phase(self, name):
+        """
+        Context manager untuk mengukur satu fase
+
+        Args:
+            name (str): Nama fase
+        """
+        self._last = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.mark(name)
+
+    def total(self):
+        """Total waktu sejak start sampai fase terakhir (detik)"""
+        return self._last - self.start
+
+    def as_dict(self):
+        """
+        Mengembalikan durasi fase dalam milidetik
+
+        Returns:
+            dict: Nama fase -> durasi (ms), ditambah "total"
+        """
+        result = {name: round(seconds * 1000, 2) for name, seconds in self.phases}
+        result["total"] = round(self.total() * 1000, 2)
+        return result
+
+    def report(self):
+        """
+        Menyusun laporan teks waktu startup per fase
+
+        Returns:
+            str: Tabel fase, durasi, dan persentase dari total
+        """
+        total = self.total()
+        width = max([len(name) for name, _ in self.phases] + [len("total")])
+        lines = [f"{'phase':<{width}}  {'ms':>9}  {'%':>6}"]
+        for name, seconds in self.phases:
+            share = seconds / total * 100 if total else 0.0
+            lines.append(f"{name:<{width}}  {seconds * 1000:>9.1f}  {share:>5.1f}%")
+        lines.append(f"{'total':<{width}}  {total * 1000:>9.1f}  {100:>5.1f}%")
+        return "\n".join(lines)
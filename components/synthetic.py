@@ -0,0 +1,436 @@
+"""
+Generator data layoffs sintetis untuk load test dan benchmark
+
+Distribusi dipelajari dari CSV asli (LayoffsProfile.fit):
+- atribut perusahaan (lokasi, industri, tahap, dana, negara) diambil bersama dari
+  perusahaan asli sehingga frekuensi dan korelasi industri/negara terjaga,
+- perusahaan dipakai ulang lintas tanggal dengan peluang yang sama seperti data
+  asli dan bobot sebanding jumlah kemunculannya (perusahaan besar lebih sering),
+- total_laid_off dan percentage_laid_off diambil dari kuantil empiris (ekor
+  berat tetap terjaga karena interpolasi dilakukan di ruang log),
+- tanggal mengikuti frekuensi (tahun, bulan) asli, date_added mengikuti jeda
+  empiris terhadap date.
+
+Baris dihasilkan per chunk sehingga memori tetap terbatas berapa pun jumlah
+barisnya. Hasil deterministik untuk seed dan chunk_size yang sama.
+
+Contoh:
+    python -m components.synthetic --rows 1000000 --seed 7 --output big.csv
+    python -m components.synthetic --rows 1000000 --format columnar --output big.cols
+"""
+
+import argparse
+import json
+import os
+
+import numpy as np
+import pandas as pd
+
+from config import DATA_PATH
+
+COLUMNS = [
+    "company",
+    "location",
+    "total_laid_off",
+    "date",
+    "percentage_laid_off",
+    "industry",
+    "source",
+    "stage",
+    "funds_raised",
+    "country",
+    "date_added",
+]
+
+# Atribut yang melekat pada perusahaan (diambil bersama dari satu perusahaan asli)
+COMPANY_ATTRIBUTES = ["location", "industry", "stage", "funds_raised", "country"]
+
+SOURCE_TEMPLATE = "https://example.com/layoffs/{}"
+DEFAULT_CHUNK_SIZE = 100_000
+COLUMNAR_META_FILE = "meta.json"
+
+
+def _parse_dates(values):
+    """Parse tanggal format m/d/Y ke datetime64[D] (NaT jika gagal)"""
+    parsed = pd.to_datetime(values, format="%m/%d/%Y", errors="coerce")
+    return parsed.to_numpy(dtype="datetime64[D]")
+
+
+def _quantiles(values):
+    """Nilai terurut tanpa NaN beserta proporsi NaN"""
+    values = pd.to_numeric(values, errors="coerce").to_numpy(dtype=float)
+    missing = np.isnan(values)
+    return np.sort(values[~missing]), float(missing.mean()) if len(values) else 0.0
+
+
+def _sample_quantiles(rng, sorted_values, size, log=False):
+    """Sampling inverse-CDF dari kuantil empiris dengan interpolasi linear"""
+    if len(sorted_values) == 0:
+        return np.full(size, np.nan)
+    grid = np.linspace(0.0, 1.0, len(sorted_values))
+    values = np.log1p(sorted_values) if log else sorted_values
+    sample = np.interp(rng.random(size), grid, values)
+    return np.expm1(sample) if log else sample
+
+
+class LayoffsProfile:
+    """Distribusi marjinal data layoffs yang dipelajari dari CSV asli"""
+
+    def __init__(self, source):
+        source = source.reset_index(drop=True)
+        dates = _parse_dates(source["date"])
+        added = _parse_dates(source["date_added"])
+
+        # Satu template per perusahaan asli, berbobot jumlah barisnya
+        grouped = source.groupby("company", sort=True)
+        templates = grouped[COMPANY_ATTRIBUTES].first()
+        self.template_names = templates.index.to_numpy(dtype=object)
+        self.template_weights = grouped.size().to_numpy(dtype=float)
+        self.template_weights /= self.template_weights.sum()
+
+        # Kolom atribut disimpan sebagai kode ke kosakata per kolom
+        self.vocabularies = {}
+        self.template_codes = {}
+        for column in COMPANY_ATTRIBUTES:
+            codes, vocabulary = pd.factorize(templates[column], sort=True)
+            self.vocabularies[column] = [str(value) for value in vocabulary]
+            self.template_codes[column] = codes.astype(np.int32)
+
+        # Peluang satu baris memakai perusahaan yang sudah pernah muncul
+        self.reuse_rate = 1.0 - len(templates) / max(len(source), 1)
+
+        self.total_values, self.total_missing = _quantiles(source["total_laid_off"])
+        self.percentage_values, self.percentage_missing = _quantiles(
+            source["percentage_laid_off"]
+        )
+
+        # Musiman: frekuensi (tahun, bulan); hari diambil seragam dalam bulan
+        months = dates[~np.isnat(dates)].astype("datetime64[M]")
+        month_values, month_counts = np.unique(months, return_counts=True)
+        self.months = month_values
+        self.month_weights = month_counts / month_counts.sum()
+
+        lags = (added - dates).astype("timedelta64[D]").astype(float)
+        self.date_added_lags = np.sort(lags[~np.isnan(lags)]).astype(np.int64)
+
+    @classmethod
+    def fit(cls, path=DATA_PATH):
+        """
+        Mempelajari distribusi dari CSV layoffs
+
+        Args:
+            path (str): Path CSV sumber
+
+        Returns:
+            LayoffsProfile: Profil distribusi
+        """
+        return cls(pd.read_csv(path))
+
+
+class SyntheticGenerator:
+    """Menghasilkan chunk baris sintetis berkode dari sebuah LayoffsProfile"""
+
+    def __init__(self, profile, seed=0):
+        self.profile = profile
+        self.rng = np.random.default_rng(seed)
+        self.rows_generated = 0
+        # Per perusahaan sintetis: indeks template dan jumlah kemunculan
+        self.company_templates = np.empty(0, dtype=np.int32)
+        self.company_counts = np.empty(0, dtype=np.int64)
+
+    def _assign_companies(self, size):
+        """
+        Memilih perusahaan lama atau membuat yang baru untuk setiap baris
+
+        Baris yang memakai ulang perusahaan menyalin perusahaan dari satu baris
+        sebelumnya yang dipilih seragam, sehingga peluang sebuah perusahaan muncul
+        lagi sebanding dengan jumlah kemunculannya sejauh ini.
+        """
+        rng = self.rng
+        start = self.rows_generated
+        positions = start + np.arange(size)
+        is_new = (rng.random(size) >= self.profile.reuse_rate) | (positions == 0)
+        targets = (rng.random(size) * positions).astype(np.int64)
+
+        n_existing = len(self.company_counts)
+        n_new = int(is_new.sum())
+        companies = np.empty(size, dtype=np.int64)
+        companies[is_new] = np.arange(n_existing, n_existing + n_new)
+
+        # Baris acuan dari chunk sebelumnya: dipetakan lewat jumlah kemunculan
+        from_history = ~is_new & (targets < start)
+        if from_history.any():
+            cumulative = np.cumsum(self.company_counts)
+            companies[from_history] = np.searchsorted(
+                cumulative, targets[from_history], side="right"
+            )
+
+        # Baris acuan di chunk ini: ikuti rantai acuan sampai baris akar
+        parents = np.arange(size)
+        in_chunk = ~is_new & ~from_history
+        parents[in_chunk] = targets[in_chunk] - start
+        while True:
+            resolved = parents[parents]
+            if np.array_equal(resolved, parents):
+                break
+            parents = resolved
+        companies = companies[parents]
+
+        templates = rng.choice(
+            len(self.profile.template_names),
+            size=n_new,
+            p=self.profile.template_weights,
+        ).astype(np.int32)
+        self.company_templates = np.concatenate([self.company_templates, templates])
+        self.company_counts = np.concatenate(
+            [self.company_counts, np.zeros(n_new, dtype=np.int64)]
+        )
+        self.company_counts += np.bincount(
+            companies, minlength=len(self.company_counts)
+        )
+        return companies
+
+    def _dates(self, size):
+        """Tanggal layoff dan date_added sebagai datetime64[D]"""
+        rng = self.rng
+        profile = self.profile
+        months = profile.months[
+            rng.choice(len(profile.months), size=size, p=profile.month_weights)
+        ]
+        month_start = months.astype("datetime64[D]")
+        month_days = ((months + 1).astype("datetime64[D]") - month_start).astype(
+            np.int64
+        )
+        dates = month_start + (rng.random(size) * month_days).astype(np.int64)
+        lags = profile.date_added_lags[
+            rng.integers(0, len(profile.date_added_lags), size=size)
+        ]
+        return dates, dates + lags
+
+    def _measure(self, values, missing_rate, size, log):
+        """Nilai numerik dari kuantil empiris dengan proporsi NaN asli"""
+        sample = np.round(_sample_quantiles(self.rng, values, size, log=log))
+        sample[self.rng.random(size) < missing_rate] = np.nan
+        return sample
+
+    def chunk(self, size):
+        """
+        Menghasilkan satu chunk baris berkode
+
+        Args:
+            size (int): Jumlah baris
+
+        Returns:
+            dict: Nama kolom -> array (kolom teks sebagai kode/ID)
+        """
+        profile = self.profile
+        companies = self._assign_companies(size)
+        templates = self.company_templates[companies]
+        dates, date_added = self._dates(size)
+
+        chunk = {
+            "company": companies,
+            "total_laid_off": self._measure(
+                profile.total_values, profile.total_missing, size, log=True
+            ),
+            "date": dates,
+            "percentage_laid_off": self._measure(
+                profile.percentage_values, profile.percentage_missing, size, log=False
+            ),
+            "source": np.arange(self.rows_generated, self.rows_generated + size),
+            "date_added": date_added,
+        }
+        for column in COMPANY_ATTRIBUTES:
+            chunk[column] = profile.template_codes[column][templates]
+
+        self.rows_generated += size
+        return chunk
+
+    def chunks(self, rows, chunk_size=DEFAULT_CHUNK_SIZE):
+        """Iterator chunk berkode sampai total rows baris"""
+        remaining = rows
+        while remaining > 0:
+            size = min(chunk_size, remaining)
+            yield self.chunk(size)
+            remaining -= size
+
+    def company_name(self, companies):
+        """Nama perusahaan sintetis: nama template asli diikuti ID perusahaan"""
+        names = self.profile.template_names[self.company_templates[companies]]
+        return pd.Series(names, dtype=object) + "-" + pd.Series(companies).astype(str)
+
+
+def _format_dates(values):
+    """datetime64[D] -> string m/d/Y seperti CSV asli"""
+    dates = pd.DatetimeIndex(values)
+    return (
+        dates.month.astype(str)
+        + "/"
+        + dates.day.astype(str)
+        + "/"
+        + dates.year.astype(str)
+    )
+
+
+def chunk_to_frame(generator, chunk):
+    """
+    Mengubah chunk berkode menjadi DataFrame dengan skema CSV asli
+
+    Args:
+        generator (SyntheticGenerator): Generator asal chunk
+        chunk (dict): Chunk hasil generator.chunk()
+
+    Returns:
+        DataFrame: Kolom sama dengan data/layoffs.csv (teks mentah)
+    """
+    profile = generator.profile
+    frame = {
+        "company": generator.company_name(chunk["company"]),
+        "total_laid_off": chunk["total_laid_off"],
+        "date": _format_dates(chunk["date"]),
+        "percentage_laid_off": chunk["percentage_laid_off"],
+        "source": [SOURCE_TEMPLATE.format(row) for row in chunk["source"]],
+        "date_added": _format_dates(chunk["date_added"]),
+    }
+    for column in COMPANY_ATTRIBUTES:
+        vocabulary = np.array(profile.vocabularies[column] + [""], dtype=object)
+        frame[column] = vocabulary[chunk[column]]
+    return pd.DataFrame(frame, columns=COLUMNS)
+
+
+def write_csv(path, rows, seed=0, profile=None, chunk_size=DEFAULT_CHUNK_SIZE):
+    """
+    Menulis dataset sintetis sebagai CSV secara bertahap per chunk
+
+    Args:
+        path (str): Path file tujuan
+        rows (int): Jumlah baris
+        seed (int): Seed generator
+        profile (LayoffsProfile): Profil distribusi, default dari DATA_PATH
+        chunk_size (int): Jumlah baris per chunk
+
+    Returns:
+        str: Path file yang ditulis
+    """
+    generator = SyntheticGenerator(profile or LayoffsProfile.fit(), seed)
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, "w", newline="") as handle:
+        for i, chunk in enumerate(generator.chunks(rows, chunk_size)):
+            chunk_to_frame(generator, chunk).to_csv(handle, index=False, header=i == 0)
+    os.replace(tmp_path, path)
+    return path
+
+
+def write_columnar(path, rows, seed=0, profile=None, chunk_size=DEFAULT_CHUNK_SIZE):
+    """
+    Menulis dataset sintetis sebagai direktori kolumnar (.npy per kolom)
+
+    Kolom numerik dan tanggal ditulis langsung ke file .npy yang di-memory-map;
+    kolom teks disimpan sebagai kode ke kosakata di meta.json.
+
+    Args:
+        path (str): Direktori tujuan
+        rows (int): Jumlah baris
+        seed (int): Seed generator
+        profile (LayoffsProfile): Profil distribusi, default dari DATA_PATH
+        chunk_size (int): Jumlah baris per chunk
+
+    Returns:
+        str: Path direktori yang ditulis
+    """
+    generator = SyntheticGenerator(profile or LayoffsProfile.fit(), seed)
+    os.makedirs(path, exist_ok=True)
+
+    dtypes = {
+        "company": np.int64,
+        "total_laid_off": np.float64,
+        "date": "datetime64[D]",
+        "percentage_laid_off": np.float64,
+        "source": np.int64,
+        "date_added": "datetime64[D]",
+    }
+    dtypes.update({column: np.int32 for column in COMPANY_ATTRIBUTES})
+    outputs = {
+        column: np.lib.format.open_memmap(
+            os.path.join(path, f"{column}.npy"), mode="w+", dtype=dtype, shape=(rows,)
+        )
+        for column, dtype in dtypes.items()
+    }
+
+    offset = 0
+    for chunk in generator.chunks(rows, chunk_size):
+        size = len(chunk["company"])
+        for column, output in outputs.items():
+            output[offset : offset + size] = chunk[column]
+        offset += size
+    for output in outputs.values():
+        output.flush()
+
+    n_companies = len(generator.company_templates)
+    meta = {
+        "rows": rows,
+        "seed": seed,
+        "source_template": SOURCE_TEMPLATE,
+        "vocabularies": generator.profile.vocabularies,
+        "companies": generator.company_name(np.arange(n_companies)).tolist(),
+    }
+    with open(os.path.join(path, COLUMNAR_META_FILE), "w") as handle:
+        json.dump(meta, handle)
+    return path
+
+
+def read_columnar(path):
+    """
+    Membaca direktori kolumnar hasil write_columnar sebagai DataFrame mentah
+
+    Args:
+        path (str): Direktori kolumnar
+
+    Returns:
+        DataFrame: Kolom sama dengan data/layoffs.csv (teks mentah)
+    """
+    with open(os.path.join(path, COLUMNAR_META_FILE)) as handle:
+        meta = json.load(handle)
+
+    def load(column):
+        return np.load(os.path.join(path, f"{column}.npy"), mmap_mode="r")
+
+    companies = pd.Categorical.from_codes(load("company"), categories=meta["companies"])
+    frame = {
+        "company": companies.astype(object),
+        "total_laid_off": load("total_laid_off"),
+        "date": _format_dates(load("date")),
+        "percentage_laid_off": load("percentage_laid_off"),
+        "source": [meta["source_template"].format(row) for row in load("source")],
+        "date_added": _format_dates(load("date_added")),
+    }
+    for column in COMPANY_ATTRIBUTES:
+        vocabulary = np.array(meta["vocabularies"][column] + [""], dtype=object)
+        frame[column] = vocabulary[load(column)]
+    return pd.DataFrame(frame, columns=COLUMNS)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Generator data layoffs sintetis")
+    parser.add_argument("--rows", type=int, required=True, help="Jumlah baris")
+    parser.add_argument("--output", required=True, help="File CSV atau direktori")
+    parser.add_argument(
+        "--seed", type=int, default=0, help="Seed (hasil deterministik)"
+    )
+    parser.add_argument(
+        "--format", choices=["csv", "columnar"], default="csv", help="Format keluaran"
+    )
+    parser.add_argument("--source", default=DATA_PATH, help="CSV sumber distribusi")
+    parser.add_argument(
+        "--chunk-size", type=int, default=DEFAULT_CHUNK_SIZE, help="Baris per chunk"
+    )
+    args = parser.parse_args(argv)
+
+    profile = LayoffsProfile.fit(args.source)
+    writer = write_columnar if args.format == "columnar" else write_csv
+    path = writer(args.output, args.rows, args.seed, profile, args.chunk_size)
+    print(f"{args.rows} baris ditulis ke {path}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,171 @@
+"""
+Build stylesheet Tailwind yang sudah dikompilasi untuk layout Dash
+
+Menggantikan compiler runtime https://cdn.tailwindcss.com (yang memindai DOM dan
+membuat CSS di browser setiap page load) dengan langkah build sekali jalan memakai
+Tailwind CLI standalone (v3):
+1. CLI memindai app.py dan components/*.py sesuai content di
+   assets/tailwind.config.js; f-string seperti f"bg-[{Colors.BG_CARD}]" di-resolve
+   oleh transform di config tersebut dengan nilai dari components/colors.py,
+2. hasil --minify ditulis sebagai assets/tailwind.<hash>.min.css; nama file berisi
+   hash isi sehingga dapat dilayani dengan header cache immutable,
+3. nama file dicatat di assets/tailwind.manifest.json, yang menjadi acuan
+   compiled_stylesheet() dan --check.
+
+Contoh:
+    python -m components.tailwind
+    python -m components.tailwind --check
+"""
+
+import argparse
+import hashlib
+import json
+import os
+import re
+import subprocess
+
+from config import TAILWIND_BIN
+
+# Compiler runtime yang dipakai jika stylesheet hasil build belum ada
+TAILWIND_CDN = "https://cdn.tailwindcss.com"
+
+ASSETS_DIR = "assets"
+CONFIG_NAME = "tailwind.config.js"
+MANIFEST_NAME = "tailwind.manifest.json"
+STYLESHEET_PATTERN = re.compile(r"^tailwind\.([0-9a-f]{12})\.min\.css$")
+
+# Header cache untuk stylesheet ber-hash (isi baru berarti nama file baru)
+STYLESHEET_CACHE_CONTROL = "public, max-age=31536000, immutable"
+
+
+def stylesheet_name(css):
+    """Nama file stylesheet ber-hash untuk isi CSS"""
+    digest = hashlib.sha256(css.encode("utf-8")).hexdigest()[:12]
+    return f"tailwind.{digest}.min.css"
+
+
+def compile_css(assets_dir=ASSETS_DIR):
+    """
+    Menjalankan Tailwind CLI dan mengembalikan CSS terminifikasi
+
+    Tanpa --input CLI memakai @tailwind base/components/utilities, dan tanpa
+    --output hasilnya ditulis ke stdout. Path content di config relatif terhadap
+    direktori kerja, jadi jalankan dari root proyek.
+
+    Returns:
+        str: Isi CSS
+
+    Raises:
+        RuntimeError: Jika CLI tidak ditemukan atau build gagal
+    """
+    command = [
+        TAILWIND_BIN,
+        "--config",
+        os.path.join(assets_dir, CONFIG_NAME),
+        "--minify",
+    ]
+    try:
+        result = subprocess.run(command, capture_output=True, text=True, check=False)
+    except FileNotFoundError:
+        raise RuntimeError(
+            f"Tailwind CLI '{TAILWIND_BIN}' tidak ditemukan; "
+            "pasang CLI standalone v3 atau atur TAILWIND_BIN"
+        ) from None
+    if result.returncode != 0:
+        raise RuntimeError(result.stderr.strip() or f"kode keluar {result.returncode}")
+    return result.stdout
+
+
+def compiled_stylesheet(assets_dir=ASSETS_DIR):
+    """
+    Nama stylesheet hasil build terakhir menurut manifest
+
+    Returns:
+        str: Nama file, atau None jika belum dibuild atau file di manifest tidak ada
+    """
+    try:
+        with open(os.path.join(assets_dir, MANIFEST_NAME), encoding="utf-8") as handle:
+            name = json.load(handle).get("stylesheet")
+    except (OSError, ValueError, AttributeError):
+        return None
+    if not name or not STYLESHEET_PATTERN.match(name):
+        return None
+    return name if os.path.isfile(os.path.join(assets_dir, name)) else None
+
+
+def build(assets_dir=ASSETS_DIR):
+    """
+    Mengompilasi CSS lewat CLI, menulis stylesheet ber-hash, dan memperbarui manifest
+
+    Stylesheet hasil build sebelumnya dihapus agar Dash hanya memuat satu file.
+
+    Returns:
+        dict: name, bytes
+
+    Raises:
+        RuntimeError: Lihat compile_css()
+    """
+    css = compile_css(assets_dir)
+    name = stylesheet_name(css)
+
+    with open(os.path.join(assets_dir, name), "w", encoding="utf-8") as handle:
+        handle.write(css)
+    with open(os.path.join(assets_dir, MANIFEST_NAME), "w", encoding="utf-8") as handle:
+        json.dump({"stylesheet": name}, handle)
+        handle.write("\n")
+    for stale in os.listdir(assets_dir):
+        if STYLESHEET_PATTERN.match(stale) and stale != name:
+            os.remove(os.path.join(assets_dir, stale))
+
+    return {"name": name, "bytes": len(css.encode("utf-8"))}
+
+
+def register_stylesheet_cache(server):
+    """
+    Menambahkan header cache immutable untuk stylesheet ber-hash
+
+    Args:
+        server (Flask): Server Flask aplikasi Dash
+    """
+
+    @server.after_request
+    def cache_stylesheet(response):
+        from flask import request
+
+        name = request.path.rsplit("/", 1)[-1]
+        if (
+            request.path.startswith("/assets/")
+            and STYLESHEET_PATTERN.match(name)
+            and response.status_code == 200
+        ):
+            response.headers["Cache-Control"] = STYLESHEET_CACHE_CONTROL
+        return response
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Build stylesheet Tailwind")
+    parser.add_argument(
+        "--check",
+        action="store_true",
+        help="Keluar dengan kode 1 jika stylesheet di manifest belum sesuai kode",
+    )
+    args = parser.parse_args(argv)
+
+    try:
+        if args.check:
+            expected = stylesheet_name(compile_css())
+        else:
+            result = build()
+    except RuntimeError as exc:
+        parser.exit(1, f"Build Tailwind gagal: {exc}\n")
+
+    if args.check:
+        current = compiled_stylesheet()
+        print(f"{current or '-'} (seharusnya {expected})")
+        raise SystemExit(0 if current == expected else 1)
+
+    print(f"{ASSETS_DIR}/{result['name']} ({result['bytes']} byte)")
+
+
+if __name__ == "__main__":
+    main()
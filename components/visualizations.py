@@ -1,12 +1,34 @@
-import plotly.express as px
-import plotly.graph_objects as go
-from plotly.subplots import make_subplots
 import pandas as pd
 from components.colors import Colors
+from components import figure_specs
+from components.metrics import timed
+from config import TREEMAP_TOP_INDUSTRIES, TREEMAP_TOP_COMPANIES, FAST_FIGURES
+
+
+# Template teks treemap (dipakai jalur Plotly maupun jalur dict)
+TREEMAP_HOVERTEMPLATE = (
+    "<span style='font-size:13px; font-weight:600;'>%{label}</span><br>"
+    f"<span style='color:{Colors.TEXT_LIGHT_GRAY};'>Total layoffs</span>: "
+    "<span style='font-weight:600;'>%{customdata[0]:,} employees</span><br>"
+    f"<span style='color:{Colors.TEXT_LIGHT_GRAY};'>Proportion</span>: "
+    "<span style='font-weight:600;'>%{percentParent:.1%}</span>"
+    "<extra></extra>"
+)
+TREEMAP_TEXTTEMPLATE = (
+    "<b>%{text}</b><br><span style='font-size:12px'>%{percentParent:.1%}</span>"
+)
+# Baris gabungan treemap: label yang tampil dan id node yang tidak dapat bentrok
+# dengan perusahaan yang benar-benar bernama "Others"
+TREEMAP_OTHERS_LABEL = "Others"
+TREEMAP_OTHERS_NODE = "\x00others"
 
 
 def create_layoffs_trend(
-    df, selected_years=None, selected_industries=None, selected_countries=None
+    df,
+    selected_years=None,
+    selected_industries=None,
+    selected_countries=None,
+    fast=FAST_FIGURES,
 ):
     """
     Membuat visualisasi tren layoffs per bulan
@@ -16,25 +38,47 @@ def create_layoffs_trend(
         selected_years (list): Daftar tahun yang dipilih
         selected_industries (list): Daftar industri yang dipilih
         selected_countries (list): Daftar negara yang dipilih
+        fast (bool): Susun figure sebagai dict biasa tanpa validasi Plotly
 
     Returns:
-        Figure: Objek Figure Plotly
+        Figure: Objek Figure Plotly, atau dict jika fast=True
     """
-    from components.data_processor import apply_filters
+    from components.data_processor import apply_filters, year_month_to_datetime
+    from components.cube import get_cube
+
+    with timed("aggregate"):
+        cube = get_cube(df)
+        if cube is not None:
+            # Rollup langsung dari cube agregat tanpa memindai baris
+            monthly_data = cube.monthly(
+                selected_years, selected_industries, selected_countries
+            )
+        else:
+            # Apply filters
+            filtered_df = apply_filters(
+                df, selected_years, selected_industries, selected_countries
+            )
 
-    # Apply filters
-    filtered_df = apply_filters(
-        df, selected_years, selected_industries, selected_countries
-    )
+            # Group by year and month
+            monthly_data = (
+                filtered_df.groupby("year_month", observed=True)
+                .agg(
+                    total_layoffs=("total_laid_off", "sum"),
+                    companies=("company", "count"),
+                )
+                .reset_index()
+            )
+        monthly_data["year_month_date"] = year_month_to_datetime(
+            monthly_data["year_month"]
+        )
+        monthly_data = monthly_data.sort_values("year_month_date")
 
-    # Group by year and month
-    monthly_data = (
-        filtered_df.groupby("year_month")
-        .agg(total_layoffs=("total_laid_off", "sum"), companies=("company", "count"))
-        .reset_index()
-    )
-    monthly_data["year_month_date"] = pd.to_datetime(monthly_data["year_month"])
-    monthly_data = monthly_data.sort_values("year_month_date")
+    if fast:
+        return figure_specs.trend_figure(monthly_data)
+
+    # Plotly hanya diimpor di jalur objek Figure (tidak ikut saat startup)
+    import plotly.graph_objects as go
+    from plotly.subplots import make_subplots
 
     # Create figure with dual y-axis
     fig = make_subplots(specs=[[{"secondary_y": True}]])
@@ -94,7 +138,11 @@ def create_layoffs_trend(
 
 
 def create_country_map(
-    df, selected_years=None, selected_industries=None, selected_countries=None
+    df,
+    selected_years=None,
+    selected_industries=None,
+    selected_countries=None,
+    fast=FAST_FIGURES,
 ):
     """
     Membuat visualisasi peta distribusi layoffs
@@ -104,27 +152,39 @@ def create_country_map(
         selected_years (list): Daftar tahun yang dipilih
         selected_industries (list): Daftar industri yang dipilih
         selected_countries (list): Daftar negara yang dipilih
+        fast (bool): Susun figure sebagai dict biasa tanpa validasi Plotly
 
     Returns:
-        Figure: Objek Figure Plotly
+        Figure: Objek Figure Plotly, atau dict jika fast=True
     """
     from components.data_processor import apply_filters
+    from components.cube import get_cube
+    from components.geo import country_iso3
+
+    with timed("aggregate"):
+        cube = get_cube(df)
+        if cube is not None:
+            # Rollup langsung dari cube agregat tanpa memindai baris
+            country_data = cube.by_country(
+                selected_years, selected_industries, selected_countries
+            )
+        else:
+            # Apply filters
+            filtered_df = apply_filters(
+                df, selected_years, selected_industries, selected_countries
+            )
 
-    # Apply filters
-    filtered_df = apply_filters(
-        df, selected_years, selected_industries, selected_countries
-    )
-
-    # Group by country
-    country_data = (
-        filtered_df.groupby("country")
-        .agg(
-            percentage_layoffs=("percentage_laid_off", "mean"),
-            total_layoffs=("total_laid_off", "sum"),
-            companies=("company", "nunique"),
-        )
-        .reset_index()
-    )
+            # Group by country
+            country_data = (
+                filtered_df.groupby("country", observed=True)
+                .agg(
+                    percentage_layoffs=("percentage_laid_off", "mean"),
+                    total_layoffs=("total_laid_off", "sum"),
+                    companies=("company", "nunique"),
+                )
+                .reset_index()
+            )
+            country_data.insert(1, "iso3", country_iso3(country_data["country"]))
 
     # Definisikan hovertemplate yang lebih profesional
     hovertemplate = (
@@ -146,11 +206,16 @@ def create_country_map(
         "<extra></extra>"  # buang trace-name default
     )
 
+    if fast:
+        return figure_specs.map_figure(country_data, hovertemplate)
+
+    import plotly.express as px
+
     # Create figure
     fig = px.choropleth(
         country_data,
-        locations="country",
-        locationmode="country names",
+        locations="iso3",
+        locationmode="ISO-3",
         color="percentage_layoffs",
         hover_name="country",
         hover_data={
@@ -209,21 +274,115 @@ def create_country_map(
     return fig
 
 
+def _join_unique(values):
+    """Menggabungkan nilai unik (urutan kemunculan) menjadi satu string"""
+    return ", ".join(pd.unique(values))
+
+
+def build_treemap_data(filtered_df, top_industries=8, top_companies=9):
+    """
+    Menyusun hierarki treemap industri -> perusahaan dalam satu pass tervektorisasi
+
+    Perusahaan diurutkan per industri berdasarkan total layoffs, lalu peringkat di
+    atas top_companies digabung menjadi satu baris "Others" per industri. Kolom
+    node berisi id node treemap: nama perusahaan, atau TREEMAP_OTHERS_NODE untuk
+    baris gabungan, sehingga perusahaan yang benar-benar bernama "Others" tetap
+    menjadi node sendiri.
+
+    Args:
+        filtered_df (DataFrame): DataFrame yang telah difilter
+        top_industries (int): Jumlah industri terbesar yang ditampilkan
+        top_companies (int): Jumlah perusahaan teratas per industri
+
+    Returns:
+        DataFrame: Kolom industry, company, node, total_layoffs, country, color
+    """
+    columns = ["industry", "company", "node", "total_layoffs", "country", "color"]
+
+    # Hitung total layoffs per industri dan ambil industri teratas
+    industry_totals = (
+        filtered_df.groupby("industry", observed=True)
+        .agg(total_layoffs=("total_laid_off", "sum"))
+        .reset_index()
+        .sort_values("total_layoffs", ascending=False)
+    )
+    top_industry_list = industry_totals["industry"].head(top_industries).tolist()
+    if not top_industry_list:
+        return pd.DataFrame(columns=columns)
+    industry_rank = {industry: rank for rank, industry in enumerate(top_industry_list)}
+
+    # Satu groupby (industri, perusahaan) untuk semua industri teratas
+    company_data = (
+        filtered_df[filtered_df["industry"].isin(top_industry_list)]
+        .groupby(["industry", "company"], observed=True)
+        .agg(total_layoffs=("total_laid_off", "sum"), country=("country", "first"))
+        .reset_index()
+    )
+    company_data = company_data[company_data["total_layoffs"] > 0]
+    company_data["industry"] = company_data["industry"].astype(object)
+    company_data["company"] = company_data["company"].astype(object)
+    company_data["industry_rank"] = company_data["industry"].map(industry_rank)
+    company_data = company_data.sort_values(
+        ["industry_rank", "total_layoffs"], ascending=[True, False], kind="stable"
+    )
+
+    company_data["country"] = company_data["country"].astype(object)
+
+    # Peringkat per industri; peringkat di luar top_companies masuk baris gabungan
+    is_other = company_data.groupby("industry_rank").cumcount() >= top_companies
+    treemap_data = company_data[~is_other].assign(node=lambda d: d["company"])
+
+    # Negara untuk baris gabungan adalah gabungan negara unik dari perusahaan sisanya
+    if is_other.any():
+        others = (
+            company_data[is_other]
+            .groupby("industry_rank", sort=False)
+            .agg(
+                industry=("industry", "first"),
+                total_layoffs=("total_layoffs", "sum"),
+                country=("country", _join_unique),
+            )
+            .reset_index()
+        )
+        others["company"] = TREEMAP_OTHERS_LABEL
+        others["node"] = TREEMAP_OTHERS_NODE
+        treemap_data = pd.concat([treemap_data, others], ignore_index=True).sort_values(
+            "industry_rank", kind="stable"
+        )
+
+    treemap_data = treemap_data.reset_index(drop=True)
+    treemap_data["color"] = treemap_data["industry"].map(
+        lambda industry: Colors.get_industry_color(industry)
+    )
+    return treemap_data[columns]
+
+
 def create_treemap(
-    df, selected_years=None, selected_industries=None, selected_countries=None
+    df,
+    selected_years=None,
+    selected_industries=None,
+    selected_countries=None,
+    top_industries=TREEMAP_TOP_INDUSTRIES,
+    top_companies=TREEMAP_TOP_COMPANIES,
+    fast=FAST_FIGURES,
 ):
     """
     Membuat visualisasi treemap untuk melihat distribusi layoffs berdasarkan industri dan perusahaan
-    dengan 8 kategori industri terbesar dan maksimal 10 sub-bagian per industri (9 teratas + Others)
+    dengan top_industries industri terbesar dan top_companies perusahaan teratas per industri,
+    ditambah satu baris "Others (n)" untuk sisanya (default TREEMAP_TOP_INDUSTRIES dan
+    TREEMAP_TOP_COMPANIES)
 
     Args:
         df (DataFrame): DataFrame berisi data layoffs
         selected_years (list): Daftar tahun yang dipilih
         selected_industries (list): Daftar industri yang dipilih
         selected_countries (list): Daftar negara yang dipilih
+        top_industries (int): Jumlah industri terbesar yang ditampilkan
+        top_companies (int): Jumlah perusahaan teratas per industri sebelum "Others (n)"
+        fast (bool): Susun figure sebagai dict biasa tanpa validasi Plotly
 
     Returns:
-        Figure: Objek Figure Plotly
+        Figure: Objek Figure Plotly, atau dict jika fast=True
     """
     from components.data_processor import apply_filters
 
@@ -232,91 +391,40 @@ def create_treemap(
         df, selected_years, selected_industries, selected_countries
     )
 
-    # Hitung total layoffs per industri
-    industry_totals = (
-        filtered_df.groupby("industry")
-        .agg(total_layoffs=("total_laid_off", "sum"))
-        .reset_index()
-        .sort_values("total_layoffs", ascending=False)
-    )
+    return create_treemap_figure(filtered_df, top_industries, top_companies, fast)
 
-    # Ambil top 8 industri
-    top_industries = industry_totals.head(8)
-    top_industry_list = top_industries["industry"].tolist()
 
-    # Siapkan list untuk menyimpan data treemap
-    treemap_rows = []
+def create_treemap_figure(
+    filtered_df,
+    top_industries=TREEMAP_TOP_INDUSTRIES,
+    top_companies=TREEMAP_TOP_COMPANIES,
+    fast=FAST_FIGURES,
+):
+    """
+    Membuat treemap dari DataFrame yang sudah difilter
 
-    # Proses top 8 industri
-    for industry in top_industry_list:
-        # Filter data untuk industri ini
-        industry_data = filtered_df[filtered_df["industry"] == industry]
+    Dipisah dari create_treemap agar dapat dijalankan di process pool tanpa
+    membawa seluruh dataset dan indeksnya.
 
-        # Group by company untuk industri ini
-        company_data = (
-            industry_data.groupby("company")
-            .agg(
-                total_layoffs=("total_laid_off", "sum"),
-                country=("country", "first"),
-            )
-            .reset_index()
-        )
+    Args:
+        filtered_df (DataFrame): DataFrame yang telah difilter
+        top_industries (int): Jumlah industri terbesar yang ditampilkan
+        top_companies (int): Jumlah perusahaan teratas per industri sebelum "Others (n)"
+        fast (bool): Susun figure sebagai dict biasa tanpa validasi Plotly
 
-        # Filter out zero values
-        company_data = company_data[company_data["total_layoffs"] > 0]
-
-        # Sort by total_layoffs descending
-        company_data = company_data.sort_values("total_layoffs", ascending=False)
-
-        # Ambil top 9 perusahaan
-        top_companies = company_data.head(9)
-
-        # Gabungkan sisanya ke dalam "Others"
-        if len(company_data) > 9:
-            others_data = company_data.iloc[9:]
-            others_total = others_data["total_layoffs"].sum()
-            others_countries = ", ".join(others_data["country"].unique())
-
-            # Tambahkan data top 9
-            for _, row in top_companies.iterrows():
-                treemap_rows.append(
-                    {
-                        "industry": industry,
-                        "company": row["company"],
-                        "total_layoffs": row["total_layoffs"],
-                        "country": row["country"],
-                        "color": Colors.get_industry_color(industry),
-                    }
-                )
+    Returns:
+        Figure: Objek Figure Plotly, atau dict jika fast=True
+    """
+    with timed("aggregate"):
+        treemap_data = build_treemap_data(filtered_df, top_industries, top_companies)
 
-            # Tambahkan data Others
-            treemap_rows.append(
-                {
-                    "industry": industry,
-                    "company": "Others",
-                    "total_layoffs": others_total,
-                    "country": others_countries,
-                    "color": Colors.get_industry_color(industry),
-                }
-            )
-        else:
-            # Jika kurang dari 10 perusahaan, tambahkan semua
-            for _, row in company_data.iterrows():
-                treemap_rows.append(
-                    {
-                        "industry": industry,
-                        "company": row["company"],
-                        "total_layoffs": row["total_layoffs"],
-                        "country": row["country"],
-                        "color": Colors.get_industry_color(industry),
-                    }
-                )
+    if fast:
+        return figure_specs.treemap_figure(
+            treemap_data, TREEMAP_HOVERTEMPLATE, TREEMAP_TEXTTEMPLATE
+        )
 
-    # Buat DataFrame dari list dengan kolom yang eksplisit
-    treemap_data = pd.DataFrame(
-        treemap_rows,
-        columns=["industry", "company", "total_layoffs", "country", "color"],
-    )
+    import plotly.express as px
+    import plotly.graph_objects as go
 
     # Handle kasus data kosong
     if treemap_data.empty:
@@ -344,7 +452,7 @@ def create_treemap(
     # Create figure
     fig = px.treemap(
         treemap_data,
-        path=["industry", "company"],
+        path=["industry", "node"],
         values="total_layoffs",
         color="industry",
         color_discrete_map=Colors.INDUSTRY_COLORS,
@@ -365,17 +473,8 @@ def create_treemap(
     )
 
     # Update traces untuk mengontrol font dan posisi teks lebih detail
-    hovertemplate = (
-        "<span style='font-size:13px; font-weight:600;'>%{label}</span><br>"
-        f"<span style='color:{Colors.TEXT_LIGHT_GRAY};'>Total layoffs</span>: "
-        "<span style='font-weight:600;'>%{customdata[0]:,} employees</span><br>"
-        f"<span style='color:{Colors.TEXT_LIGHT_GRAY};'>Proportion</span>: "
-        "<span style='font-weight:600;'>%{percentParent:.1%}</span>"
-        "<extra></extra>"
-    )
-
     fig.update_traces(
-        hovertemplate=hovertemplate,
+        hovertemplate=TREEMAP_HOVERTEMPLATE,
         hoverlabel=dict(
             bgcolor=Colors.BG_HOVER,
             bordercolor=Colors.TEXT_WHITE,
@@ -386,18 +485,22 @@ def create_treemap(
         selector=dict(type="treemap"),
     )
 
+    # Node gabungan memakai id tersendiri; tampilkan labelnya sebagai "Others"
+    for trace in fig.data:
+        trace.labels = [
+            TREEMAP_OTHERS_LABEL if label == TREEMAP_OTHERS_NODE else label
+            for label in trace.labels
+        ]
+
     # Ubah teks untuk menampilkan hanya 3 huruf pertama nama company
-    for i, trace in enumerate(fig.data):
+    company_names = set(treemap_data["company"])
+    for trace in fig.data:
         if hasattr(trace, "labels") and trace.labels is not None:
-            new_text = []
-            for label in trace.labels:
-                if label in treemap_data["company"].values:
-                    # Ambil 3 huruf pertama dari nama company
-                    new_text.append(label[:4].upper())
-                else:
-                    # Tetap tampilkan nama industri utuh
-                    new_text.append(label)
-            trace.text = new_text
+            # Nama company disingkat, nama industri tetap utuh
+            trace.text = [
+                label[:4].upper() if label in company_names else label
+                for label in trace.labels
+            ]
 
     for d in fig.data:
         if hasattr(d, "marker"):
@@ -406,7 +509,7 @@ def create_treemap(
     # Ganti teks default → 3 huruf pertama (sudah dilakukan di loop sebelumnya)
     # Sekarang posisikan di tengah & perbesar font
     fig.update_traces(
-        texttemplate="<b>%{text}</b><br><span style='font-size:12px'>%{percentParent:.1%}</span>",  # bold + persentase
+        texttemplate=TREEMAP_TEXTTEMPLATE,  # bold + persentase
         textposition="middle center",  # pusat kotak
         textfont_size=10,  # sedikit lebih besar
         selector=dict(type="treemap"),
@@ -1,4 +1,6 @@
 # Konfigurasi aplikasi
+import os
+import tempfile
 
 APP_TITLE = "Dashboard Visualisasi Data Layoffs"
 APP_DESCRIPTION = (
@@ -18,5 +20,106 @@ CHART_HEIGHT = 500
 MAP_HEIGHT = 550
 TABLE_PAGE_SIZE = 10
 
+# Treemap: jumlah industri terbesar dan perusahaan teratas per industri (sisanya "Others")
+TREEMAP_TOP_INDUSTRIES = 8
+TREEMAP_TOP_COMPANIES = 9
+
+# Susun figure sebagai dict biasa (tanpa validasi objek Plotly) di jalur callback
+FAST_FIGURES = True
+
+# Setelah render pertama, kirim hanya array data figure lewat dash.Patch
+PARTIAL_UPDATES = True
+
+# Mode filtering di browser: cube agregat dikirim sekali ke dcc.Store dan grafik
+# tren/peta dihitung ulang oleh clientside callback (treemap tetap di server)
+CLIENTSIDE_FILTERING = os.environ.get("CLIENTSIDE_FILTERING", "0") == "1"
+
+# Pembangunan figure paralel per perubahan filter: jumlah worker thread (1 = berurutan)
+# dan mode treemap ("thread" atau "process" untuk menjalankannya di process pool)
+FIGURE_WORKERS = int(os.environ.get("FIGURE_WORKERS", 3))
+FIGURE_EXECUTOR = os.environ.get("FIGURE_EXECUTOR", "thread")
+
+# Direktori topojson dunia untuk peta (python -m components.geo --download). File
+# tidak disertakan di repo; tanpa file di sini browser mengambil topojson dari CDN
+# Plotly dan peta butuh akses ke cdn.plot.ly
+TOPOJSON_DIR = "assets/topojson"
+
+# Typed array base64 untuk array data figure ("1"); butuh plotly.js v2.28+, sedangkan
+# Dash 2.14 membundel 2.25, jadi default "0". Pembulatan ke presisi tampilan dan
+# tanggal "YYYY-MM" selalu diterapkan
+FIGURE_TYPED_ARRAYS = os.environ.get("FIGURE_TYPED_ARRAYS", "0")
+
+# Tailwind CLI standalone v3 untuk build stylesheet (python -m components.tailwind)
+TAILWIND_BIN = os.environ.get("TAILWIND_BIN", "tailwindcss")
+
+# Kompresi respons HTTP (gzip, atau brotli jika modul brotli terpasang) untuk
+# layout, JSON callback, dan asset teks di atas ukuran minimum (byte)
+HTTP_COMPRESSION = os.environ.get("HTTP_COMPRESSION", "1") == "1"
+COMPRESSION_LEVEL = int(os.environ.get("COMPRESSION_LEVEL", 6))
+COMPRESSION_MIN_BYTES = 500
+
+# Metrik per callback (durasi fase, ukuran payload, hit/miss cache) dalam format
+# teks Prometheus di endpoint METRICS_PATH server Flask. Endpoint tidak memakai
+# autentikasi, jadi hanya aktif jika diminta
+METRICS_ENABLED = os.environ.get("METRICS_ENABLED", "0") == "1"
+METRICS_PATH = os.environ.get("METRICS_PATH", "/metrics")
+
+# Profiling callback yang lambat: "sample" (sampler stack statistik) atau "cprofile";
+# kosong mematikan. Profil disimpan jika callback melewati PROFILE_THRESHOLD_MS
+# (0 = tanpa ambang) atau terpilih sampel acak PROFILE_SAMPLE_RATE, ke PROFILE_DIR
+# yang menyimpan PROFILE_KEEP profil terbaru. Setiap callback yang melewati ambang
+# menulis dua file baru; PROFILE_KEEP hanya membatasi jumlah file, bukan frekuensi
+# tulis, jadi naikkan ambang jika callback lambat sering terjadi
+PROFILE_CALLBACKS = os.environ.get("PROFILE_CALLBACKS", "")
+PROFILE_THRESHOLD_MS = float(os.environ.get("PROFILE_THRESHOLD_MS", 2000))
+PROFILE_SAMPLE_RATE = float(os.environ.get("PROFILE_SAMPLE_RATE", 0))
+PROFILE_INTERVAL_MS = float(os.environ.get("PROFILE_INTERVAL_MS", 5))
+PROFILE_KEEP = int(os.environ.get("PROFILE_KEEP", 50))
+PROFILE_DIR = os.environ.get(
+    "PROFILE_DIR", os.path.join(tempfile.gettempdir(), "layoffs-profiles")
+)
+
 # Konfigurasi data
 DATA_PATH = "data/layoffs.csv"
+
+# File mentah untuk ETL (python -m components.etl) dan jumlah proses worker-nya
+# (0 = jumlah core)
+DIRTY_DATA_PATH = "data/layoffs_dirty.csv"
+# Keluaran default ETL; DATA_PATH hanya ditimpa dengan --force karena file mentah
+# bisa lebih lama dari dataset yang dilayani
+ETL_OUTPUT_PATH = "data/layoffs_etl.csv"
+ETL_WORKERS = int(os.environ.get("ETL_WORKERS", 0))
+
+# Snapshot kolumnar (.npy per kolom) di samping file CSV untuk mempercepat cold start
+SNAPSHOT_ENABLED = True
+
+# Petakan kolom snapshot sebagai memory-map read-only (np.load mmap_mode="r") agar
+# worker gunicorn berbagi page cache yang sama alih-alih menyalin data
+SNAPSHOT_MMAP = os.environ.get("SNAPSHOT_MMAP", "0") == "1"
+
+# Baca CSV per chunk berukuran ini (baris) langsung ke skema ringkas, sehingga
+# puncak memori tidak bergantung ukuran file; 0 membaca seluruh file sekaligus
+INGEST_CHUNK_SIZE = int(os.environ.get("INGEST_CHUNK_SIZE", 0))
+
+# Interval (detik) pemeriksaan file CSV; baris yang di-append digabung ke data yang
+# sedang berjalan tanpa restart. 0 (default) mematikan refresh live. Setelah append
+# pertama setiap worker gunicorn memegang frame, indeks, dan cube gabungan sendiri,
+# sehingga berbagi memori hasil preload hilang (memori ~ worker x dataset)
+REFRESH_INTERVAL = float(os.environ.get("REFRESH_INTERVAL", 0))
+
+# Skema ringkas: kolom teks sebagai categorical (kolom periode selalu integer:
+# tahun/bulan integer kecil dan year_month sebagai kode periode)
+COMPACT_SCHEMA = True
+
+# Jumlah maksimum hasil filter (per signature) yang disimpan di cache LRU
+FILTER_CACHE_SIZE = 64
+
+# Cache figure: "memory" (per proses) atau "file" (dipakai bersama semua worker
+# gunicorn; arahkan FIGURE_CACHE_DIR ke /dev/shm untuk shared memory)
+FIGURE_CACHE_BACKEND = os.environ.get("FIGURE_CACHE_BACKEND", "memory")
+FIGURE_CACHE_DIR = os.environ.get(
+    "FIGURE_CACHE_DIR", os.path.join(tempfile.gettempdir(), "layoffs-figure-cache")
+)
+FIGURE_CACHE_MAX_BYTES = int(os.environ.get("FIGURE_CACHE_MAX_BYTES", 64 * 1024 * 1024))
+# Jumlah figure hasil decode yang disimpan per proses di depan backend "file"
+FIGURE_CACHE_DECODED_ENTRIES = int(os.environ.get("FIGURE_CACHE_DECODED_ENTRIES", 64))
@@ -0,0 +1,17 @@
+"""
+Konfigurasi gunicorn untuk deployment multi-worker
+
+Aplikasi dimuat sekali di master (preload_app) sehingga data, indeks filter,
+dan cube agregat dibagi ke semua worker lewat copy-on-write. Jumlah worker dan
+port mengikuti WEB_CONCURRENCY dan PORT dari environment.
+"""
+
+preload_app = True
+
+
+def when_ready(server):
+    """Dipanggil di master setelah aplikasi dimuat dan sebelum worker di-fork"""
+    from app import df
+    from components.preload import prepare_for_fork
+
+    prepare_for_fork(df)
@@ -0,0 +1,6 @@
+import os
+import sys
+
+# Modul aplikasi (config, components) diimpor dari root repository
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
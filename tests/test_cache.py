@@ -0,0 +1,76 @@
+import os
+import threading
+import time
+
+from components import cache as cache_module
+from components.cache import FigureCache, FileFigureBackend, MemoryFigureBackend
+
+
+def _figure(index):
+    return {"data": [{"y": [index] * 50}], "layout": {}}
+
+
+def test_hit_returns_decoded_figure_without_rebuilding():
+    cache = FigureCache(MemoryFigureBackend(1024 * 1024))
+    builds = []
+
+    def build():
+        builds.append(1)
+        return _figure(1)
+
+    first = cache.get_or_build("trend", ((), (), ()), "v1", build)
+    second = cache.get_or_build("trend", ((), (), ()), "v1", build)
+
+    assert second is first
+    assert len(builds) == 1
+    assert cache.stats()["hits"] == 1
+
+
+def test_file_backend_scans_only_past_the_limit(tmp_path, monkeypatch):
+    backend = FileFigureBackend(str(tmp_path), max_bytes=2000)
+    scans = []
+    entries = backend._entries
+    monkeypatch.setattr(backend, "_entries", lambda: scans.append(1) or entries())
+    cache = FigureCache(backend)
+
+    for index in range(20):
+        cache.get_or_build("trend", (index,), "v1", lambda: _figure(index))
+
+    files = [name for name in os.listdir(tmp_path) if name.endswith(".json")]
+    assert backend.size_bytes() <= 2000
+    assert backend.evictions == 20 - len(files)
+    assert 0 < len(scans) < 20
+
+
+def test_file_backend_keeps_decoded_copy_after_external_eviction(tmp_path):
+    cache = FigureCache(FileFigureBackend(str(tmp_path), max_bytes=1024 * 1024))
+    fig = cache.get_or_build("trend", (), "v1", lambda: _figure(1))
+    for name in os.listdir(tmp_path):
+        os.remove(tmp_path / name)
+
+    assert cache.get_or_build("trend", (), "v1", lambda: _figure(2)) is fig
+
+
+def test_concurrent_first_calls_share_one_cache(monkeypatch):
+    monkeypatch.setattr(cache_module, "_figure_cache", None)
+    created = []
+
+    class SlowCache(FigureCache):
+        def __init__(self, backend):
+            time.sleep(0.05)
+            created.append(self)
+            super().__init__(backend)
+
+    monkeypatch.setattr(cache_module, "FigureCache", SlowCache)
+    results = []
+    threads = [
+        threading.Thread(target=lambda: results.append(cache_module.get_figure_cache()))
+        for _ in range(4)
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert len(created) == 1
+    assert all(result is created[0] for result in results)
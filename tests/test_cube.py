@@ -0,0 +1,68 @@
+import pandas as pd
+import pytest
+
+from components.cube import AggregateCube
+from components.data_processor import apply_filters, load_data
+
+FILTER_CASES = {
+    "all": (None, None, None),
+    "years": ([2021, 2023], None, None),
+    "industries": (None, ["Retail", "Finance", "Unknown Industry"], None),
+    "non-us": (None, None, ["Non-US"]),
+    "non-us-and-us": (None, None, ["Non-US", "United States"]),
+    "combined": ([2022], ["Retail"], ["Non-US", "India"]),
+    "empty": ([2020], ["Crypto"], ["India"]),
+}
+
+
+@pytest.fixture(scope="module")
+def df():
+    return load_data(use_snapshot=False)
+
+
+def _filtered(df, case):
+    # Salinan frame tidak terdaftar di registry, jadi memakai jalur mask pandas
+    return apply_filters(df.copy(), *case)
+
+
+@pytest.mark.parametrize("case", FILTER_CASES.values(), ids=FILTER_CASES.keys())
+def test_monthly_rollup_matches_groupby(df, case):
+    expected = (
+        _filtered(df, case)
+        .groupby("year_month", observed=True)
+        .agg(total_layoffs=("total_laid_off", "sum"), companies=("company", "count"))
+        .reset_index()
+    )
+
+    result = AggregateCube(df).monthly(*case)
+
+    pd.testing.assert_frame_equal(result, expected, check_dtype=False)
+
+
+@pytest.mark.parametrize("case", FILTER_CASES.values(), ids=FILTER_CASES.keys())
+def test_country_rollup_matches_groupby(df, case):
+    expected = (
+        _filtered(df, case)
+        .groupby("country", observed=True)
+        .agg(
+            percentage_layoffs=("percentage_laid_off", "mean"),
+            total_layoffs=("total_laid_off", "sum"),
+            companies=("company", "nunique"),
+        )
+        .reset_index()
+    )
+    expected["country"] = expected["country"].astype(object)
+
+    result = AggregateCube(df).by_country(*case).drop(columns="iso3")
+
+    pd.testing.assert_frame_equal(result, expected, check_dtype=False)
+
+
+def test_merged_cube_matches_full_cube(df):
+    head, tail = df.iloc[:1001], df.iloc[1001:]
+    merged = AggregateCube(head).merge(AggregateCube(tail), df)
+    full = AggregateCube(df)
+
+    for case in FILTER_CASES.values():
+        pd.testing.assert_frame_equal(merged.monthly(*case), full.monthly(*case))
+        pd.testing.assert_frame_equal(merged.by_country(*case), full.by_country(*case))
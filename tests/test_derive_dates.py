@@ -0,0 +1,36 @@
+import pandas as pd
+
+from components.data_processor import MONTH_NAMES, derive_dates
+
+MIXED_DATES = [
+    "5/22/2025",
+    "2024-01-15",
+    "1/3/2023",
+    None,
+    "not a date",
+    "5/22/2025",
+    "2023-12-01 08:30:00",
+    "12/31/2022",
+]
+
+
+def test_mixed_formats_match_per_value_parsing():
+    expected = pd.DatetimeIndex(
+        [pd.to_datetime(value, errors="coerce") for value in MIXED_DATES]
+    )
+
+    result = derive_dates(pd.Series(MIXED_DATES, dtype=object))
+
+    assert pd.DatetimeIndex(result["date"]).equals(expected)
+    assert result["year"].tolist() == [
+        pd.NA if pd.isna(date) else date.year for date in expected
+    ]
+    assert result["month"].tolist() == [
+        pd.NA if pd.isna(date) else date.month for date in expected
+    ]
+    assert result["year_month"].tolist() == [
+        pd.NA if pd.isna(date) else date.year * 12 + date.month - 1 for date in expected
+    ]
+    assert [None if pd.isna(name) else name for name in result["month_name"]] == [
+        None if pd.isna(date) else MONTH_NAMES[date.month - 1] for date in expected
+    ]
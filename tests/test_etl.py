@@ -0,0 +1,69 @@
+import pandas as pd
+import pytest
+
+from components import etl
+from config import DIRTY_DATA_PATH
+
+HEADER = (
+    "company,location,total_laid_off,date,percentage_laid_off,industry,source,"
+    "stage,funds_raised,country,date_added\n"
+)
+ROWS = [
+    'Acme,"Tampa, FL",1.200,5/15/2025,10%,Retail,src,Seed,$17,United States,5/16/2025',
+    'Acme,"Tampa, FL",1.200,5/15/2025,10%,Retail,src,Seed,$17,United States,5/16/2025',
+    "Beta,Pune,50,5/14/2025,20%,AI,src,Series A,,India,5/16/2025",
+    "Gamma,Oslo,,5/13/2025,5%,AI,src,Series B,$3,Norway,5/16/2025",
+    "Delta,Lima,10,13/40/2025,5%,AI,src,Series B,$3,Peru,5/16/2025",
+    "Eps,Rome,10,5/12/2025,150%,AI,src,Series B,$3,Italy,5/16/2025",
+]
+
+
+def _source(tmp_path):
+    path = tmp_path / "dirty.csv"
+    path.write_text(HEADER + "\n".join(ROWS) + "\n")
+    return str(path)
+
+
+def test_row_counts_add_up(tmp_path):
+    output = str(tmp_path / "clean.csv")
+
+    summary = etl.run_etl(_source(tmp_path), output, workers=1, snapshot=False)
+
+    assert summary["rows_in"] == len(ROWS)
+    assert summary["rows_out"] == 2
+    assert summary["duplicates"] == 1
+    assert summary["dropped"] == {
+        "invalid_date": 1,
+        "invalid_percentage_laid_off": 1,
+        "missing_required": 1,
+    }
+    assert len(pd.read_csv(output)) == summary["rows_out"]
+
+
+def test_dirty_dataset_rows_are_accounted_for(tmp_path):
+    output = str(tmp_path / "clean.csv")
+
+    summary = etl.run_etl(
+        DIRTY_DATA_PATH, output, workers=1, chunk_bytes=64 * 1024, snapshot=False
+    )
+
+    assert summary["rows_in"] == len(pd.read_csv(DIRTY_DATA_PATH))
+    assert summary["rows_in"] == (
+        summary["rows_out"] + summary["duplicates"] + sum(summary["dropped"].values())
+    )
+    assert len(pd.read_csv(output)) == summary["rows_out"]
+
+
+def test_served_dataset_requires_force(tmp_path, monkeypatch):
+    served = tmp_path / "layoffs.csv"
+    served.write_text("served\n")
+    monkeypatch.setattr(etl, "DATA_PATH", str(served))
+
+    with pytest.raises(ValueError, match="--force"):
+        etl.run_etl(_source(tmp_path), str(served), workers=1, snapshot=False)
+    with pytest.raises(SystemExit):
+        etl.main(["--source", _source(tmp_path), "--output", str(served)])
+    assert served.read_text() == "served\n"
+
+    etl.run_etl(_source(tmp_path), str(served), workers=1, snapshot=False, force=True)
+    assert len(pd.read_csv(served)) == 2
@@ -0,0 +1,57 @@
+from concurrent.futures import Future
+
+import pandas as pd
+
+from components.executor import FigureExecutor
+from components.registry import attach
+
+
+class FakePool:
+    """Process pool palsu: mencatat submit dan mengembalikan hasil tetap"""
+
+    def __init__(self, result):
+        self.result = result
+        self.submitted = []
+
+    def submit(self, func, *args):
+        self.submitted.append(args)
+        future = Future()
+        future.set_result(self.result)
+        return future
+
+
+def _executor(pool):
+    executor = FigureExecutor(1, mode="process", data_path="data.csv")
+    executor._processes = pool
+    return executor
+
+
+def _frame(version):
+    df = pd.DataFrame({"total_laid_off": [1]})
+    attach(df, "version", version)
+    return df
+
+
+def test_process_mode_does_not_filter_in_caller():
+    executor = _executor(FakePool("figure"))
+    calls = []
+
+    result = executor.run_heavy(
+        len, _frame("v1"), ((), (), ()), lambda: calls.append(1) or []
+    )
+
+    assert result == "figure"
+    assert calls == []
+
+
+def test_unavailable_version_falls_back_once_per_version():
+    pool = FakePool(None)
+    executor = _executor(pool)
+    df = _frame("v1")
+
+    for _ in range(3):
+        assert executor.run_heavy(len, df, ((), (), ()), lambda: [1, 2]) == 2
+
+    assert len(pool.submitted) == 1
+    executor.run_heavy(len, _frame("v2"), ((), (), ()), lambda: [1])
+    assert len(pool.submitted) == 2
@@ -0,0 +1,87 @@
+import json
+
+import pytest
+
+from components.colors import Colors
+from components.data_processor import load_data
+from components.figure_specs import figure_to_json
+from components.visualizations import (
+    create_country_map,
+    create_layoffs_trend,
+    create_treemap,
+)
+
+# Jalur Plotly memicu FutureWarning pandas dari validator Plotly
+pytestmark = pytest.mark.filterwarnings("ignore::FutureWarning:_plotly_utils.*")
+
+FILTER_CASES = {
+    "all": (None, None, None),
+    "single-year": ([2023], None, None),
+    "non-us": (None, None, ["Non-US"]),
+    "empty": ([2020], ["Crypto"], ["India"]),
+    "non-us-and-us": (None, None, ["Non-US", "United States"]),
+}
+
+TREEMAP_NODE_KEYS = ["ids", "labels", "parents", "values", "customdata", "text"]
+
+
+@pytest.fixture(scope="module")
+def df():
+    return load_data()
+
+
+def _treemap_nodes(fig):
+    """Memetakan node treemap per id (urutan node tidak memengaruhi render)"""
+    if not fig["data"]:
+        return {}
+    trace = fig["data"][0]
+    nodes = {}
+    for i, node_id in enumerate(trace["ids"]):
+        nodes[node_id] = [trace[key][i] for key in TREEMAP_NODE_KEYS[1:]]
+        # Warna colorway untuk industri tanpa warna tetap bergantung urutan node
+        industry = trace["customdata"][i][1]
+        color = trace["marker"]["colors"][i]
+        nodes[node_id].append(color if industry in Colors.INDUSTRY_COLORS else None)
+    return nodes
+
+
+def _pop_treemap_nodes(fig):
+    for trace in fig["data"]:
+        for key in TREEMAP_NODE_KEYS:
+            trace.pop(key)
+        trace["marker"].pop("colors")
+
+
+def _normalize(obj):
+    """Membulatkan float agar perbandingan tidak sensitif urutan penjumlahan"""
+    if isinstance(obj, dict):
+        return {key: _normalize(value) for key, value in obj.items()}
+    if isinstance(obj, list):
+        return [_normalize(value) for value in obj]
+    if isinstance(obj, float):
+        return round(obj, 6)
+    return obj
+
+
+def _both_paths(builder, df, case):
+    fast = json.loads(figure_to_json(builder(df, *case, fast=True)))
+    slow = json.loads(builder(df, *case, fast=False).to_json())
+    return fast, slow
+
+
+@pytest.mark.parametrize("case", FILTER_CASES.values(), ids=FILTER_CASES.keys())
+@pytest.mark.parametrize("builder", [create_layoffs_trend, create_country_map])
+def test_dict_figure_matches_plotly(df, builder, case):
+    fast, slow = _both_paths(builder, df, case)
+    assert _normalize(fast) == _normalize(slow)
+
+
+@pytest.mark.parametrize("case", FILTER_CASES.values(), ids=FILTER_CASES.keys())
+def test_dict_treemap_matches_plotly(df, case):
+    fast, slow = _both_paths(create_treemap, df, case)
+
+    # px.treemap mengurutkan node secara internal; bandingkan per id
+    assert _normalize(_treemap_nodes(fast)) == _normalize(_treemap_nodes(slow))
+    _pop_treemap_nodes(fast)
+    _pop_treemap_nodes(slow)
+    assert _normalize(fast) == _normalize(slow)
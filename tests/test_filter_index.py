@@ -0,0 +1,42 @@
+import pandas as pd
+import pytest
+
+from components.data_processor import apply_filters, load_data
+from components.filter_index import FilterIndex
+
+FILTER_CASES = {
+    "years": ([2021, 2023], None, None),
+    "industries": (None, ["Retail", "Finance", "Unknown Industry"], None),
+    "countries": (None, None, ["India", "Canada"]),
+    "non-us": (None, None, ["Non-US"]),
+    "non-us-and-us": (None, None, ["Non-US", "United States"]),
+    "non-us-and-other": (None, None, ["Non-US", "India"]),
+    "combined": ([2022], ["Retail"], ["Non-US"]),
+    "empty": ([2020], ["Crypto"], ["India"]),
+}
+
+
+def _positions(index, case):
+    selected = index.select(*case)
+    return None if selected is None else selected.tolist()
+
+
+@pytest.fixture(scope="module")
+def df():
+    return load_data(use_snapshot=False)
+
+
+@pytest.mark.parametrize("case", FILTER_CASES.values(), ids=FILTER_CASES.keys())
+def test_index_matches_boolean_masks(df, case):
+    # Salinan frame tidak terdaftar di registry, jadi memakai jalur mask pandas
+    expected = apply_filters(df.copy(), *case)
+
+    pd.testing.assert_frame_equal(apply_filters(df, *case), expected)
+
+
+@pytest.mark.parametrize("case", FILTER_CASES.values(), ids=FILTER_CASES.keys())
+def test_appended_index_matches_full_index(df, case):
+    head, tail = df.iloc[:1001], df.iloc[1001:]
+    appended = FilterIndex(head).append(FilterIndex(tail))
+
+    assert _positions(appended, case) == _positions(FilterIndex(df), case)
@@ -0,0 +1,41 @@
+import pandas as pd
+import pytest
+
+from components.cube import get_cube
+from components.data_processor import load_data
+from components.filter_index import get_filter_index
+
+FILTER_CASES = [
+    (None, None, None),
+    ([2021, 2023], ["Retail", "Finance"], None),
+    (None, None, ["Non-US"]),
+    ([2022], None, ["India", "United States"]),
+]
+
+
+@pytest.fixture(scope="module")
+def unchunked():
+    return load_data(use_snapshot=False, chunksize=0)
+
+
+@pytest.mark.parametrize("chunksize", [13, 256, 100000])
+def test_chunked_ingest_matches_unchunked(unchunked, chunksize):
+    chunked = load_data(use_snapshot=False, chunksize=chunksize)
+
+    pd.testing.assert_frame_equal(chunked, unchunked)
+
+    for case in FILTER_CASES:
+        chunked_rows = get_filter_index(chunked).select(*case)
+        unchunked_rows = get_filter_index(unchunked).select(*case)
+        if unchunked_rows is None:
+            assert chunked_rows is None
+        else:
+            assert chunked_rows.tolist() == unchunked_rows.tolist()
+
+        chunked_cube, unchunked_cube = get_cube(chunked), get_cube(unchunked)
+        pd.testing.assert_frame_equal(
+            chunked_cube.monthly(*case), unchunked_cube.monthly(*case)
+        )
+        pd.testing.assert_frame_equal(
+            chunked_cube.by_country(*case), unchunked_cube.by_country(*case)
+        )
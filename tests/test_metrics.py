@@ -0,0 +1,25 @@
+from contextlib import nullcontext
+
+from components import metrics
+
+
+def test_disabled_metrics_leave_callback_unwrapped(monkeypatch):
+    monkeypatch.setattr(metrics, "METRICS_ENABLED", False)
+
+    def callback():
+        return "ok"
+
+    assert metrics.instrument_callback("cb")(callback) is callback
+    assert isinstance(metrics.timed("filter"), nullcontext)
+
+
+def test_enabled_metrics_record_phase(monkeypatch):
+    monkeypatch.setattr(metrics, "METRICS_ENABLED", True)
+
+    @metrics.instrument_callback("cb_test")
+    def callback():
+        with metrics.timed("filter"):
+            return "ok"
+
+    assert callback() == "ok"
+    assert "cb_test" in metrics.registry.render()
@@ -0,0 +1,54 @@
+import base64
+import json
+import math
+
+import numpy as np
+import pytest
+
+from components import payload
+from components.payload import encode_figure
+
+
+def _map_figure():
+    return {
+        "data": [
+            {
+                "z": [1.234, math.nan, None, 2.0, 1e6 + 0.004],
+                "customdata": [[1.239, 1500.0, 5.0], [math.nan, 12.5, None]],
+            }
+        ],
+        "layout": {},
+    }
+
+
+def test_rounding_turns_nan_into_null():
+    fig = _map_figure()
+
+    encoded = encode_figure("country-map", fig, typed_arrays=False, record=False)
+
+    trace = encoded["data"][0]
+    assert trace["z"] == [1.23, None, None, 2, 1000000]
+    assert trace["customdata"] == [[1.24, 1500, 5], [None, 12.5, None]]
+    json.dumps(encoded, allow_nan=False)
+    assert math.isnan(fig["data"][0]["z"][1])
+
+
+def test_typed_array_keeps_nan_as_missing():
+    encoded = encode_figure(
+        "country-map", _map_figure(), typed_arrays=True, record=False
+    )
+
+    spec = encoded["data"][0]["z"]
+    values = np.frombuffer(base64.b64decode(spec["bdata"]), dtype="<" + spec["dtype"])
+    assert np.isnan(values[[1, 2]]).all()
+    assert values[[0, 3, 4]].tolist() == pytest.approx([1.23, 2, 1000000])
+
+
+def test_record_is_opt_in(monkeypatch):
+    recorded = []
+    monkeypatch.setattr(payload, "record_payload", lambda *args: recorded.append(args))
+
+    encode_figure("country-map", _map_figure(), typed_arrays=False, record=False)
+    assert recorded == []
+    encode_figure("country-map", _map_figure(), typed_arrays=False, record=True)
+    assert len(recorded) == 1
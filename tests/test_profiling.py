@@ -0,0 +1,70 @@
+import threading
+import time
+
+from components.executor import FigureExecutor
+from components.profiling import CallbackProfiler, StackSampler
+
+
+def _profiler(tmp_path, **kwargs):
+    options = dict(mode="cprofile", directory=str(tmp_path), threshold_ms=1000)
+    options.update(kwargs)
+    return CallbackProfiler(**options)
+
+
+def test_threshold_watch_uses_sampler_even_in_cprofile_mode(tmp_path):
+    profiler = _profiler(tmp_path)
+    captures = []
+    start_capture = profiler._start_capture
+    profiler._start_capture = (
+        lambda sampled: captures.append(start_capture(sampled)) or captures[-1]
+    )
+
+    wrapped = profiler.wrap("cb", lambda store: store, "input")
+    assert wrapped({"years": []}) == {"years": []}
+
+    assert [type(capture) for capture in captures] == [StackSampler]
+    assert profiler.captured == 0
+
+
+def test_sampler_ignores_pool_jobs_of_other_callbacks():
+    executor = FigureExecutor(workers=3)
+    other_started = threading.Event()
+    release = threading.Event()
+
+    def other_request_job():
+        other_started.set()
+        release.wait(5)
+
+    def own_job():
+        time.sleep(0.05)
+
+    other = threading.Thread(
+        target=executor.run, args=({"a": other_request_job, "b": lambda: None},)
+    )
+    other.start()
+    other_started.wait(5)
+
+    sampler = StackSampler(0.002)
+    sampler.start()
+    executor.run({"x": own_job, "y": own_job})
+    sampler.stop()
+    release.set()
+    other.join()
+    executor.shutdown()
+
+    stacks = "\n".join(sampler.samples)
+    assert "own_job" in stacks
+    assert "other_request_job" not in stacks
+
+
+def test_save_failure_does_not_fail_callback(tmp_path, recwarn):
+    profiler = _profiler(tmp_path, threshold_ms=0, sample_rate=1.0, mode="sample")
+
+    def broken_save(*args):
+        raise ValueError("metadata rusak")
+
+    profiler.save = broken_save
+    wrapped = profiler.wrap("cb", lambda store: "ok", "input")
+
+    assert wrapped({}) == "ok"
+    assert any("gagal disimpan" in str(w.message) for w in recwarn)
@@ -0,0 +1,92 @@
+import pytest
+
+from components.data_processor import get_dataset_version, load_data
+from components.refresh import LiveDataset
+from config import DATA_PATH
+
+
+@pytest.fixture
+def source(tmp_path):
+    """CSV berisi 1000 baris pertama dataset, dan dua blok baris untuk di-append"""
+    with open(DATA_PATH, "rb") as handle:
+        lines = handle.readlines()
+    path = tmp_path / "layoffs.csv"
+    path.write_bytes(b"".join(lines[:1001]))
+    return str(path), b"".join(lines[1001:1300]), b"".join(lines[1300:1500])
+
+
+def _append(path, data):
+    with open(path, "ab") as handle:
+        handle.write(data)
+
+
+def test_version_does_not_depend_on_poll_granularity(source):
+    path, first, second = source
+    two_polls = LiveDataset(load_data(path), path, interval=0)
+    one_poll = LiveDataset(load_data(path), path, interval=0)
+
+    _append(path, first)
+    assert two_polls.check()
+    _append(path, second)
+    assert two_polls.check()
+    assert one_poll.check()
+
+    assert two_polls.version == one_poll.version
+    assert len(two_polls.df) == len(one_poll.df) == 1499
+
+
+def test_appended_version_matches_fresh_load(source):
+    path, first, second = source
+    live = LiveDataset(load_data(path), path, interval=0)
+    before = live.version
+
+    _append(path, first + second)
+    assert live.check()
+
+    restarted = load_data(path, use_snapshot=False)
+    assert live.version != before
+    assert live.version == get_dataset_version(restarted)
+    assert len(live.df) == len(restarted)
+
+
+def test_rows_appended_before_start_are_merged_once(source):
+    path, first, _ = source
+    df = load_data(path)
+    _append(path, first)
+
+    live = LiveDataset(df, path, interval=0)
+    assert live.check()
+    assert not live.check()
+
+    restarted = load_data(path, use_snapshot=False)
+    assert len(live.df) == len(restarted)
+    assert live.version == get_dataset_version(restarted)
+
+
+def test_reload_does_not_duplicate_rows_appended_during_load(source, monkeypatch):
+    import components.refresh as refresh
+
+    path, first, second = source
+    live = LiveDataset(load_data(path), path, interval=0)
+
+    # File ditulis ulang, lalu baris baru di-append saat load_data() berjalan
+    with open(path, "rb") as handle:
+        lines = handle.readlines()
+    with open(path, "wb") as handle:
+        handle.write(b"".join(lines[:-1]) + first)
+    real_load = refresh.load_data
+    pending = [second]
+
+    def append_then_load(*args, **kwargs):
+        if pending:
+            _append(path, pending.pop())
+        return real_load(*args, **kwargs)
+
+    monkeypatch.setattr(refresh, "load_data", append_then_load)
+    assert live.check()
+    live.check()
+    assert not pending
+
+    restarted = real_load(path, use_snapshot=False)
+    assert len(live.df) == len(restarted)
+    assert live.version == get_dataset_version(restarted)
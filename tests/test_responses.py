@@ -0,0 +1,98 @@
+import gzip
+
+import pytest
+from flask import Flask
+
+from components import responses
+from components.responses import register_http_caching
+
+BODY = "layoffs " * 200
+
+
+@pytest.fixture
+def client():
+    server = Flask(__name__)
+
+    @server.route("/page", methods=["GET", "POST"])
+    def page():
+        return BODY
+
+    @server.route("/small")
+    def small():
+        return "ok"
+
+    @server.route("/_dash-component-suites/dash/bundle.v1.js")
+    def bundle():
+        response = server.response_class(BODY, mimetype="application/javascript")
+        response.cache_control.max_age = 31536000
+        return response
+
+    register_http_caching(server, level=6, min_bytes=500)
+    return server.test_client()
+
+
+def test_get_revalidates_with_304(client):
+    first = client.get("/page")
+    etag = first.headers["ETag"]
+
+    second = client.get("/page", headers={"If-None-Match": etag})
+
+    assert second.status_code == 304
+    assert second.data == b""
+    assert "Content-Encoding" not in second.headers
+
+
+def test_post_gets_no_etag_or_304(client):
+    etag = client.get("/page").headers["ETag"]
+
+    response = client.post("/page", headers={"If-None-Match": etag})
+
+    assert response.status_code == 200
+    assert "ETag" not in response.headers
+    assert response.get_data(as_text=True) == BODY
+
+
+def test_gzip_variant_has_own_etag(client):
+    plain = client.get("/page")
+    response = client.get("/page", headers={"Accept-Encoding": "gzip"})
+
+    assert response.headers["Content-Encoding"] == "gzip"
+    assert "Accept-Encoding" in response.headers["Vary"]
+    assert gzip.decompress(response.data).decode() == BODY
+    assert response.headers["ETag"] == plain.headers["ETag"][:-1] + '-gzip"'
+
+    revalidated = client.get(
+        "/page",
+        headers={"Accept-Encoding": "gzip", "If-None-Match": response.headers["ETag"]},
+    )
+    assert revalidated.status_code == 304
+
+
+def test_negotiation_falls_back_to_identity(client, monkeypatch):
+    monkeypatch.setattr(responses, "brotli", None)
+
+    assert (
+        "Content-Encoding"
+        not in client.get("/page", headers={"Accept-Encoding": "br, gzip;q=0"}).headers
+    )
+    assert (
+        client.get("/page", headers={"Accept-Encoding": "br, gzip;q=0.5"}).headers[
+            "Content-Encoding"
+        ]
+        == "gzip"
+    )
+    assert (
+        "Content-Encoding"
+        not in client.get("/small", headers={"Accept-Encoding": "gzip"}).headers
+    )
+
+
+def test_fingerprinted_bundle_is_compressed_without_etag(client):
+    response = client.get(
+        "/_dash-component-suites/dash/bundle.v1.js",
+        headers={"Accept-Encoding": "gzip"},
+    )
+
+    assert "ETag" not in response.headers
+    assert response.headers["Content-Encoding"] == "gzip"
+    assert gzip.decompress(response.data).decode() == BODY
@@ -0,0 +1,82 @@
+import json
+import os
+
+import pandas as pd
+import pytest
+
+from components import snapshot
+from components.snapshot import (
+    META_FILE,
+    read_snapshot,
+    read_snapshot_meta,
+    snapshot_path_for,
+    write_snapshot,
+)
+
+
+@pytest.fixture
+def source(tmp_path):
+    path = tmp_path / "layoffs.csv"
+    path.write_text("company,total_laid_off\nAcme,10\nBeta,20\n")
+    write_snapshot(pd.read_csv(path), str(path), schema="s1")
+    return path
+
+
+def _touch(path, delta_ns=10**9):
+    stat = os.stat(path)
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + delta_ns))
+
+
+def _edit_meta(path, **changes):
+    meta_path = os.path.join(snapshot_path_for(str(path)), META_FILE)
+    with open(meta_path) as handle:
+        meta = json.load(handle)
+    meta.update(changes)
+    with open(meta_path, "w") as handle:
+        json.dump(meta, handle)
+
+
+def test_valid_snapshot_is_read(source):
+    assert read_snapshot(str(source), schema="s1")["total_laid_off"].tolist() == [
+        10,
+        20,
+    ]
+
+
+def test_same_size_edit_invalidates_snapshot(source):
+    source.write_text("company,total_laid_off\nAcme,10\nBeta,99\n")
+    _touch(source)
+
+    assert read_snapshot(str(source), schema="s1") is None
+
+
+def test_size_change_invalidates_snapshot(source):
+    with open(source, "a") as handle:
+        handle.write("Gamma,30\n")
+
+    assert read_snapshot(str(source), schema="s1") is None
+
+
+@pytest.mark.parametrize(
+    "changes", [{"schema": "s0"}, {"format_version": 0}], ids=["schema", "format"]
+)
+def test_stale_meta_invalidates_snapshot(source, changes):
+    _edit_meta(source, **changes)
+
+    assert read_snapshot(str(source), schema="s1") is None
+
+
+def test_hash_match_records_new_mtime(source, monkeypatch):
+    _touch(source)
+    hashes = []
+    file_hash = snapshot.file_hash
+    monkeypatch.setattr(
+        snapshot, "file_hash", lambda path: hashes.append(path) or file_hash(path)
+    )
+
+    assert read_snapshot(str(source), schema="s1") is not None
+    assert read_snapshot(str(source), schema="s1") is not None
+
+    meta = read_snapshot_meta(snapshot_path_for(str(source)))
+    assert meta["source"]["mtime_ns"] == os.stat(source).st_mtime_ns
+    assert len(hashes) == 1
@@ -0,0 +1,41 @@
+import json
+import os
+
+from components import tailwind
+
+
+def _fake_cli(tmp_path, css):
+    script = tmp_path / "tailwindcss"
+    script.write_text(f"#!/bin/sh\nprintf '%s' '{css}'\n")
+    script.chmod(0o755)
+    return str(script)
+
+
+def test_manifest_wins_over_stale_stylesheet(tmp_path):
+    (tmp_path / "tailwind.aaaaaaaaaaaa.min.css").write_text("current")
+    (tmp_path / "tailwind.ffffffffffff.min.css").write_text("stale")
+    (tmp_path / tailwind.MANIFEST_NAME).write_text(
+        json.dumps({"stylesheet": "tailwind.aaaaaaaaaaaa.min.css"})
+    )
+
+    assert (
+        tailwind.compiled_stylesheet(str(tmp_path)) == "tailwind.aaaaaaaaaaaa.min.css"
+    )
+
+
+def test_without_manifest_falls_back_to_cdn(tmp_path):
+    (tmp_path / "tailwind.aaaaaaaaaaaa.min.css").write_text("orphan")
+
+    assert tailwind.compiled_stylesheet(str(tmp_path)) is None
+
+
+def test_build_names_cli_output_by_hash(tmp_path, monkeypatch):
+    css = ".flex{display:flex}"
+    monkeypatch.setattr(tailwind, "TAILWIND_BIN", _fake_cli(tmp_path, css))
+    (tmp_path / "tailwind.ffffffffffff.min.css").write_text("stale")
+
+    result = tailwind.build(str(tmp_path))
+
+    assert result["name"] == tailwind.stylesheet_name(css)
+    assert tailwind.compiled_stylesheet(str(tmp_path)) == result["name"]
+    assert not os.path.exists(tmp_path / "tailwind.ffffffffffff.min.css")
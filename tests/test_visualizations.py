@@ -0,0 +1,39 @@
+import pandas as pd
+
+from components.figure_specs import treemap_figure
+from components.visualizations import TREEMAP_OTHERS_NODE, build_treemap_data
+
+
+def _frame(rows):
+    return pd.DataFrame(
+        rows, columns=["industry", "company", "total_laid_off", "country"]
+    )
+
+
+def test_treemap_bucket_keeps_company_named_others_separate():
+    df = _frame(
+        [
+            ("Retail", "Others", 500, "United States"),
+            ("Retail", "Acme", 300, "Canada"),
+            ("Retail", "Beta", 20, "India"),
+            ("Retail", "Gamma", 10, "Canada"),
+        ]
+    )
+
+    treemap = build_treemap_data(df, top_industries=1, top_companies=2)
+
+    assert treemap["company"].tolist() == ["Others", "Acme", "Others"]
+    assert treemap["node"].tolist() == ["Others", "Acme", TREEMAP_OTHERS_NODE]
+    assert treemap["total_layoffs"].tolist() == [500, 300, 30]
+    assert treemap["country"].tolist() == ["United States", "Canada", "India, Canada"]
+
+    ids = treemap_figure(treemap, "", "")["data"][0]["ids"]
+    assert len(set(ids)) == len(ids)
+
+
+def test_treemap_without_overflow_has_no_bucket():
+    df = _frame([("Retail", "Acme", 300, "Canada"), ("Retail", "Beta", 20, "India")])
+
+    treemap = build_treemap_data(df, top_industries=1, top_companies=2)
+
+    assert treemap["company"].tolist() == ["Acme", "Beta"]